@@ -0,0 +1,206 @@
+"""
+answer_stats.py — 문항별 채점 통계 (정답률 / 선택지 분포)
+
+grade_answer 가 채점할 때마다 record() 를 호출합니다. 채점 경로에서는:
+  - 문항 ID 해시로 고른 스트라이프(N_STRIPES 개)의 락만 잡고 카운터를 올림
+    → 전역 락 없음. 다른 문항끼리는 서로 기다리지 않음
+  - 이벤트를 deque 에 append (스레드 안전, 락 없음)
+디스크 쓰기는 데몬 스레드가 FLUSH_INTERVAL 초마다 (또는 FLUSH_BATCH 개가 쌓이면)
+한 번의 트랜잭션으로 SQLite 의 append-only 테이블 answers 에 몰아서 기록합니다.
+
+시작 시 answers 테이블을 집계해 카운터를 복원하므로 재시작해도 통계가 이어집니다.
+prefork 워커는 각자 기록하고 같은 파일(WAL)에 씁니다. 메모리 카운터는
+"시작 시점까지의 누적 + 이 프로세스가 채점한 것" 입니다.
+
+claim(token): 같은 제출(모의고사 핸들)을 한 번만 통계에 넣기 위한 판정.
+submissions 테이블에 INSERT OR IGNORE 로 기록해 여러 워커 사이에서도 한 번만 True.
+디스크에 바로 쓰므로 이벤트 루프 밖(스레드)에서 호출합니다. CLAIM_TTL 보다 오래된 기록은 지움.
+
+저장 위치: 환경변수 ANSWER_STATS_DB (기본 data/stats.sqlite3, Vercel 에서는 /tmp)
+"""
+import atexit
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from records import CHOICE_INDEX, CHOICE_SYMBOLS
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+STATS_DB = Path(os.environ.get(
+    "ANSWER_STATS_DB",
+    "/tmp/answer_stats.sqlite3" if os.environ.get("VERCEL") else DATA_DIR / "stats.sqlite3",
+))
+
+N_STRIPES      = 16
+FLUSH_INTERVAL = 2.0      # 초
+FLUSH_BATCH    = 500      # 이만큼 쌓이면 주기를 기다리지 않고 flush
+CLAIM_TTL      = 2 * 24 * 60 * 60   # 초. 모의고사 핸들 수명(24시간)보다 길게
+
+# 카운터 행: [①, ②, ③, ④, ⑤, 기타 답, 정답 수]
+OTHER   = len(CHOICE_SYMBOLS)
+CORRECT = OTHER + 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    ts          REAL    NOT NULL,
+    question_id TEXT    NOT NULL,
+    choice      INTEGER NOT NULL,   -- 0~4 = ①~⑤, 5 = 기타
+    correct     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS submissions (
+    token TEXT PRIMARY KEY,         -- 통계에 반영한 제출 (모의고사 핸들)
+    ts    REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class AnswerStats:
+    def __init__(self, db_path: Path | None = STATS_DB,
+                 flush_interval: float = FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self._stripes: list[tuple[dict[str, list[int]], threading.Lock]] = [
+            ({}, threading.Lock()) for _ in range(N_STRIPES)
+        ]
+        self._pending: deque[tuple[float, str, int, int]] = deque()
+        self._wake = threading.Event()
+        self._start_lock = threading.Lock()
+        self._pid: int | None = None
+        self._claimed: set[str] = set()         # db_path 가 없을 때만 사용
+        self._claim_lock = threading.Lock()
+        self.recorded = 0
+        self.flushed = 0
+        if db_path is not None:
+            self._load()
+            atexit.register(self.flush)
+
+    # ─── 채점 경로 ───────────────────────────────────────────────────────────
+    def record(self, question_id: str, answer: str, correct: bool):
+        choice = CHOICE_INDEX.get(answer, OTHER)
+        counts, lock = self._stripes[hash(question_id) % N_STRIPES]
+        with lock:
+            row = counts.get(question_id)
+            if row is None:
+                row = counts[question_id] = [0] * (CORRECT + 1)
+            row[choice] += 1
+            row[CORRECT] += correct
+        self.recorded += 1
+
+        if self.db_path is None:
+            return
+        if self._pid != os.getpid():
+            self._start_flusher()
+        self._pending.append((time.time(), question_id, choice, int(correct)))
+        if len(self._pending) >= FLUSH_BATCH:
+            self._wake.set()
+
+    def claim(self, token: str) -> bool:
+        """token 을 처음 보면 True (이후 같은 token 은 False). 디스크 I/O — 스레드에서 호출."""
+        if self.db_path is None:
+            with self._claim_lock:
+                if token in self._claimed:
+                    return False
+                self._claimed.add(token)
+                return True
+        now = time.time()
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM submissions WHERE ts < ?", (now - CLAIM_TTL,))
+                cur = conn.execute("INSERT OR IGNORE INTO submissions VALUES (?, ?)", (token, now))
+            conn.close()
+        except sqlite3.Error as e:
+            # 판정할 수 없으면 중복 집계를 피하려고 기록하지 않음
+            print(f"⚠️  제출 기록 확인 실패: {e}", file=sys.stderr)
+            return False
+        return cur.rowcount == 1
+
+    # ─── 조회 ────────────────────────────────────────────────────────────────
+    def counts(self, question_id: str) -> list[int] | None:
+        """[①~⑤, 기타, 정답 수] 복사본. 기록이 없으면 None."""
+        counts, lock = self._stripes[hash(question_id) % N_STRIPES]
+        with lock:
+            row = counts.get(question_id)
+            return list(row) if row else None
+
+    def snapshot(self) -> dict[str, list[int]]:
+        """전체 문항 카운터 복사본 (스트라이프 하나씩 잠그며 복사)."""
+        out: dict[str, list[int]] = {}
+        for counts, lock in self._stripes:
+            with lock:
+                out.update((qid, list(row)) for qid, row in counts.items())
+        return out
+
+    def summary(self) -> dict:
+        return {
+            "db":       str(self.db_path) if self.db_path else None,
+            "recorded": self.recorded,
+            "flushed":  self.flushed,
+            "pending":  len(self._pending),
+        }
+
+    # ─── 영속화 ──────────────────────────────────────────────────────────────
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=5)
+        conn.execute("PRAGMA journal_mode = WAL")     # 여러 워커가 동시에 append
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _load(self):
+        """기존 기록을 집계해 카운터 복원 (시작 시 1회)."""
+        if not self.db_path.exists():
+            return
+        try:
+            conn = self._connect()
+            rows = conn.execute("SELECT question_id, choice, COUNT(*), SUM(correct) "
+                                "FROM answers GROUP BY question_id, choice").fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"⚠️  채점 통계 로드 실패 ({self.db_path}): {e}", file=sys.stderr)
+            return
+        for qid, choice, n, n_correct in rows:
+            counts, _ = self._stripes[hash(qid) % N_STRIPES]
+            row = counts.setdefault(qid, [0] * (CORRECT + 1))
+            row[min(choice, OTHER)] += n
+            row[CORRECT] += n_correct
+
+    def _start_flusher(self):
+        """이 프로세스의 flush 스레드 시작. fork 된 워커에서는 첫 채점 때 새로 띄움."""
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            if self._pid is not None:
+                self._pending.clear()       # 부모 프로세스가 기록할 몫
+            self._pid = os.getpid()
+            threading.Thread(target=self._flush_loop, name="answer-stats-flush",
+                             daemon=True).start()
+
+    def _flush_loop(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """쌓인 이벤트를 한 트랜잭션으로 기록."""
+        batch = []
+        while self._pending:
+            try:
+                batch.append(self._pending.popleft())
+            except IndexError:          # 다른 스레드가 먼저 비움
+                break
+        if not batch:
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT INTO answers VALUES (?, ?, ?, ?)", batch)
+            conn.close()
+            self.flushed += len(batch)
+        except sqlite3.Error as e:
+            print(f"⚠️  채점 통계 기록 실패 ({len(batch)}건): {e}", file=sys.stderr)
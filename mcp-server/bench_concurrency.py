@@ -0,0 +1,162 @@
+"""
+bench_concurrency.py — 단일 프로세스 동시 접속 처리량 측정
+
+server.py 를 stateless 모드(MCP_STATELESS=1, WORKERS=1)로 별도 프로세스에 띄우고,
+동시 클라이언트 수를 늘려가며 tools/call 처리량과 지연 시간을 측정합니다.
+
+클라이언트는 keep-alive 연결 하나로 요청을 반복하는 최소한의 HTTP/1.1 구현입니다.
+(httpx 는 요청당 클라이언트 측 CPU 가 서버보다 커서 측정 대상이 클라이언트가 되어 버림)
+
+  python bench_concurrency.py                      # 1, 10, 100, 300 클라이언트
+  python bench_concurrency.py --levels 1,50,500 --requests 10
+  QUESTION_STORE=sqlite python bench_concurrency.py
+
+한 프로세스는 CPU 한 코어에서 포화되므로 처리량이 클라이언트 수에 비례해 늘지는 않습니다.
+확인하는 것은 동시 접속이 늘어도 처리량이 무너지지 않는지(이벤트 루프가 막히지 않는지)입니다.
+오류가 있거나, 어느 단계든 처리량이 최고치의 MIN_RATIO 미만이면 exit 1.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SERVER    = Path(__file__).parent / "server.py"
+MIN_RATIO = 0.6    # 각 단계 처리량 ≥ 최고 처리량 × MIN_RATIO
+
+# 클라이언트 한 명이 순서대로 반복하는 tool 호출
+CALLS = [
+    ("get_question",     {"exam_no": 77, "question_no": 5}),
+    ("search_questions", {"keyword": "조선 건국"}),
+    ("grade_answer",     {"question_id": "77-05", "user_answer": "③"}),
+    ("random_quiz",      {"count": 5}),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    env = {**os.environ, "HOST": "127.0.0.1", "PORT": str(port),
+           "MCP_STATELESS": "1", "WORKERS": "1"}
+    proc = subprocess.Popen([sys.executable, str(SERVER)], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            sys.exit(f"❌ 서버 프로세스가 종료되었습니다 (exit {proc.returncode})")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    sys.exit("❌ 서버가 60초 안에 뜨지 않았습니다")
+
+
+async def post_json(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                    port: int, body: dict) -> tuple[int, dict]:
+    data = json.dumps(body).encode()
+    writer.write(
+        f"POST /mcp HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Accept: application/json, text/event-stream\r\n"
+        f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+    )
+    await writer.drain()
+
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {k.lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:] if l)}
+    payload = await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, json.loads(payload)
+
+
+async def client(port: int, n: int, latencies: list[float], errors: list[str]):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for i in range(n):
+            name, args = CALLS[i % len(CALLS)]
+            body = {"jsonrpc": "2.0", "id": i, "method": "tools/call",
+                    "params": {"name": name, "arguments": args}}
+            t0 = time.perf_counter()
+            try:
+                status, payload = await post_json(reader, writer, port, body)
+                if status != 200 or "error" in payload or payload["result"].get("isError"):
+                    errors.append(f"{name}: HTTP {status}")
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                errors.append(f"{name}: {type(e).__name__}")
+                break
+            latencies.append(time.perf_counter() - t0)
+    finally:
+        writer.close()
+
+
+async def run_level(port: int, clients: int, requests: int) -> dict:
+    latencies: list[float] = []
+    errors: list[str] = []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(port, requests, latencies, errors)
+                           for _ in range(clients)))
+    elapsed = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "clients":    clients,
+        "requests":   len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "p50_ms":     statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p99_ms":     latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000 if latencies else 0.0,
+        "errors":     len(errors),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--levels", default="1,10,100,300", help="동시 클라이언트 수 (쉼표 구분)")
+    ap.add_argument("--requests", type=int, default=20, help="클라이언트당 요청 수")
+    args = ap.parse_args()
+    levels = [int(x) for x in args.levels.split(",")]
+
+    port = free_port()
+    proc = start_server(port)
+    store = os.environ.get("QUESTION_STORE", "memory")
+
+    print(f"⚡ 단일 프로세스 동시성 측정 (store={store}, stateless, port={port})")
+    print(f"{'clients':>8} {'requests':>9} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    results = []
+    try:
+        asyncio.run(run_level(port, 1, len(CALLS)))       # 워밍업
+        for level in levels:
+            r = asyncio.run(run_level(port, level, args.requests))
+            results.append(r)
+            print(f"{r['clients']:>8} {r['requests']:>9} {r['throughput']:>9.1f} "
+                  f"{r['p50_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['errors']:>7}")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+    failed = sum(r["errors"] for r in results) > 0
+    peak  = max(r["throughput"] for r in results)
+    worst = min(results, key=lambda r: r["throughput"])
+    ratio = worst["throughput"] / peak
+    if ratio < MIN_RATIO:
+        print(f"❌ {worst['clients']} 클라이언트에서 처리량이 최고치의 {ratio:.0%} 로 떨어졌습니다.")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print(f"✅ {results[0]['clients']} → {results[-1]['clients']} 클라이언트: "
+          f"처리량 최저/최고 = {ratio:.0%}, 오류 0")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+bench_memory.py — 문항 1개당 메모리 (JSON dict vs QuestionRecord)
+
+data/questions_*.json 의 실제 문항을 복제해 N 문항(기본 10,000)짜리 가상 코퍼스를 만들고,
+회차별 JSON 텍스트를 json.loads 한 결과를 그대로 들고 있을 때(이전 방식)와
+QuestionRecord 로 변환한 뒤 dict 를 버렸을 때(현재 MemoryStore)의 할당량을
+tracemalloc 으로 비교합니다.
+
+복제본은 회차 번호와 본문 끝에 표식을 붙여 문자열이 서로 다른 객체가 되도록 하므로
+(실제 다른 회차의 문항처럼) 본문 중복 제거 효과는 측정에 섞이지 않습니다.
+검색/유사도 인덱스는 두 방식에 공통이므로 포함하지 않습니다.
+
+  python bench_memory.py              # 10,000 문항
+  python bench_memory.py --questions 50000
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+
+from store import exam_files, exam_records, load_exam
+
+QUESTIONS_PER_EXAM = 50
+
+
+def synthetic_exams(n_questions: int) -> list[tuple[int, str]]:
+    """실제 문항을 복제한 (회차, JSON 텍스트) 리스트."""
+    base = [q for p in exam_files().values() for q in load_exam(p)["questions"]]
+    if not base:
+        raise SystemExit("❌ data/questions_*.json 이 없습니다.")
+
+    exams = []
+    for e in range((n_questions + QUESTIONS_PER_EXAM - 1) // QUESTIONS_PER_EXAM):
+        exam_no = 1000 + e
+        questions = []
+        for i in range(min(QUESTIONS_PER_EXAM, n_questions - e * QUESTIONS_PER_EXAM)):
+            q = dict(base[(e * QUESTIONS_PER_EXAM + i) % len(base)])
+            q.update(
+                id=f"{exam_no}-{i + 1:02d}", exam_no=exam_no, question_no=i + 1,
+                question_text=f"{q['question_text']} [{exam_no}]",
+                source_material=f"{q['source_material']} [{exam_no}]",
+                choices={k: f"{v} [{exam_no}]" for k, v in q["choices"].items()},
+            )
+            questions.append(q)
+        meta = {"exam_no": exam_no, "level": "심화", "year": 2026,
+                "total_questions": len(questions), "source": "synthetic"}
+        exams.append((exam_no, json.dumps({"meta": meta, "questions": questions},
+                                          ensure_ascii=False)))
+    return exams
+
+
+def measure(build) -> int:
+    """build() 가 반환한 객체가 살아 있는 동안 순수하게 늘어난 할당 바이트."""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+
+def load_dicts(exams):
+    return [json.loads(text) for _, text in exams]
+
+
+def load_records(exams):
+    records = []
+    for exam_no, text in exams:
+        records.extend(exam_records(exam_no, json.loads(text)))   # dict 는 바로 버림
+    return records
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--questions", type=int, default=10_000)
+    args = ap.parse_args()
+
+    exams = synthetic_exams(args.questions)
+    n = args.questions
+
+    before = measure(lambda: load_dicts(exams))
+    after  = measure(lambda: load_records(exams))
+
+    print(f"🧪 {n:,} 문항 ({len(exams)} 회차)")
+    print(f"   JSON dict      : {before / 1024 / 1024:7.1f} MB  ({before / n:,.0f} B/문항)")
+    print(f"   QuestionRecord : {after / 1024 / 1024:7.1f} MB  ({after / n:,.0f} B/문항)")
+    print(f"✅ 문항당 {1 - after / before:.0%} 감소")
+
+
+if __name__ == "__main__":
+    main()
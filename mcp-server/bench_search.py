@@ -0,0 +1,133 @@
+"""
+bench_search.py — 검색 인덱스 규모 벤치마크 (기본 10,000 문항)
+
+data/questions_*.json 의 실제 문항 텍스트를 어절 단위로 잘라 무작위로 다시 이어 붙여
+N 문항짜리 가상 코퍼스를 만들고 (문항마다 텍스트가 다르고 길이는 실제 분포를 따름)
+  - SearchIndex 구성 시간
+  - 검색어별 exact / fuzzy 시간 (여러 번 돌린 중앙값)
+  - 긴 검색어(수백 자)의 search() 전체 시간 (오타 검색 자모 상한 MAX_FUZZY_JAMO 확인)
+을 잽니다. fuzzy 가 가장 느린 검색어와 긴 검색어도 --budget-ms 안이어야 통과 (exit 0).
+
+정확도: 실제 문항(코퍼스 앞부분)에 대해 fuzzy 결과를 전 문서 편집거리 전수 검사와
+비교해, 후보 상한에 걸리지 않았을 때 빠진 문항이 없는지 확인합니다.
+
+  python bench_search.py                      # 10,000 문항, 예산 100ms
+  python bench_search.py --questions 50000 --budget-ms 200
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+
+from search_index import (MAX_FUZZY_JAMO, SearchIndex, max_edits, normalize, substring_distance,
+                          to_jamo)
+from store import exam_files, exam_records, load_exam, searchable_text
+
+DEFAULT_BUDGET_MS = 100.0
+REPEAT = 5
+
+# 오타 검색어 (정답 표기) — 코퍼스에 실제로 있는 용어를 한두 자모 틀리게
+QUERIES = [
+    "훈민정은",         # 훈민정음
+    "흥선데원군",       # 흥선대원군
+    "광개토대왕릉비",   # 광개토대왕릉비 (긴 검색어, k=2)
+    "대한민귝",         # 대한민국
+    "임진왜난",         # 임진왜란
+    "삼국유샤",         # 삼국유사
+    "강화됴",           # 강화도 (짧은 검색어, k=1)
+]
+# 긴 검색어 길이 (글자). 실제 문항 텍스트를 이어 붙인 앞부분 + 상한 바로 아래 길이
+LONG_QUERY_CHARS = (MAX_FUZZY_JAMO // 3, 260, 520)
+
+
+def base_texts() -> list[str]:
+    texts = []
+    for no, path in exam_files().items():
+        texts.extend(searchable_text(q) for q in exam_records(no, load_exam(path)))
+    if not texts:
+        raise SystemExit("❌ data/questions_*.json 이 없습니다.")
+    return texts
+
+
+def synthetic_corpus(base: list[str], n: int, seed: int = 0) -> list[str]:
+    """실제 문항 앞에 어절을 섞어 만든 문항을 붙여 n 개로."""
+    rng = random.Random(seed)
+    words = [w for t in base for w in t.split()]
+    lengths = [len(t.split()) for t in base]
+    corpus = list(base[:n])
+    while len(corpus) < n:
+        corpus.append(" ".join(rng.choices(words, k=rng.choice(lengths))))
+    return corpus
+
+
+def timed(fn, *args) -> tuple[float, object]:
+    """REPEAT 회 실행 시간 중앙값 (ms) 과 마지막 결과."""
+    times, result = [], None
+    for _ in range(REPEAT):
+        t = time.perf_counter()
+        result = fn(*args)
+        times.append((time.perf_counter() - t) * 1000)
+    return statistics.median(times), result
+
+
+def brute_force(texts: list[str], query: str) -> set[int]:
+    """전 문서 편집거리 검사 (정확도 기준)."""
+    qj = to_jamo(normalize(query))
+    k = max_edits(len(qj))
+    return {d for d, t in enumerate(texts)
+            if substring_distance(qj, to_jamo(normalize(t)), k) is not None}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--questions", type=int, default=10_000)
+    ap.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                    help="fuzzy 검색 1회 (중앙값) 상한")
+    args = ap.parse_args()
+
+    base = base_texts()
+    corpus = synthetic_corpus(base, args.questions)
+    jamo_chars = sum(len(to_jamo(normalize(t))) for t in corpus)
+    print(f"📚 코퍼스: {len(corpus):,} 문항 (실제 {len(base)} + 합성), 자모 {jamo_chars:,} 자")
+
+    t = time.perf_counter()
+    index = SearchIndex(corpus)
+    print(f"🏗️  인덱스 구성: {(time.perf_counter() - t) * 1000:8.1f} ms\n")
+
+    print(f"   {'exact':>10}{'fuzzy':>10}{'결과':>7}  검색어")
+    failures = []
+    for q in QUERIES:
+        exact_ms, _ = timed(index.exact, q)
+        fuzzy_ms, hits = timed(index.fuzzy, q)
+        print(f"   {exact_ms:8.2f}ms{fuzzy_ms:8.2f}ms{len(hits):7d}  {q}")
+        if fuzzy_ms > args.budget_ms:
+            failures.append(f"{q}: fuzzy {fuzzy_ms:.1f}ms > 예산 {args.budget_ms:.0f}ms")
+
+    text = normalize("".join(base))
+    for n in LONG_QUERY_CHARS:
+        q = text[:n]
+        exact_ms, _ = timed(index.exact, q)
+        fuzzy_ms, hits = timed(index.fuzzy, q)
+        print(f"   {exact_ms:8.2f}ms{fuzzy_ms:8.2f}ms{len(hits):7d}  긴 검색어 {n}자")
+        if max(exact_ms, fuzzy_ms) > args.budget_ms:
+            failures.append(f"긴 검색어 {n}자: {max(exact_ms, fuzzy_ms):.1f}ms > 예산 {args.budget_ms:.0f}ms")
+
+    small = SearchIndex(base)
+    for q in QUERIES:
+        found = {d for d, _ in small.fuzzy(q)}
+        missing = brute_force(base, q) - found
+        if missing:
+            failures.append(f"{q}: 실제 문항에서 누락 {sorted(missing)}")
+
+    print()
+    if failures:
+        for f in failures:
+            print(f"❌ {f}")
+        sys.exit(1)
+    print(f"✅ 통과 (fuzzy 예산 {args.budget_ms:.0f}ms, 실제 문항 전수 검사와 일치)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+check_startup.py — 콜드 스타트 시간 예산 검사
+
+Vercel 엔트리(api/index.py)를 새 파이썬 프로세스에서 import 해
+  - cold start : 인터프리터 시작 ~ ASGI app 준비까지 (프로세스 바깥에서 잰 벽시계 시간)
+  - 단계별 시간 : startup.py 가 기록한 import / 데이터 로드 / 앱 구성
+  - 첫 요청    : tools/call search_questions 1회 (지연 모드면 저장소 로드가 여기로 옮겨감)
+를 --runs 회 측정하고 중앙값을 봅니다.
+
+예산은 프레임워크 import 를 뺀 시간에 겁니다. 같은 조건의 새 프로세스에서
+`import mcp.server.fastmcp` 만 하는 데 걸린 시간(바닥값)을 매 회 함께 재고,
+지연 모드(LAZY_STARTUP=1)의 cold start − 바닥값 중앙값이 예산을 넘으면 exit 1.
+mcp / pydantic / uvicorn import 는 1 vCPU 에서 1.2~1.5초로 cold start 대부분을 차지하지만
+이 저장소가 줄일 수 없고 머신 부하에 따라 크게 흔들려서, 절대값 예산은 통과 여부가
+코드가 아니라 측정 환경에 좌우됩니다. 바닥값 위의 몫(서버 모듈 import, 도구 등록, 저장소
+준비)은 이 저장소가 책임지는 부분이고, 지연 모드에서 ~60ms 이므로 기본 예산 300ms.
+
+  python check_startup.py                      # 예산 STARTUP_BUDGET_MS (기본 300ms)
+  python check_startup.py --budget-ms 200 --runs 7
+  python check_startup.py --modes lazy         # 지연 모드만
+  python check_startup.py --entry server       # mcp-server/server.py 로 측정
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+ENTRIES = {
+    "api":    ROOT / "api",             # index.py
+    "server": ROOT / "mcp-server",      # server.py
+}
+
+DEFAULT_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 300))
+
+# 바닥값: 프레임워크만 import 하는 자식 프로세스
+FLOOR = "import time, mcp.server.fastmcp; print(time.time())"
+
+# 자식 프로세스: import → app 준비 시각 기록 → 첫 요청 → 결과 JSON 을 stdout 마지막 줄로
+CHILD = r"""
+import json, sys, time
+sys.path.insert(0, {path!r})
+import {module} as entry
+ready = time.time()
+app = entry.app if hasattr(entry, "app") else entry.mcp.streamable_http_app()
+
+from starlette.testclient import TestClient
+body = {{"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+         "params": {{"name": "search_questions", "arguments": {{"keyword": "고려", "limit": 3}}}}}}
+headers = {{"Accept": "application/json, text/event-stream"}}
+with TestClient(app, base_url="http://127.0.0.1:8787") as client:   # DNS rebinding 보호: 로컬 host:port 만 허용
+    t = time.perf_counter()
+    r = client.post("/mcp", json=body, headers=headers)
+    first_ms = (time.perf_counter() - t) * 1000
+ok = r.status_code == 200 and '"isError":false' in r.text.replace(" ", "")
+print(json.dumps({{"ready": ready, "first_ms": first_ms, "ok": ok,
+                  "startup": entry.STARTUP.summary()}}))
+"""
+
+
+def run_once(entry: str, lazy: bool) -> dict:
+    env = dict(os.environ, LAZY_STARTUP="1" if lazy else "0", MCP_STATELESS="1", STARTUP_TIMING="0")
+    code = CHILD.format(path=str(ENTRIES[entry]), module="index" if entry == "api" else "server")
+    start = time.time()
+    proc = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                          capture_output=True, text=True, timeout=120)
+    if proc.returncode != 0:
+        sys.exit(f"❌ 자식 프로세스 실패 (exit {proc.returncode})\n{proc.stderr[-2000:]}")
+    out = json.loads(proc.stdout.strip().splitlines()[-1])
+    out["cold_ms"] = (out.pop("ready") - start) * 1000
+    return out
+
+
+def floor_once() -> float:
+    """프레임워크 import 만의 cold start (ms)."""
+    start = time.time()
+    proc = subprocess.run([sys.executable, "-c", FLOOR], cwd=ROOT,
+                          capture_output=True, text=True, timeout=120, check=True)
+    return (float(proc.stdout.strip().splitlines()[-1]) - start) * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--entry", choices=sorted(ENTRIES), default="api")
+    ap.add_argument("--modes", default="lazy,eager", help="lazy / eager (쉼표 구분)")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                    help="지연 모드 cold start − 프레임워크 import 중앙값 상한 "
+                         "(기본 STARTUP_BUDGET_MS 또는 300)")
+    args = ap.parse_args()
+
+    failures = []
+    for mode in args.modes.split(","):
+        lazy = mode.strip() == "lazy"
+        runs, floors = [], []
+        for _ in range(args.runs):              # 번갈아 재서 두 값이 같은 부하를 받게 함
+            floors.append(floor_once())
+            runs.append(run_once(args.entry, lazy))
+        cold = statistics.median(r["cold_ms"] for r in runs)
+        first = statistics.median(r["first_ms"] for r in runs)
+        own = statistics.median(r["cold_ms"] - f for r, f in zip(runs, floors))
+
+        print(f"\n🧊 {mode} ({args.entry}, {args.runs}회 중앙값)")
+        print(f"   {cold:8.1f} ms  cold start (app 준비)")
+        print(f"   {statistics.median(floors):8.1f} ms    └ 프레임워크 import (바닥값)")
+        print(f"   {own:8.1f} ms    └ 그 위의 몫" + (" (예산 대상)" if lazy else ""))
+        print(f"   {first:8.1f} ms  첫 요청 (search_questions)")
+        print(f"   {cold + first:8.1f} ms  합계")
+        phases = runs[len(runs) // 2]["startup"]["phases"]
+        for name in phases:
+            print(f"     {statistics.median(r['startup']['phases'][name] for r in runs):8.1f} ms  {name}")
+
+        if not all(r["ok"] for r in runs):
+            failures.append(f"{mode}: 첫 요청 응답이 올바르지 않음")
+        if lazy and own > args.budget_ms:
+            failures.append(f"{mode}: cold start − 프레임워크 import {own:.0f}ms "
+                            f"> 예산 {args.budget_ms:.0f}ms")
+
+    print()
+    if failures:
+        for f in failures:
+            print(f"❌ {f}")
+        sys.exit(1)
+    print(f"✅ 통과 (지연 모드 cold start − 프레임워크 import 예산 {args.budget_ms:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
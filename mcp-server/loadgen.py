@@ -0,0 +1,389 @@
+"""
+loadgen.py — /mcp (streamable HTTP) 부하 생성기
+
+ChatGPT 없이 실제와 같은 MCP 트래픽을 재현합니다. 가상 사용자(세션)마다:
+  1. initialize → notifications/initialized  (mcp-session-id 발급 시 이후 요청에 첨부)
+  2. 시나리오의 tool 호출을 순서대로 실행 (앞 호출의 결과로 다음 인자를 만듦)
+  3. 세션이 있으면 DELETE 로 종료
+JSON / SSE(text/event-stream) 응답을 모두 처리하므로 stateful·stateless 서버 어느 쪽이든 됩니다.
+
+시나리오 (--mix 로 가중치 지정):
+  quiz    random_quiz(count=N) → 출제된 문항마다 grade_answer   (N = --quiz-size)
+  search  search_questions(키워드) → 첫 결과 get_question → similar_questions
+  browse  list_exams → get_question(임의 번호)
+
+요청 속도: 모든 요청(initialize·알림·DELETE 포함)이 전역 페이서에서 1/rate 간격의 슬롯을 받아
+그 시각에 전송됩니다 (open-loop). 지연 시간은 "예정 시각 → 응답 완료"로 재므로 서버가 밀려
+슬롯이 쌓이면 대기 시간도 지연에 포함됩니다 (coordinated omission 보정). service 열은 실제 전송 →
+응답 완료 시간입니다.
+
+사용:
+  python loadgen.py --start server --rate 100 --duration 30
+  python loadgen.py --start api --stateless --mix quiz=3,search=1 --quiz-size 10
+  python loadgen.py --url http://127.0.0.1:8787/mcp --rate 300 --users 200
+  python loadgen.py --start server --workers 4 --rate 800 --json result.json
+
+클라이언트도 CPU 를 씁니다. "lag" 가 커지면 서버가 아니라 부하 생성기가 포화된 것입니다.
+오류율이 --max-error-rate 를 넘으면 exit 1.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).parent.parent
+ENTRYPOINTS = {
+    "server": ROOT / "mcp-server" / "server.py",
+    "api":    ROOT / "api" / "index.py",
+}
+
+PROTOCOL_VERSION = "2025-06-18"
+HEADERS = {
+    "content-type": "application/json",
+    "accept": "application/json, text/event-stream",
+}
+
+SEARCH_KEYWORDS = ["조선 건국", "훈민정음", "임진왜란", "고려", "ㅎㅁㅈㅇ", "대동법",
+                   "신간회", "광개토", "청해진", "갑신정변", "훈민정엄"]
+ANSWERS = ["①", "②", "③", "④", "⑤"]
+
+
+class ToolError(Exception):
+    """JSON-RPC error 또는 tool 결과의 isError / {"error": ...}."""
+
+
+# ─── 페이서 ───────────────────────────────────────────────────────────────────
+class Pacer:
+    """전역 요청 슬롯. rate=0 이면 제한 없음 (슬롯 = 현재 시각)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_at = time.perf_counter()
+
+    async def slot(self) -> float:
+        """다음 전송 예정 시각까지 기다렸다가 그 시각을 반환."""
+        now = time.perf_counter()
+        if not self.interval:
+            return now
+        at = self.next_at
+        self.next_at += self.interval
+        if at > now:
+            await asyncio.sleep(at - now)
+        return at
+
+
+# ─── 측정 ─────────────────────────────────────────────────────────────────────
+class Stats:
+    def __init__(self):
+        self.latency: dict[str, list[float]] = defaultdict(list)   # 예정 시각 → 완료
+        self.service: dict[str, list[float]] = defaultdict(list)   # 전송 → 완료
+        self.lag: list[float] = []                                 # 예정 시각 → 실제 전송
+        self.errors: dict[str, Counter] = defaultdict(Counter)
+        self.sessions = 0
+
+    def record(self, op: str, scheduled: float, sent: float, done: float, error: str | None):
+        self.latency[op].append(done - scheduled)
+        self.service[op].append(done - sent)
+        self.lag.append(sent - scheduled)
+        if error:
+            self.errors[op][error] += 1
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    i = min(int(len(sorted_values) * p / 100), len(sorted_values) - 1)
+    return sorted_values[i]
+
+
+# ─── MCP 세션 ─────────────────────────────────────────────────────────────────
+class McpSession:
+    """streamable HTTP 위의 MCP 클라이언트 세션 1개. 모든 요청은 페이서 슬롯에 맞춰 전송."""
+
+    def __init__(self, http: httpx.AsyncClient, url: str, pacer: Pacer, stats: Stats):
+        self.http = http
+        self.url = url
+        self.pacer = pacer
+        self.stats = stats
+        self.headers = dict(HEADERS)
+        self.ids = itertools.count(1)
+
+    async def _send(self, op: str, method: str, body: dict | None = None) -> httpx.Response:
+        scheduled = await self.pacer.slot()
+        sent = time.perf_counter()
+        error = None
+        try:
+            res = await self.http.request(method, self.url, json=body, headers=self.headers)
+            if res.status_code >= 400:
+                error = f"HTTP {res.status_code}"
+            elif "mcp-session-id" in res.headers:
+                self.headers["mcp-session-id"] = res.headers["mcp-session-id"]
+            return res
+        except httpx.HTTPError as e:
+            error = type(e).__name__
+            raise
+        finally:
+            self.stats.record(op, scheduled, sent, time.perf_counter(), error)
+
+    async def _rpc(self, op: str, method: str, params: dict) -> dict:
+        req_id = next(self.ids)
+        res = await self._send(op, "POST", {"jsonrpc": "2.0", "id": req_id,
+                                            "method": method, "params": params})
+        if res.status_code >= 400:
+            raise ToolError(f"HTTP {res.status_code}")
+        msg = parse_response(res, req_id)
+        if "error" in msg:
+            self.stats.errors[op]["jsonrpc error"] += 1
+            raise ToolError(msg["error"].get("message", "jsonrpc error"))
+        return msg["result"]
+
+    async def open(self):
+        await self._rpc("initialize", "initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "loadgen", "version": "1.0"},
+        })
+        self.headers["mcp-protocol-version"] = PROTOCOL_VERSION
+        await self._send("notifications/initialized", "POST",
+                         {"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    async def call(self, tool: str, arguments: dict) -> dict:
+        result = await self._rpc(f"tools/call {tool}", "tools/call",
+                                 {"name": tool, "arguments": arguments})
+        payload = result.get("structuredContent")
+        if payload is None:
+            payload = json.loads(result["content"][0]["text"])
+        if result.get("isError") or (isinstance(payload, dict) and "error" in payload):
+            self.stats.errors[f"tools/call {tool}"]["tool error"] += 1
+            raise ToolError(str(payload))
+        return payload
+
+    async def close(self):
+        if "mcp-session-id" in self.headers:
+            await self._send("DELETE session", "DELETE")
+
+
+def parse_response(res: httpx.Response, req_id: int) -> dict:
+    """JSON 응답 또는 SSE 스트림에서 req_id 에 대한 JSON-RPC 메시지를 꺼냄."""
+    if res.headers.get("content-type", "").startswith("text/event-stream"):
+        for line in res.text.splitlines():
+            if line.startswith("data:"):
+                msg = json.loads(line[5:])
+                if msg.get("id") == req_id:
+                    return msg
+        raise ToolError("SSE 응답에 결과 메시지 없음")
+    return res.json()
+
+
+# ─── 시나리오 ─────────────────────────────────────────────────────────────────
+async def quiz_session(s: McpSession, rng: random.Random, quiz_size: int):
+    quiz = await s.call("random_quiz", {"count": quiz_size})
+    for q in quiz["questions"]:
+        await s.call("grade_answer", {"question_id": q["id"], "user_answer": rng.choice(ANSWERS)})
+
+
+async def search_session(s: McpSession, rng: random.Random, quiz_size: int):
+    found = await s.call("search_questions", {"keyword": rng.choice(SEARCH_KEYWORDS)})
+    if found["results"]:
+        first = found["results"][0]
+        await s.call("get_question", {"exam_no": first["exam_no"], "question_no": first["question_no"]})
+        await s.call("similar_questions", {"question_id": first["id"], "k": 3})
+
+
+async def browse_session(s: McpSession, rng: random.Random, quiz_size: int):
+    exams = await s.call("list_exams", {})
+    exam = rng.choice(exams["exams"])
+    await s.call("get_question", {"exam_no": exam["exam_no"],
+                                  "question_no": rng.randint(1, exam["total_questions"])})
+
+
+SCENARIOS = {
+    "quiz":   quiz_session,
+    "search": search_session,
+    "browse": browse_session,
+}
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise SystemExit(f"알 수 없는 시나리오: {name} (가능: {', '.join(SCENARIOS)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+# ─── 실행 ─────────────────────────────────────────────────────────────────────
+async def virtual_user(http: httpx.AsyncClient, url: str, pacer: Pacer, stats: Stats,
+                       mix: dict[str, float], quiz_size: int, deadline: float, seed: int):
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        scenario = SCENARIOS[rng.choices(names, weights)[0]]
+        session = McpSession(http, url, pacer, stats)
+        try:
+            await session.open()
+            await scenario(session, rng, quiz_size)
+            stats.sessions += 1
+        except (ToolError, httpx.HTTPError, KeyError, ValueError):
+            pass    # 오류는 Stats 에 기록됨. 새 세션으로 계속
+        finally:
+            try:
+                await session.close()
+            except httpx.HTTPError:
+                pass
+
+
+async def run(url: str, rate: float, users: int, duration: float,
+              mix: dict[str, float], quiz_size: int, seed: int) -> tuple[Stats, float]:
+    stats = Stats()
+    pacer = Pacer(rate)
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as http:
+        t0 = time.perf_counter()
+        deadline = t0 + duration
+        await asyncio.gather(*(virtual_user(http, url, pacer, stats, mix, quiz_size, deadline, seed + i)
+                               for i in range(users)))
+        elapsed = time.perf_counter() - t0
+    return stats, elapsed
+
+
+def report(stats: Stats, elapsed: float) -> dict:
+    ops = {}
+    for op in sorted(stats.latency):
+        lat = sorted(stats.latency[op])
+        svc = sorted(stats.service[op])
+        errors = sum(stats.errors[op].values())
+        ops[op] = {
+            "count":      len(lat),
+            "errors":     errors,
+            "error_rate": errors / len(lat),
+            "p50_ms":     percentile(lat, 50) * 1000,
+            "p90_ms":     percentile(lat, 90) * 1000,
+            "p99_ms":     percentile(lat, 99) * 1000,
+            "max_ms":     lat[-1] * 1000,
+            "service_p50_ms": percentile(svc, 50) * 1000,
+            "error_kinds": dict(stats.errors[op]),
+        }
+
+    all_lat = sorted(x for v in stats.latency.values() for x in v)
+    total = len(all_lat)
+    total_errors = sum(sum(c.values()) for c in stats.errors.values())
+    lag = sorted(stats.lag)
+    return {
+        "elapsed_s":  elapsed,
+        "requests":   total,
+        "throughput": total / elapsed if elapsed else 0.0,
+        "sessions":   stats.sessions,
+        "errors":     total_errors,
+        "error_rate": total_errors / total if total else 0.0,
+        "p50_ms":     percentile(all_lat, 50) * 1000,
+        "p90_ms":     percentile(all_lat, 90) * 1000,
+        "p99_ms":     percentile(all_lat, 99) * 1000,
+        "lag_p99_ms": percentile(lag, 99) * 1000,
+        "ops":        ops,
+    }
+
+
+def print_report(r: dict):
+    print(f"\n{'operation':<30} {'count':>7} {'err%':>6} {'p50':>8} {'p90':>8} "
+          f"{'p99':>8} {'max':>8} {'svc p50':>8}  (ms)")
+    for op, o in r["ops"].items():
+        print(f"{op:<30} {o['count']:>7} {o['error_rate'] * 100:>6.1f} {o['p50_ms']:>8.1f} "
+              f"{o['p90_ms']:>8.1f} {o['p99_ms']:>8.1f} {o['max_ms']:>8.1f} {o['service_p50_ms']:>8.1f}")
+        for kind, n in o["error_kinds"].items():
+            print(f"    ⚠️  {kind}: {n}")
+    print(f"\n📈 {r['requests']} 요청 / {r['elapsed_s']:.1f}초 = {r['throughput']:.1f} req/s "
+          f"(완료 세션 {r['sessions']})")
+    print(f"⏱️  전체 p50={r['p50_ms']:.1f}ms p90={r['p90_ms']:.1f}ms p99={r['p99_ms']:.1f}ms "
+          f"| 전송 지연(lag) p99={r['lag_p99_ms']:.1f}ms")
+    print(f"❗ 오류 {r['errors']}건 ({r['error_rate'] * 100:.2f}%)")
+
+
+# ─── 로컬 서버 ────────────────────────────────────────────────────────────────
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_local(target: str, stateless: bool, workers: int) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    env = {**os.environ, "HOST": "127.0.0.1", "PORT": str(port), "WORKERS": str(workers)}
+    if stateless:
+        env["MCP_STATELESS"] = "1"
+    proc = subprocess.Popen([sys.executable, str(ENTRYPOINTS[target])], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            sys.exit(f"❌ {target} 프로세스가 종료되었습니다 (exit {proc.returncode})")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc, f"http://127.0.0.1:{port}/mcp"
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    sys.exit(f"❌ {target} 가 60초 안에 뜨지 않았습니다")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = ap.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="이미 떠 있는 서버의 /mcp 주소")
+    target.add_argument("--start", choices=list(ENTRYPOINTS), help="로컬에서 띄울 엔트리포인트")
+    ap.add_argument("--stateless", action="store_true", help="--start 시 MCP_STATELESS=1")
+    ap.add_argument("--workers", type=int, default=1, help="--start server 시 WORKERS")
+    ap.add_argument("--rate", type=float, default=50, help="목표 요청 수/초 (0 = 제한 없음)")
+    ap.add_argument("--users", type=int, default=50, help="동시 가상 사용자 수")
+    ap.add_argument("--duration", type=float, default=20, help="측정 시간 (초)")
+    ap.add_argument("--mix", default="quiz=3,search=1,browse=1", help="시나리오=가중치, 쉼표 구분")
+    ap.add_argument("--quiz-size", type=int, default=5, help="quiz 시나리오의 문항 수 (grade_answer 횟수)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", help="결과를 JSON 파일로 저장")
+    ap.add_argument("--max-error-rate", type=float, default=0.01, help="허용 오류율 (기본 1%%)")
+    args = ap.parse_args()
+    mix = parse_mix(args.mix)
+
+    proc = None
+    url = args.url
+    if args.start:
+        proc, url = start_local(args.start, args.stateless, args.workers)
+
+    print(f"🔥 부하 생성 → {url}")
+    print(f"   rate={args.rate or '∞'} req/s, users={args.users}, duration={args.duration}s, "
+          f"mix={mix}, quiz-size={args.quiz_size}")
+    try:
+        stats, elapsed = asyncio.run(run(url, args.rate, args.users, args.duration,
+                                         mix, args.quiz_size, args.seed))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    result = report(stats, elapsed)
+    print_report(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"💾 저장: {args.json}")
+
+    if result["requests"] == 0 or result["error_rate"] > args.max_error_rate:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+mock_exam.py — 실전 모의고사 (start_exam / submit_exam)
+
+시험 핸들: 서버에 상태를 두지 않도록 "회차.시작시각.nonce.서명" 문자열을 발급합니다.
+  서명 = HMAC-SHA256(EXAM_SECRET, "회차.시작시각.nonce") 앞 16바이트 (base64url)
+  → 어느 워커 / 어느 서버리스 인스턴스로 제출이 와도 같은 비밀키면 검증됩니다.
+  EXAM_SECRET 이 없으면 프로세스 시작 시 임의로 만듭니다 (로컬 개발용. prefork 워커는
+  공유하지만 재시작하면 이전 핸들이 무효). 서버리스 인스턴스는 저마다 다른 키를 만들게
+  되므로 Vercel(VERCEL 환경변수)에서는 만들지 않고, 핸들 발급·검증만 ValueError 로
+  거부합니다 (start_exam / submit_exam 만 오류, 다른 도구는 정상).
+
+채점: 회차마다 한 번 ExamKey 를 만들어 캐시합니다.
+  answers  : 문항 순서대로 정답 번호(0~4) bytes
+  scores   : 배점 tuple
+  era_idx  : 시대 번호 bytes (eras[era_idx[i]] = 시대 이름)
+submit_exam 은 이 벡터들만 한 번 훑어 채점하므로 문항별 저장소 조회가 없습니다.
+"""
+import base64
+import hashlib
+import hmac
+import os
+import sys
+import time
+
+from records import CHOICE_INDEX, CHOICE_SYMBOLS, QuestionRecord
+
+MISSING_SECRET = ("모의고사를 사용할 수 없습니다: 서버에 EXAM_SECRET 환경변수가 설정되지 않았습니다. "
+                  "(서버리스 인스턴스마다 다른 키로 서명하면 제출이 실패하므로 배포 설정에 지정해야 합니다)")
+
+EXAM_SECRET: bytes | None = os.environ.get("EXAM_SECRET", "").encode() or None
+if EXAM_SECRET is None:
+    if os.environ.get("VERCEL"):
+        print(f"⚠️  {MISSING_SECRET}", file=sys.stderr)
+    else:
+        EXAM_SECRET = os.urandom(32)
+
+TIME_LIMIT_SEC = 80 * 60           # 심화 시험 시간 80분
+HANDLE_TTL_SEC = 24 * 60 * 60      # 이보다 오래된 핸들은 거부
+
+# (급수, 최소 점수) — 100점 만점 기준, 높은 급수부터
+GRADE_CUTOFFS = (("1급", 80), ("2급", 70), ("3급", 60))
+
+NO_ANSWER = 255
+UNTAGGED  = "미분류"
+
+# 시대별 결과 표시 순서 (parser/tag_keywords.py 의 ERA_TERMS 순서)
+ERA_ORDER = ("선사", "고조선·여러 나라", "삼국", "남북국", "고려", "조선 전기", "조선 후기",
+             "근대", "일제 강점기", "현대", UNTAGGED)
+
+# "③" 외에 "3", "3번" 도 받음
+_ANSWER_ALIASES = {**CHOICE_INDEX, **{str(i + 1): i for i in range(len(CHOICE_SYMBOLS))}}
+
+
+class ExamKey:
+    """회차 하나의 채점 벡터."""
+    __slots__ = ("exam_no", "question_ids", "question_nos", "answers", "scores",
+                 "eras", "era_idx", "total_score")
+
+    def __init__(self, exam_no: int, questions: list[QuestionRecord]):
+        questions = sorted(questions, key=lambda q: q.question_no)
+        order = {e: i for i, e in enumerate(ERA_ORDER)}
+        eras = sorted({q.era or UNTAGGED for q in questions}, key=lambda e: order.get(e, len(order)))
+        era_pos = {e: i for i, e in enumerate(eras)}
+
+        self.exam_no      = exam_no
+        self.question_ids = tuple(q.id for q in questions)
+        self.question_nos = tuple(q.question_no for q in questions)
+        self.answers      = bytes(CHOICE_INDEX.get(q.correct_answer or "", NO_ANSWER)
+                                  for q in questions)
+        self.scores       = tuple(q.score or 0 for q in questions)
+        self.eras         = tuple(eras)
+        self.era_idx      = bytes(era_pos[q.era or UNTAGGED] for q in questions)
+        self.total_score  = sum(self.scores)
+
+
+# ─── 핸들 ─────────────────────────────────────────────────────────────────────
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _sign(payload: str) -> str:
+    if EXAM_SECRET is None:
+        raise ValueError(MISSING_SECRET)
+    return _b64(hmac.new(EXAM_SECRET, payload.encode(), hashlib.sha256).digest()[:16])
+
+
+def issue_handle(exam_no: int, now: float | None = None) -> tuple[str, int]:
+    """→ (핸들, 시작 시각 epoch 초). EXAM_SECRET 이 없으면 ValueError."""
+    started = int(time.time() if now is None else now)
+    payload = f"{exam_no}.{started}.{_b64(os.urandom(6))}"
+    return f"{payload}.{_sign(payload)}", started
+
+
+def verify_handle(handle: str, now: float | None = None) -> tuple[int, int]:
+    """핸들 → (회차, 시작 시각). 위조·만료·형식 오류는 ValueError."""
+    payload, _, sig = handle.strip().rpartition(".")
+    parts = payload.split(".")
+    if len(parts) != 3 or not parts[0].isdigit() or not parts[1].isdigit():
+        raise ValueError("시험 핸들 형식이 올바르지 않습니다. start_exam 이 준 handle 을 그대로 넘기세요.")
+    if not hmac.compare_digest(sig, _sign(payload)):
+        raise ValueError("시험 핸들 서명이 맞지 않습니다 (서버 재시작 등). start_exam 으로 다시 시작하세요.")
+    exam_no, started = int(parts[0]), int(parts[1])
+    now = time.time() if now is None else now
+    if now - started > HANDLE_TTL_SEC:
+        raise ValueError("시험 핸들이 만료되었습니다 (24시간). start_exam 으로 다시 시작하세요.")
+    return exam_no, started
+
+
+# ─── 채점 ─────────────────────────────────────────────────────────────────────
+def parse_answers(answers: list[str], n: int) -> bytes:
+    """제출 답안 (문항 순서, 빈 문자열 = 무응답) → 번호 bytes. 모자란 칸은 무응답."""
+    out = bytearray([NO_ANSWER]) * n
+    for i, a in enumerate(answers[:n]):
+        out[i] = _ANSWER_ALIASES.get((a or "").strip().rstrip("번"), NO_ANSWER)
+    return bytes(out)
+
+
+def pass_grade(score: int) -> str | None:
+    for grade, cutoff in GRADE_CUTOFFS:
+        if score >= cutoff:
+            return grade
+    return None
+
+
+def grade(key: ExamKey, submitted: bytes) -> dict:
+    """답안 벡터를 한 번 훑어 총점 / 시대별 결과 / 오답 목록."""
+    n_eras = len(key.eras)
+    era_total   = [0] * n_eras
+    era_correct = [0] * n_eras
+    era_score   = [0] * n_eras
+    era_max     = [0] * n_eras
+    score = correct = answered = 0
+    wrong: list[int] = []
+
+    for i, (mine, right, pts, e) in enumerate(zip(submitted, key.answers, key.scores, key.era_idx)):
+        era_total[e] += 1
+        era_max[e] += pts
+        if mine != NO_ANSWER:
+            answered += 1
+        if mine == right and right != NO_ANSWER:
+            correct += 1
+            score += pts
+            era_correct[e] += 1
+            era_score[e] += pts
+        else:
+            wrong.append(key.question_nos[i])
+
+    return {
+        "score":       score,
+        "max_score":   key.total_score,
+        "correct":     correct,
+        "answered":    answered,
+        "total":       len(key.answers),
+        "grade":       pass_grade(score),
+        "by_era": {
+            key.eras[e]: {
+                "questions": era_total[e],
+                "correct":   era_correct[e],
+                "score":     era_score[e],
+                "max_score": era_max[e],
+            }
+            for e in range(n_eras)
+        },
+        "wrong_question_nos": wrong,
+    }
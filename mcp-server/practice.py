@@ -0,0 +1,384 @@
+"""
+practice.py — 학습자별 간격 반복(spaced repetition) 스케줄러
+
+학습자 ID(클라이언트가 정하는 임의 문자열)마다 푼 문항의 상태를 기억하고
+다음에 풀 문항을 고릅니다.
+
+문항 상태 (Card): Leitner 상자
+  - 맞히면 상자 +1, 다음 복습까지 INTERVALS[상자] 만큼 간격을 늘림
+  - 틀리면 상자 0, lapses +1, RELEARN 후 다시 출제
+  - 약점 가중치 = lapses × (MAX_BOX - 상자)   (여러 번 틀렸고 아직 낮은 상자일수록 큼)
+
+다음 N 문항 고르기 (M = 학습자가 본 문항 수):
+  1. due 힙: (복습 시각, 버전, 문항) 최소 힙. 상태가 바뀌면 새 항목을 넣고
+     옛 항목은 버전이 달라 꺼낼 때 버림 (lazy invalidation) → 꺼내기 O(log M)
+  2. 약점 표본: 학습자별 Fenwick 트리(가중치 누적합)에서 가중치 비례 추출 → O(log M)
+  3. 그래도 모자라면 새 문항 (server 가 저장소에서 안 본 문항을 뽑아 채움)
+말뭉치나 학습 기록 전체를 다시 훑지 않으므로 N 문항에 O(N log M) 입니다.
+
+영속화: 문항 상태는 SQLite (cards 테이블) 에 기록하고, 프로세스는 학습자 상태를 메모리에
+캐시합니다. 상태를 바꿀 때마다 learners.version 을 올리고, 다른 프로세스(prefork 워커,
+uvicorn --workers)는 다음 조회 때 버전이 다르면 그 학습자만 다시 읽습니다.
+record / next_batch 는 낙관적 동시성으로 씁니다: 메모리에서 고친 뒤 짧은 쓰기 트랜잭션에서
+"버전이 읽을 때 그대로면 +1" (compare-and-set) 과 바뀐 문항만 기록하고, 다른 프로세스가 먼저
+고쳤으면 다시 읽어 재시도 → 두 워커가 같은 학습자를 동시에 고쳐도 기록이 사라지지 않고,
+DB 쓰기 잠금은 upsert 몇 줄 동안만 잡습니다.
+  - 저장 위치: 환경변수 PRACTICE_DB (기본 data/practice.sqlite3, Vercel 에서는 /tmp).
+    빈 문자열이면 메모리에만 둠 (재시작하면 초기화)
+  - 서버리스 인스턴스끼리는 /tmp 를 공유하지 않으므로 SHARED=False → 응답에 알림
+
+record / next_batch 는 디스크 I/O 가 있어 (blocking) 스레드에서 부릅니다. 락은 학습자 ID 해시로
+고른 스트라이프(N_STRIPES 개)만 잡으므로 다른 학습자끼리는 서로 기다리지 않습니다.
+SQLite 연결은 스레드별. has_seen / summary 는 방금 동기화된 메모리 캐시만 읽습니다 (락·I/O 없음).
+"""
+import heapq
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+MINUTE = 60
+DAY    = 24 * 60 * MINUTE
+
+# 상자별 다음 복습 간격. 상자 0 은 방금 틀렸거나 처음 푼 문항
+INTERVALS = (10 * MINUTE, 1 * DAY, 3 * DAY, 7 * DAY, 16 * DAY, 35 * DAY)
+MAX_BOX   = len(INTERVALS) - 1
+MASTERED  = 3                # 이 상자 이상이면 "익힌 문항"
+RELEARN   = 5 * MINUTE       # 틀린 문항 재출제까지
+RESERVE   = 30 * MINUTE      # 출제했지만 아직 채점 안 된 문항을 다시 내기까지
+
+MAX_LEARNERS = 10_000        # 메모리 캐시 상한. 넘으면 가장 오래 안 쓴 학습자부터 제거
+MAX_LEARNER_ID = 64
+N_STRIPES = 16               # 학습자 락 스트라이프 수 (answer_stats 와 같은 방식)
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+_db_env = os.environ.get(
+    "PRACTICE_DB",
+    "/tmp/practice.sqlite3" if os.environ.get("VERCEL") else str(DATA_DIR / "practice.sqlite3"),
+)
+PRACTICE_DB = Path(_db_env) if _db_env else None
+SHARED = not os.environ.get("VERCEL")     # 요청을 받는 모든 프로세스가 같은 파일을 보는지
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS learners (
+    learner_id TEXT    PRIMARY KEY,
+    version    INTEGER NOT NULL         -- 상태를 바꿀 때마다 +1 (다른 프로세스 캐시 무효화)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cards (
+    learner_id  TEXT    NOT NULL,
+    question_id TEXT    NOT NULL,
+    box         INTEGER NOT NULL,
+    due         REAL    NOT NULL,
+    reps        INTEGER NOT NULL,
+    lapses      INTEGER NOT NULL,
+    PRIMARY KEY (learner_id, question_id)
+) WITHOUT ROWID;
+"""
+
+
+class Fenwick:
+    """가중치 누적합 트리. 항목 추가·가중치 변경·가중치 비례 추출이 모두 O(log M)."""
+
+    def __init__(self):
+        self.tree: list[int] = [0]        # 1-based
+        self.weights: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def _prefix(self, i: int) -> int:
+        s = 0
+        while i > 0:
+            s += self.tree[i]
+            i -= i & -i
+        return s
+
+    def append(self, weight: int) -> int:
+        """항목 추가 → 0-based 위치. tree[i] 는 (i - lowbit(i), i] 구간 합."""
+        i = len(self.weights) + 1
+        self.tree.append(weight + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+        self.weights.append(weight)
+        return i - 1
+
+    def set(self, pos: int, weight: int):
+        delta = weight - self.weights[pos]
+        if not delta:
+            return
+        self.weights[pos] = weight
+        i = pos + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def total(self) -> int:
+        return self._prefix(len(self.weights))
+
+    def sample(self, rng: random.Random) -> int | None:
+        """가중치에 비례해 위치 하나를 뽑음. 가중치 합이 0 이면 None."""
+        total = self.total()
+        if total <= 0:
+            return None
+        r = rng.randrange(total)
+        pos, step = 0, 1 << (len(self.weights).bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt <= len(self.weights) and self.tree[nxt] <= r:
+                pos = nxt
+                r -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+
+class Card:
+    __slots__ = ("pos", "box", "due", "reps", "lapses", "version")
+
+    def __init__(self, pos: int):
+        self.pos = pos          # Fenwick 위치
+        self.box = 0
+        self.due = 0.0
+        self.reps = 0
+        self.lapses = 0
+        self.version = 0
+
+    def weakness(self) -> int:
+        return self.lapses * (MAX_BOX - self.box)
+
+
+class Learner:
+    __slots__ = ("cards", "ids", "due", "weak", "mastered", "version", "dirty")
+
+    def __init__(self, version: int = 0):
+        self.cards: dict[str, Card] = {}
+        self.ids: list[str] = []                          # Fenwick 위치 → 문항 ID
+        self.due: list[tuple[float, int, str]] = []       # (복습 시각, 버전, 문항 ID)
+        self.weak = Fenwick()
+        self.mastered = 0
+        self.version = version                            # 마지막으로 읽거나 쓴 DB 버전
+        self.dirty: set[str] = set()                      # DB 에 아직 안 쓴 문항
+
+    def card(self, question_id: str) -> Card:
+        card = self.cards.get(question_id)
+        if card is None:
+            card = self.cards[question_id] = Card(self.weak.append(0))
+            self.ids.append(question_id)
+        return card
+
+    def schedule(self, question_id: str, card: Card, due: float):
+        card.version += 1
+        card.due = due
+        self.dirty.add(question_id)
+        heapq.heappush(self.due, (due, card.version, question_id))
+        # 낡은 항목이 유효 항목의 2배를 넘으면 다시 만듦 (분할 상환 O(1))
+        if len(self.due) > 2 * len(self.cards) + 64:
+            self.due = [(c.due, c.version, qid) for qid, c in self.cards.items()]
+            heapq.heapify(self.due)
+
+    def pop_due(self, now: float) -> str | None:
+        """복습 시각이 지난 문항 하나. 낡은 힙 항목(버전 불일치)은 버림."""
+        while self.due and self.due[0][0] <= now:
+            _, version, qid = heapq.heappop(self.due)
+            if self.cards[qid].version == version:
+                return qid
+        return None
+
+
+class PracticeScheduler:
+    def __init__(self, db_path: Path | None = PRACTICE_DB,
+                 max_learners: int = MAX_LEARNERS, seed: int | None = None):
+        self.db_path = db_path
+        self.max_learners = max_learners
+        self.learners: OrderedDict[str, Learner] = OrderedDict()
+        self.rng = random.Random(seed)
+        self._stripes = [threading.Lock() for _ in range(N_STRIPES)]
+        self._cache_lock = threading.Lock()     # learners LRU 갱신만 (I/O 없이 짧게)
+        self._local = threading.local()         # 스레드별 SQLite 연결
+
+    @property
+    def blocking(self) -> bool:
+        """record / next_batch 가 디스크를 쓰는지 (async tool 에서는 스레드로)."""
+        return self.db_path is not None
+
+    # ─── 영속화 ──────────────────────────────────────────────────────────────
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (fork 전에 연 연결은 워커에서 쓰지 않음)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")     # 여러 워커가 동시에 읽고 씀
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _cache(self, learner_id: str, learner: Learner) -> Learner:
+        with self._cache_lock:
+            self.learners[learner_id] = learner
+            self.learners.move_to_end(learner_id)
+            if len(self.learners) > self.max_learners:
+                self.learners.popitem(last=False)
+        return learner
+
+    def _fresh(self, learner_id: str) -> Learner:
+        """최신 상태의 학습자. 캐시의 버전이 DB 와 다르면 DB 스냅샷으로 다시 만듦 — O(M log M)."""
+        learner = self.learners.get(learner_id)
+        if self.db_path is None:
+            return self._cache(learner_id, learner or Learner())
+
+        conn = self._conn()
+        conn.execute("BEGIN")           # 읽기 스냅샷 (WAL: 쓰는 쪽을 막지 않음)
+        try:
+            row = conn.execute("SELECT version FROM learners WHERE learner_id = ?",
+                               (learner_id,)).fetchone()
+            version = row[0] if row else 0
+            if learner is None or learner.version != version:
+                learner = Learner(version)
+                for qid, box, due, reps, lapses in conn.execute(
+                        "SELECT question_id, box, due, reps, lapses FROM cards "
+                        "WHERE learner_id = ? ORDER BY question_id", (learner_id,)):
+                    card = learner.card(qid)
+                    card.box, card.due, card.reps, card.lapses, card.version = box, due, reps, lapses, 1
+                    learner.mastered += box >= MASTERED
+                    learner.weak.set(card.pos, card.weakness())
+                    learner.due.append((due, 1, qid))
+                heapq.heapify(learner.due)
+        finally:
+            conn.execute("COMMIT")
+        return self._cache(learner_id, learner)
+
+    def _save(self, learner_id: str, learner: Learner) -> bool:
+        """
+        바뀐 문항 기록. 읽은 뒤 다른 프로세스가 먼저 고쳤으면 (버전 불일치) 쓰지 않고 False.
+        쓰기 트랜잭션은 버전 compare-and-set + upsert 만 — 잠금을 짧게 잡음.
+        """
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if learner.version == 0:
+                cur = conn.execute("INSERT OR IGNORE INTO learners VALUES (?, 1)", (learner_id,))
+            else:
+                cur = conn.execute("UPDATE learners SET version = version + 1 "
+                                   "WHERE learner_id = ? AND version = ?", (learner_id, learner.version))
+            if cur.rowcount != 1:
+                conn.execute("ROLLBACK")
+                return False
+            conn.executemany(
+                "INSERT OR REPLACE INTO cards VALUES (?, ?, ?, ?, ?, ?)",
+                [(learner_id, qid, c.box, c.due, c.reps, c.lapses)
+                 for qid in learner.dirty for c in (learner.cards[qid],)])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        learner.version += 1
+        return True
+
+    def _apply(self, learner_id: str, fn):
+        """
+        학습자 락 안에서 fn(최신 학습자) 를 실행하고 바뀐 문항을 기록 → fn 의 반환값.
+        다른 프로세스와 충돌하면 그쪽 기록을 다시 읽어 fn 을 재실행합니다.
+        """
+        with self._stripes[hash(learner_id) % N_STRIPES]:
+            while True:
+                learner = self._fresh(learner_id)
+                try:
+                    result = fn(learner)
+                    saved = not learner.dirty or self.db_path is None or self._save(learner_id, learner)
+                except BaseException:
+                    saved = False
+                    raise
+                finally:
+                    if not saved:               # 메모리만 바뀐 상태를 버림 (다음에 DB 에서 다시 읽음)
+                        with self._cache_lock:
+                            self.learners.pop(learner_id, None)
+                if saved:
+                    learner.dirty.clear()
+                    return result
+
+    # ─── 채점 / 출제 ─────────────────────────────────────────────────────────
+    def record(self, learner_id: str, question_id: str, correct: bool,
+               now: float | None = None) -> dict:
+        """채점 결과 반영 → 문항의 새 상태."""
+        now = time.time() if now is None else now
+
+        def apply(learner: Learner) -> dict:
+            card = learner.card(question_id)
+            was_mastered = card.box >= MASTERED
+            card.reps += 1
+            if correct:
+                card.box = min(card.box + 1, MAX_BOX)
+                delay = INTERVALS[card.box]
+            else:
+                card.box = 0
+                card.lapses += 1
+                delay = RELEARN
+            learner.mastered += (card.box >= MASTERED) - was_mastered
+            learner.schedule(question_id, card, now + delay)
+            learner.weak.set(card.pos, card.weakness())
+            return {"box": card.box, "lapses": card.lapses, "next_review_in_sec": int(delay)}
+
+        return self._apply(learner_id, apply)
+
+    def next_batch(self, learner_id: str, n: int,
+                   now: float | None = None) -> list[tuple[str, str]]:
+        """
+        다음에 풀 문항 최대 n 개 [(문항 ID, 이유)]. 이유: "due" | "weak".
+        모자란 만큼은 호출 측이 새 문항으로 채웁니다 (has_seen() 으로 제외).
+        """
+        now = time.time() if now is None else now
+        return self._apply(learner_id, lambda learner: self._pick(learner, n, now))
+
+    def _pick(self, learner: Learner, n: int, now: float) -> list[tuple[str, str]]:
+        picked: list[tuple[str, str]] = []
+        chosen: set[str] = set()
+
+        # 1. 복습 시각이 지난 문항. 채점되지 않으면 RESERVE 뒤 다시 나오도록 예약
+        while len(picked) < n:
+            qid = learner.pop_due(now)
+            if qid is None:
+                break
+            learner.schedule(qid, learner.cards[qid], now + RESERVE)
+            picked.append((qid, "due"))
+            chosen.add(qid)
+
+        # 2. 약점 가중 표본. 같은 배치에서 중복되지 않도록 뽑은 항목의 가중치를 잠시 0 으로
+        zeroed: list[tuple[int, int]] = []
+        while len(picked) < n:
+            pos = learner.weak.sample(self.rng)
+            if pos is None:
+                break
+            zeroed.append((pos, learner.weak.weights[pos]))
+            learner.weak.set(pos, 0)
+            qid = learner.ids[pos]
+            if qid not in chosen:
+                picked.append((qid, "weak"))
+                chosen.add(qid)
+        for pos, weight in zeroed:
+            learner.weak.set(pos, weight)
+        return picked
+
+    # ─── 조회 (메모리 캐시만) ───────────────────────────────────────────────
+    def has_seen(self, learner_id: str, question_id: str) -> bool:
+        """학습자가 한 번이라도 채점한 문항인지 (직전 next_batch / record 가 동기화한 캐시 기준)."""
+        learner = self.learners.get(learner_id)
+        return learner is not None and question_id in learner.cards
+
+    def summary(self, learner_id: str) -> dict:
+        learner = self.learners.get(learner_id)
+        if not learner:
+            return {"seen": 0, "mastered": 0, "weakness": 0}
+        return {
+            "seen":     len(learner.cards),
+            "mastered": learner.mastered,
+            "weakness": learner.weak.total(),     # 약점 가중치 합 (0 이면 약한 문항 없음)
+        }
+
+    def info(self) -> dict:
+        return {
+            "db":      str(self.db_path) if self.db_path else None,
+            "shared":  SHARED and self.db_path is not None,
+            "cached_learners": len(self.learners),
+        }
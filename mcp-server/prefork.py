@@ -0,0 +1,120 @@
+"""
+prefork.py — 코퍼스를 마스터에서 한 번만 로드하고 워커를 fork 하는 멀티 프로세스 실행기
+
+uvicorn --workers 는 워커마다 모듈을 새로 import(spawn) 하므로
+AVAILABLE_EXAMS / 인덱스가 워커 수만큼 복제됩니다. 여기서는:
+  1. 마스터가 server 모듈을 import 해 STORE 와 인덱스를 구성
+  2. gc.freeze() 로 기존 객체를 영구 세대로 옮김
+     → 자식의 GC 가 객체 헤더를 건드리지 않아 copy-on-write 페이지 복제가 줄어듦
+  3. 리스닝 소켓을 만든 뒤 fork → 각 워커는 같은 소켓으로 uvicorn 실행
+
+참조 카운트 변경까지 피하려면 QUESTION_STORE=sqlite 를 쓰세요.
+문항이 파이썬 객체가 아니라 mmap 된 DB 페이지로만 존재하므로 워커 간에 그대로 공유됩니다.
+
+LAZY_STARTUP=1 이면 저장소를 워커마다 첫 요청 때 따로 로드하므로 공유되지 않습니다 (기본 0 유지).
+
+메모리 확인: REPORT_RSS=<초> 를 주면 마스터가 주기적으로 워커별 RSS / PSS / USS(고유 메모리)를
+출력합니다. 각 워커는 GET /stats 로도 자신의 메모리 사용량을 보고합니다.
+"""
+import gc
+import os
+import signal
+import socket
+import time
+
+import uvicorn
+
+
+def memory_usage(pid: int | str = "self") -> dict[str, int]:
+    """
+    /proc/<pid>/smaps_rollup 기반 메모리 (KB).
+    uss = Private_Clean + Private_Dirty : 이 프로세스만 가진 페이지 (워커 수에 비례해 늘어나는 부분)
+    """
+    fields: dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                    fields[parts[0][:-1]] = int(parts[1])
+    except OSError:
+        return {}
+    return {
+        "rss_kb": fields.get("Rss", 0),
+        "pss_kb": fields.get("Pss", 0),
+        "uss_kb": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(app, sock: socket.socket, log_level: str):
+    config = uvicorn.Config(app, log_level=log_level, lifespan="on")
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+
+
+def _report(pids: list[int]):
+    total_uss = 0
+    for pid in pids:
+        mem = memory_usage(pid)
+        total_uss += mem.get("uss_kb", 0)
+        print(f"   worker {pid}: rss={mem.get('rss_kb', 0) / 1024:.1f}MB "
+              f"pss={mem.get('pss_kb', 0) / 1024:.1f}MB "
+              f"uss={mem.get('uss_kb', 0) / 1024:.1f}MB")
+    master = memory_usage()
+    print(f"📊 master rss={master.get('rss_kb', 0) / 1024:.1f}MB | "
+          f"workers {len(pids)} uss 합계={total_uss / 1024:.1f}MB")
+
+
+def serve(app, host: str, port: int, workers: int, log_level: str = "info"):
+    """app(과 그 모듈이 로드한 코퍼스)을 공유하는 워커 workers 개를 fork 해 실행."""
+    sock = _bind(host, port)
+
+    gc.collect()
+    gc.freeze()
+
+    pids: list[int] = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            _run_worker(app, sock, log_level)
+            os._exit(0)
+        pids.append(pid)
+    print(f"🍴 워커 {workers}개 fork 완료: {pids}")
+
+    def _stop(signum, _frame):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+
+    report_every = float(os.environ.get("REPORT_RSS", "0") or 0)
+    next_report = time.monotonic() + report_every
+    alive = set(pids)
+    while alive:
+        if report_every and time.monotonic() >= next_report:
+            _report(sorted(alive))
+            next_report = time.monotonic() + report_every
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            break
+        if pid:
+            alive.discard(pid)
+        else:
+            time.sleep(0.2)
+    sock.close()
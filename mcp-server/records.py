@@ -0,0 +1,132 @@
+"""
+records.py — 메모리용 문항 레코드 (QuestionRecord)
+
+questions_NN.json 의 문항 dict 는 문항마다
+  - 회차 상수(exam_no, level, year)를 반복하고
+  - 선택지를 "①"~"⑤" 키의 dict 로,
+  - 태그/시대 같은 반복 문자열을 문항마다 별도 객체로
+가집니다. 저장소는 로드 시점에 이를 QuestionRecord 로 변환해 보관합니다:
+  - __slots__ 클래스 (인스턴스 __dict__ 없음)
+  - 회차 상수는 회차당 하나인 ExamMeta 를 참조
+  - 선택지는 길이 5 고정 튜플 (없는 번호는 None)
+  - era / keywords / image_note / correct_answer 등 값 종류가 적은 문자열은 sys.intern
+  - cluster_id (parser/dedupe.py 의 유사 중복 묶음) 는 대부분 자기 id 라 id 객체를 그대로 공유
+
+JSON 형태가 필요한 곳(SQLite 본문, 내보내기)은 to_dict() 로 원래 dict 를 복원합니다.
+"""
+import sys
+
+CHOICE_SYMBOLS: tuple[str, ...] = ("①", "②", "③", "④", "⑤")
+CHOICE_INDEX: dict[str, int] = {s: i for i, s in enumerate(CHOICE_SYMBOLS)}
+
+_NO_KEYWORDS: tuple[str, ...] = ()
+
+
+def _intern(s: str | None) -> str | None:
+    return sys.intern(s) if s else s
+
+
+class ExamMeta:
+    """회차 단위 상수. 같은 회차의 문항들이 하나를 공유합니다."""
+    __slots__ = ("exam_no", "level", "year")
+
+    def __init__(self, exam_no: int, level: str | None, year: int | None):
+        self.exam_no = exam_no
+        self.level   = _intern(level)
+        self.year    = year
+
+    @classmethod
+    def from_meta(cls, exam_no: int, meta: dict) -> "ExamMeta":
+        """questions_NN.json 의 meta (또는 exam_summary) → ExamMeta."""
+        return cls(exam_no, meta.get("level", "심화"), meta.get("year"))
+
+
+class QuestionRecord:
+    """문항 1개. 필드 이름은 JSON 키와 같고, exam_no / level / year 는 ExamMeta 에서 읽습니다."""
+    __slots__ = (
+        "exam", "id", "question_no", "score", "question_text", "source_material",
+        "has_image", "image_note", "image_path", "choices", "correct_answer",
+        "keywords", "era", "cluster_id",
+    )
+
+    def __init__(self, exam: ExamMeta, id: str, question_no: int, score: int | None,
+                 question_text: str, source_material: str, has_image: bool,
+                 image_note: str | None, image_path: str | None,
+                 choices: tuple[str | None, ...], correct_answer: str | None,
+                 keywords: tuple[str, ...], era: str | None, cluster_id: str):
+        self.exam            = exam
+        self.id              = id
+        self.question_no     = question_no
+        self.score           = score
+        self.question_text   = question_text
+        self.source_material = source_material
+        self.has_image       = has_image
+        self.image_note      = image_note
+        self.image_path      = image_path
+        self.choices         = choices
+        self.correct_answer  = correct_answer
+        self.keywords        = keywords
+        self.era             = era
+        self.cluster_id      = cluster_id
+
+    @classmethod
+    def from_dict(cls, q: dict, exam: ExamMeta) -> "QuestionRecord":
+        choice_map = q.get("choices") or {}
+        keywords = q.get("keywords")
+        cluster_id = q.get("cluster_id")
+        return cls(
+            exam            = exam,
+            id              = q["id"],
+            question_no     = q["question_no"],
+            score           = q.get("score"),
+            question_text   = q.get("question_text") or "",
+            source_material = q.get("source_material") or "",
+            has_image       = bool(q.get("has_image")),
+            image_note      = _intern(q.get("image_note")),
+            image_path      = q.get("image_path"),
+            choices         = tuple(choice_map.get(s) for s in CHOICE_SYMBOLS),
+            correct_answer  = _intern(q.get("correct_answer")),
+            keywords        = tuple(sys.intern(k) for k in keywords) if keywords else _NO_KEYWORDS,
+            era             = _intern(q.get("era")),
+            cluster_id      = q["id"] if not cluster_id or cluster_id == q["id"] else cluster_id,
+        )
+
+    @property
+    def exam_no(self) -> int:
+        return self.exam.exam_no
+
+    @property
+    def level(self) -> str | None:
+        return self.exam.level
+
+    @property
+    def year(self) -> int | None:
+        return self.exam.year
+
+    def choice_map(self) -> dict[str, str]:
+        """선택지 {"①": 내용, ...} (응답용. 없는 번호는 생략)."""
+        return {s: c for s, c in zip(CHOICE_SYMBOLS, self.choices) if c is not None}
+
+    def to_dict(self) -> dict:
+        """questions_NN.json 의 문항 dict 형태로 복원."""
+        return {
+            "id":              self.id,
+            "exam_no":         self.exam_no,
+            "level":           self.level,
+            "year":            self.year,
+            "question_no":     self.question_no,
+            "score":           self.score,
+            "question_text":   self.question_text,
+            "source_material": self.source_material,
+            "has_image":       self.has_image,
+            "image_note":      self.image_note,
+            "choices":         self.choice_map(),
+            "correct_answer":  self.correct_answer,
+            "keywords":        list(self.keywords),
+            "image_path":      self.image_path,
+            "era":             self.era,
+            "cluster_id":      self.cluster_id,
+        }
+
+    def __repr__(self) -> str:
+        return f"QuestionRecord({self.id!r})"
@@ -0,0 +1,89 @@
+"""
+search_cache.py — search_questions 결과 캐시 (TTL + LRU) 와 동시 요청 합치기
+
+대화 중 모델은 같은 search_questions 를 반복하거나 병렬로 여러 번 부릅니다.
+  - 키: (코퍼스 버전, 정규화한 검색 조건). 버전은 저장소가 로드한 원본의 서명이라
+    데이터가 바뀌어 다시 로드되면 이전 항목은 자연히 쓰이지 않음 (LRU 로 밀려남)
+  - 항목은 TTL 초 뒤 만료, 개수가 max_size 를 넘으면 가장 오래 안 쓴 것부터 제거
+  - single-flight: 같은 키를 계산 중이면 새로 계산하지 않고 그 결과를 기다림.
+    계산은 별도 Task 로 돌리고 각 호출은 shield 로 기다리므로
+    먼저 부른 요청이 취소돼도 나머지는 결과를 받음
+모든 메서드는 이벤트 루프 스레드에서만 호출합니다 (락 없음).
+
+설정: SEARCH_CACHE_SIZE (기본 1024, 0 이면 끔) / SEARCH_CACHE_TTL (초, 기본 300)
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+
+CACHE_SIZE = int(os.environ.get("SEARCH_CACHE_SIZE", 1024))
+CACHE_TTL  = float(os.environ.get("SEARCH_CACHE_TTL", 300))
+
+
+class SearchCache:
+    def __init__(self, max_size: int = CACHE_SIZE, ttl: float = CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()   # 키 → (만료 시각, 값)
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0      # 계산 중인 같은 요청의 결과를 기다린 수
+        self.expired = 0
+        self.evicted = 0
+
+    async def get_or_compute(self, key: tuple, compute):
+        """
+        캐시 값이 있으면 반환, 없으면 compute() (코루틴 함수) 결과를 저장 후 반환.
+        key 에 None 이 들어 있으면 (예: 저장소 로드 전이라 버전을 모름) 캐시하지 않음.
+        """
+        if not self.max_size or None in key:
+            self.misses += 1
+            return await compute()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+            self.expired += 1
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._inflight[key] = asyncio.ensure_future(compute())
+            task.add_done_callback(lambda t: self._store(key, t))
+        return await asyncio.shield(task)
+
+    def _store(self, key: tuple, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return                       # 실패는 캐시하지 않음 (기다리던 요청은 같은 예외를 받음)
+        self._entries[key] = (time.monotonic() + self.ttl, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def summary(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size":      len(self._entries),
+            "max_size":  self.max_size,
+            "ttl_sec":   self.ttl,
+            "hits":      self.hits,
+            "coalesced": self.coalesced,
+            "misses":    self.misses,
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 3) if lookups else None,
+            "expired":   self.expired,
+            "evicted":   self.evicted,
+            "inflight":  len(self._inflight),
+        }
@@ -0,0 +1,342 @@
+"""
+search_index.py — 한글 검색용 정규화 인덱스
+
+문항마다 세 가지 투영(projection)을 미리 계산해 둡니다.
+  - norm     : 공백 제거 + 소문자 ("조선 건국" == "조선건국")
+  - choseong : 초성만 추출 ("ㅈㅅㄱㄱ" 로 검색 가능)
+  - jamo     : 자모 분해 (오타 허용 편집거리 계산용)
+
+검색은 n-gram 포스팅 리스트로 후보를 좁힌 뒤 검증하므로
+코퍼스 전체를 스캔하지 않습니다. 규모별 시간은 bench_search.py.
+"""
+import re
+from collections import defaultdict
+
+# ─── 한글 자모 분해 ───────────────────────────────────────────────────────────
+HANGUL_BASE, HANGUL_LAST = 0xAC00, 0xD7A3
+CHOSEONG  = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ",
+             "ㄽ", "ㄾ", "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ",
+             "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+CHOSEONG_SET = set(CHOSEONG)
+
+WS_PAT = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """공백 제거 + 소문자."""
+    return WS_PAT.sub("", text or "").lower()
+
+
+# 음절 → 초성 / 자모열 변환표 (str.translate 로 한 번에 변환)
+_CHOSEONG_TABLE = {HANGUL_BASE + i: CHOSEONG[i // 588] for i in range(HANGUL_LAST - HANGUL_BASE + 1)}
+_JAMO_TABLE = {
+    HANGUL_BASE + i: CHOSEONG[i // 588] + JUNGSEONG[(i % 588) // 28] + JONGSEONG[i % 28]
+    for i in range(HANGUL_LAST - HANGUL_BASE + 1)
+}
+
+
+def to_choseong(text: str) -> str:
+    """완성형 음절 → 초성. 한글이 아닌 문자는 그대로 둡니다."""
+    return text.translate(_CHOSEONG_TABLE)
+
+
+def to_jamo(text: str) -> str:
+    """완성형 음절 → 초성·중성·종성 자모열."""
+    return text.translate(_JAMO_TABLE)
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성만으로 이루어진 검색어인지 (예: "ㄱㄹ")."""
+    return bool(text) and all(ch in CHOSEONG_SET for ch in text)
+
+
+# ─── 편집거리 ─────────────────────────────────────────────────────────────────
+def substring_distance(pattern: str, text: str, max_dist: int) -> int | None:
+    """
+    pattern 과 text 의 임의 부분 문자열 사이 최소 편집거리 (Sellers 알고리즘).
+    max_dist 를 넘으면 None. 완전 일치(0)가 나오면 즉시 종료합니다.
+    """
+    m = len(pattern)
+    if m == 0:
+        return 0
+    prev = list(range(m + 1))
+    best = m
+    for ch in text:
+        cur = [0]                    # 부분 문자열 매칭: 어디서든 시작 가능
+        left = 0
+        for i in range(m):
+            # min(대각 + 치환비용, 위 + 1, 왼쪽 + 1) — min() 호출 없이 비교
+            v = prev[i] if pattern[i] == ch else prev[i] + 1
+            up = prev[i + 1] + 1
+            if up < v:
+                v = up
+            if left + 1 < v:
+                v = left + 1
+            cur.append(v)
+            left = v
+        if left < best:
+            best = left
+            if best == 0:
+                return 0
+        prev = cur
+    return best if best <= max_dist else None
+
+
+def max_edits(jamo_len: int) -> int:
+    """검색어 자모 길이에 따른 허용 편집 횟수."""
+    if jamo_len >= 12:
+        return 2
+    if jamo_len >= 6:
+        return 1
+    return 0
+
+
+# ─── 인덱스 ───────────────────────────────────────────────────────────────────
+FUZZY_GRAM = 3                  # 오타 검색 후보 필터 단위: 자모 trigram
+MAX_FUZZY_CANDIDATES = 256      # 편집거리를 검증할 최대 문서 수 (조각 일치가 많은 순)
+MAX_FUZZY_JAMO = 60             # 이보다 긴 검색어(자모 수, 한글 약 20자)는 오타 검색 생략
+
+
+def _grams(s: str, n: int) -> set[str]:
+    if len(s) < n:
+        return {s} if s else set()
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+def _add_postings(postings: defaultdict[str, list[int]], doc_id: int, s: str, n: int):
+    for g in _grams(s, n):
+        postings[g].append(doc_id)
+
+
+def _longest_run(qj: str, pieces: list[tuple[int, str]], found: list[int],
+                 text: str) -> tuple[int, str]:
+    """found 조각 중 연속된 조각들을 이어 붙여 text 에 그대로 있는 가장 긴 (offset, 묶음)."""
+    best = pieces[found[0]]
+    present = set(found)
+    for p in found:
+        start = pieces[p][0]
+        q = p + 1
+        while q in present:
+            end = pieces[q][0] + len(pieces[q][1])
+            if qj[start:end] not in text:
+                break
+            if end - start > len(best[1]):
+                best = (start, qj[start:end])
+            q += 1
+    return best
+
+
+class SearchIndex:
+    """
+    문서 리스트(문자열)에 대한 정규화/초성/자모 인덱스.
+    doc_id 는 생성자에 전달한 리스트의 위치입니다.
+    """
+
+    def __init__(self, texts: list[str]):
+        self.norm:     list[str] = []
+        self.choseong: list[str] = []
+        self.jamo:     list[str] = []
+        # 한 글자 검색은 포스팅 없이 전체 스캔 (문서당 `in` 한 번이라 1만 문항에서도 ~1ms)
+        self.norm_postings: defaultdict[str, list[int]] = defaultdict(list)
+        self.cho_postings:  defaultdict[str, list[int]] = defaultdict(list)
+        self.jamo_postings: defaultdict[str, list[int]] = defaultdict(list)
+
+        for doc_id, text in enumerate(texts):
+            n = normalize(text)
+            c = to_choseong(n)
+            j = to_jamo(n)
+            self.norm.append(n)
+            self.choseong.append(c)
+            self.jamo.append(j)
+            _add_postings(self.norm_postings, doc_id, n, 2)
+            _add_postings(self.cho_postings, doc_id, c, 2)
+            _add_postings(self.jamo_postings, doc_id, j, FUZZY_GRAM)
+
+    def __len__(self) -> int:
+        return len(self.norm)
+
+    @staticmethod
+    def _intersect(postings: dict[str, list[int]], grams: set[str]) -> list[int]:
+        lists = sorted((postings.get(g, []) for g in grams), key=len)
+        if not lists or not lists[0]:
+            return []
+        result = set(lists[0])
+        for lst in lists[1:]:
+            result.intersection_update(lst)
+            if not result:
+                break
+        return sorted(result)
+
+    def _substring(self, query: str, texts: list[str],
+                   postings: dict[str, list[int]]) -> list[int]:
+        if len(query) < 2:
+            return [d for d, t in enumerate(texts) if query in t]
+        return [d for d in self._intersect(postings, _grams(query, 2)) if query in texts[d]]
+
+    def exact(self, query: str) -> list[int]:
+        """공백 무시 부분 문자열 일치."""
+        q = normalize(query)
+        return self._substring(q, self.norm, self.norm_postings) if q else []
+
+    def by_choseong(self, query: str) -> list[int]:
+        """초성 검색 — 검색어가 초성으로만 이루어진 경우에만 의미가 있습니다."""
+        q = normalize(query)
+        if not is_choseong_query(q):
+            return []
+        return self._substring(q, self.choseong, self.cho_postings)
+
+    def _df(self, gram: str) -> int:
+        postings = self.jamo_postings.get(gram)
+        return len(postings) if postings else 0
+
+    def _pieces(self, qj: str, k: int) -> list[tuple[int, str]]:
+        """
+        검색어 자모열을 k+1 개의 연속 조각 (offset, 조각) 으로 나눕니다.
+        조각 비용 = 조각 안 가장 드문 trigram 의 문서 수 (그 포스팅만 훑으므로).
+        경계는 비용 합이 최소가 되도록 DP 로 고릅니다. 조각 길이 ≥ FUZZY_GRAM.
+        끝 j 를 고정하고 시작 i 를 왼쪽으로 옮기며 최솟값을 이어 가므로 O(k·m²).
+        """
+        m, q = len(qj), FUZZY_GRAM
+        df = [self._df(qj[i:i + q]) for i in range(m - q + 1)]
+
+        INF = float("inf")
+        best = [[INF] * (m + 1) for _ in range(k + 2)]    # best[p][j]: qj[:j] 를 p 조각으로
+        cut = [[0] * (m + 1) for _ in range(k + 2)]
+        best[0][0] = 0
+        for p in range(1, k + 2):
+            prev, cur = best[p - 1], best[p]
+            for j in range(p * q, m + 1):
+                cost = INF                              # 조각 qj[i:j] 의 비용 = min(df[i:j-q+1])
+                for i in range(j - q, (p - 1) * q - 1, -1):
+                    if df[i] < cost:
+                        cost = df[i]
+                    c = prev[i] + cost
+                    if c < cur[j]:
+                        cur[j], cut[p][j] = c, i
+        pieces, j = [], m
+        for p in range(k + 1, 0, -1):
+            i = cut[p][j]
+            pieces.append((i, qj[i:j]))
+            j = i
+        return pieces[::-1]
+
+    def fuzzy(self, query: str, allowed: set[int] | None = None) -> list[tuple[int, int]]:
+        """
+        자모 단위 편집거리 ≤ k 인 문서를 (doc_id, distance) 로 반환 (거리순).
+        분할 필터: 검색어를 겹치지 않는 k+1 조각으로 나누면 k번 편집은 최대 k개 조각만
+        건드리므로, 일치하는 문서에는 적어도 한 조각이 그대로 들어 있습니다.
+        조각이 하나도 없는 문서는 검증하지 않고, 후보가 MAX_FUZZY_CANDIDATES 를 넘으면
+        검색어와 길게 이어서 겹치는 문서부터 검증합니다 (이때는 결과가 일부 빠질 수 있음).
+        allowed 가 주어지면 그 doc_id 만 후보로 삼습니다 (상한을 필터 뒤에 적용).
+        자모가 MAX_FUZZY_JAMO 를 넘는 검색어는 오타 검색을 하지 않습니다 (빈 결과).
+        """
+        qj = to_jamo(normalize(query))
+        k = max_edits(len(qj))
+        if k == 0 or len(qj) < (k + 1) * FUZZY_GRAM or len(qj) > MAX_FUZZY_JAMO:
+            return []
+
+        pieces = self._pieces(qj, k)
+        found: dict[int, list[int]] = {}        # doc_id → 그대로 들어 있는 조각 번호
+        for p, (_, piece) in enumerate(pieces):
+            rarest = min(_grams(piece, FUZZY_GRAM), key=self._df)
+            for d in self.jamo_postings.get(rarest, ()):
+                if allowed is not None and d not in allowed:
+                    continue
+                if piece in self.jamo[d]:
+                    found.setdefault(d, []).append(p)
+
+        # 앵커 = 이어서 들어 있는 가장 긴 조각 묶음 + 각 조각. 긴 묶음이 있는 문서부터
+        anchors = {d: [_longest_run(qj, pieces, ps, self.jamo[d])] + [pieces[p] for p in ps]
+                   for d, ps in found.items()}
+        candidates = sorted(anchors, key=lambda d: (-len(anchors[d][0][1]), -len(found[d]), d))
+
+        hits = []
+        for doc_id in candidates[:MAX_FUZZY_CANDIDATES]:
+            dist = self._verify(qj, self.jamo[doc_id], k, anchors[doc_id])
+            if dist is not None:
+                hits.append((doc_id, dist))
+        hits.sort(key=lambda h: (h[1], h[0]))
+        return hits
+
+    @staticmethod
+    def _verify(qj: str, text: str, k: int, anchors: list[tuple[int, str]]) -> int | None:
+        """
+        그대로 들어 있는 조각(앵커) 주변 창에서만 편집거리 계산.
+        앵커가 검색어 offset 위치, 문서 pos 위치에 있으면 일치 구간은
+        [pos - offset - k, pos - offset + m + k) 안에 있습니다 (삽입·삭제 최대 k).
+        검색어 전체가 들어 있지 않으면 1 이 최소이므로 1 을 찾는 즉시 종료합니다.
+        """
+        if qj in text:
+            return 0
+        m = len(qj)
+        best = None
+        tried: set[int] = set()
+        for offset, piece in anchors:
+            pos = text.find(piece)
+            while pos >= 0:
+                start = max(pos - offset - k, 0)
+                if start not in tried:
+                    tried.add(start)
+                    d = substring_distance(qj, text[start:pos - offset + m + k], k)
+                    if d is not None and (best is None or d < best):
+                        best = d
+                        if best == 1:
+                            return 1
+                pos = text.find(piece, pos + 1)
+        return best
+
+    def search(self, query: str, limit: int,
+               allowed: set[int] | None = None) -> list[tuple[int, str]]:
+        """
+        exact → choseong → fuzzy 순으로 (doc_id, match) 를 최대 limit 개 반환.
+        앞 단계에서 limit 을 채우면 뒤 단계(특히 편집거리 검증)는 건너뜁니다.
+        fuzzy 비용은 검색어 길이(MAX_FUZZY_JAMO)와 후보 수(MAX_FUZZY_CANDIDATES)로 제한됩니다.
+        allowed 가 주어지면 그 doc_id 만 결과에 포함합니다.
+        """
+        seen: set[int] = set()
+        results: list[tuple[int, str]] = []
+
+        def take(ids, match) -> bool:
+            for d in ids:
+                if d in seen or (allowed is not None and d not in allowed):
+                    continue
+                seen.add(d)
+                results.append((d, match))
+                if len(results) >= limit:
+                    return True
+            return False
+
+        (take(self.exact(query), "exact")
+         or take(self.by_choseong(query), "choseong")
+         or take((d for d, _ in self.fuzzy(query, allowed=allowed)), "fuzzy"))
+        return results
+
+
+class FacetIndex:
+    """
+    facet(era, keyword 등) → 값 → doc_id 집합.
+    값은 normalize() 로 비교하므로 "조선후기" 와 "조선 후기" 가 같은 키가 됩니다.
+    """
+
+    def __init__(self):
+        self.postings: dict[str, dict[str, set[int]]] = {}
+        self.labels:   dict[str, dict[str, str]] = {}   # 정규화 키 → 표시용 원래 값
+
+    def add(self, facet: str, value: str | None, doc_id: int):
+        if not value:
+            return
+        key = normalize(value)
+        self.postings.setdefault(facet, {}).setdefault(key, set()).add(doc_id)
+        self.labels.setdefault(facet, {}).setdefault(key, value)
+
+    def get(self, facet: str, value: str) -> set[int]:
+        """해당 값을 가진 doc_id 집합 (없으면 빈 집합)."""
+        return self.postings.get(facet, {}).get(normalize(value), set())
+
+    def counts(self, facet: str) -> dict[str, int]:
+        """표시용 값 → 문항 수 (많은 순)."""
+        labels = self.labels.get(facet, {})
+        items = sorted(self.postings.get(facet, {}).items(), key=lambda kv: -len(kv[1]))
+        return {labels[k]: len(ids) for k, ids in items}
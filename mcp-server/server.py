@@ -6,22 +6,44 @@ Tools:
   - list_exams       : 사용 가능한 시험 회차 목록
   - get_question     : 특정 회차/문항 번호 조회
   - search_questions : 키워드로 문항 검색
+  - similar_questions: 유사 주제 문항 추천
   - grade_answer     : 사용자 답 채점
   - random_quiz      : 랜덤 문항 출제
+  - question_stats   : 문항별 정답률 / 선지 분포, 어려운 문항 목록
+  - practice_next    : 학습자별 간격 반복 연습 문항
+  - start_exam       : 실전 모의고사 시작 (시험 핸들 + 문항 ID)
+  - submit_exam      : 모의고사 일괄 채점 (총점, 급수, 시대별 결과, 소요 시간)
 
 배포: Cloudflare Workers (무료 10만 req/일)
 로컬: python server.py → http://localhost:8787/mcp
+저장소: QUESTION_STORE=memory|sqlite (store.py 참조)
+시작: LAZY_STARTUP=1 이면 저장소를 첫 조회 때 로드, STARTUP_TIMING=1 이면 단계별 시간 출력 (startup.py)
 """
+import functools
 import json
 import os
-import random
 import re
-from pathlib import Path
+import sys
+import time
 
+from startup import LAZY, STARTUP
+
+import anyio
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
 
-# ─── 데이터 로드 ──────────────────────────────────────────────────────────────
-DATA_DIR = Path(__file__).parent.parent / "data"
+STARTUP.mark("import mcp / starlette")
+
+from answer_stats import CORRECT, OTHER, AnswerStats
+from mock_exam import TIME_LIMIT_SEC, ExamKey, grade, issue_handle, parse_answers, verify_handle
+from practice import MAX_LEARNER_ID, PracticeScheduler
+from records import CHOICE_INDEX, CHOICE_SYMBOLS
+from search_cache import SearchCache
+from search_index import normalize
+from store import MAX_SIMILAR, open_store
+
+STARTUP.mark("import 서버 모듈")
 
 # GitHub raw 이미지 베이스 URL (public repo)
 GITHUB_RAW_BASE = (
@@ -35,49 +57,138 @@ def image_url(image_path: str | None) -> str | None:
         return None
     return f"{GITHUB_RAW_BASE}/data/{image_path}"
 
-def load_exam(exam_no: int) -> dict | None:
-    path = DATA_DIR / f"questions_{exam_no}.json"
-    if not path.exists():
-        return None
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
-
-# 서버 시작 시 사용 가능한 회차 캐시
-AVAILABLE_EXAMS: dict[int, dict] = {}
-for p in DATA_DIR.glob("questions_*.json"):
-    no = int(re.search(r"questions_(\d+)\.json", p.name).group(1))
-    AVAILABLE_EXAMS[no] = load_exam(no)
-
-print(f"📚 로드된 시험 회차: {sorted(AVAILABLE_EXAMS.keys())}")
+# ─── 데이터 로드 ──────────────────────────────────────────────────────────────
+# 환경변수 QUESTION_STORE=memory|sqlite 로 백엔드 선택 (store.py 참조)
+# LAZY_STARTUP=1 이면 첫 조회 때 로드 (로드 메시지도 그때 stderr 로)
+STORE = open_store(lazy=LAZY)
+if not LAZY:
+    print(f"📚 문항 저장소: {STORE.name} / 로드된 시험 회차: {[e['exam_no'] for e in STORE.exams()]}",
+          file=sys.stderr)
+STARTUP.mark("데이터 로드" + (" (지연)" if LAZY else ""))
+
+# 채점 결과 누적 (answer_stats.py). 디스크 기록은 백그라운드 스레드가 일괄 처리
+ANSWER_STATS = AnswerStats()
+STARTUP.mark("채점 통계 로드")
+
+# question_stats 의 어려운 문항 목록에 넣을 최소 응시 수
+MIN_ATTEMPTS = 5
+
+# collapse 시 저장소에서 더 가져오는 배수 (접힌 만큼 채우기 위한 여유분)
+COLLAPSE_OVERFETCH = 2
+
+# search_questions 결과 캐시 + 같은 검색 동시 요청 합치기 (search_cache.py)
+SEARCH_CACHE = SearchCache()
+
+# 학습자별 간격 반복 상태 (practice.py). SQLite 에 기록해 워커끼리 공유
+PRACTICE = PracticeScheduler()
+PRACTICE_NOT_SHARED = ("이 배포는 서버 인스턴스마다 학습 기록을 따로 저장합니다. "
+                       "요청이 다른 인스턴스로 가면 복습·약점 문항이 빠질 수 있습니다.")
+
+# 회차별 채점 벡터 (mock_exam.py). 첫 start_exam / submit_exam 때 만들어 캐시
+EXAM_KEYS: dict[int, ExamKey] = {}
+
+async def exam_key(exam_no: int) -> ExamKey:
+    key = EXAM_KEYS.get(exam_no)
+    if key is None:
+        key = EXAM_KEYS[exam_no] = ExamKey(exam_no, await from_store(STORE.exam_questions, exam_no))
+    return key
+
+def valid_learner_id(learner_id: str) -> str | None:
+    learner_id = learner_id.strip()
+    return learner_id if 0 < len(learner_id) <= MAX_LEARNER_ID else None
+
+async def ensure_store():
+    """LAZY_STARTUP 저장소를 스레드에서 로드. 메모리에서 바로 답하는 has_exam / exams 전에 호출."""
+    if LAZY and not STORE.loaded:
+        await anyio.to_thread.run_sync(STORE.load)
+
+async def from_store(fn, *args):
+    """저장소 조회. 디스크를 읽는 저장소(SQLite)는 이벤트 루프를 막지 않도록 스레드에서 실행."""
+    if STORE.blocking:
+        return await anyio.to_thread.run_sync(functools.partial(fn, *args))
+    return fn(*args)
+
+async def from_practice(fn, *args):
+    """학습 상태 기록·출제. SQLite 에 쓰는 경우 스레드에서 실행 (from_store 와 같은 이유)."""
+    if PRACTICE.blocking:
+        return await anyio.to_thread.run_sync(functools.partial(fn, *args))
+    return fn(*args)
 
 # ─── MCP 앱 ───────────────────────────────────────────────────────────────────
-mcp = FastMCP("한국사능력검정시험")
+# stateless: 요청마다 독립 처리 (세션 ID 발급/보관 없음) + SSE 대신 단일 JSON 응답.
+# 서버리스(Vercel)처럼 요청이 어느 인스턴스로 갈지 모르는 환경에서는 기본으로 켜짐.
+# 환경변수로 조정: MCP_STATELESS=1|0
+STATELESS = os.environ.get("MCP_STATELESS", "1" if os.environ.get("VERCEL") else "0") == "1"
+mcp = FastMCP("한국사능력검정시험", stateless_http=STATELESS, json_response=STATELESS)
+
+# ─── 상태 확인 (HTTP) ─────────────────────────────────────────────────────────
+@mcp.custom_route("/stats", methods=["GET"])
+async def stats(request: Request) -> JSONResponse:
+    """워커별 상태. 멀티 워커 실행 시 워커 수에 따라 uss 가 늘지 않는지 확인용."""
+    from prefork import memory_usage    # uvicorn 을 끌고 오므로 시작 경로에서 뺌
+    return JSONResponse({
+        "pid":    os.getpid(),
+        "store":  STORE.name,
+        "memory": memory_usage(),
+        "answer_stats": ANSWER_STATS.summary(),
+        "search_cache": SEARCH_CACHE.summary(),
+        "practice":     PRACTICE.info(),
+        "startup": STARTUP.summary(),
+    })
+
+
+# ─── 내보내기 (HTTP) ──────────────────────────────────────────────────────────
+EXPORT_BATCH = 200      # 저장소에서 한 번에 읽는 문항 수 (메모리 상한)
+
+@mcp.custom_route("/export.ndjson", methods=["GET"])
+async def export_ndjson(request: Request):
+    """
+    전체 문항을 NDJSON(한 줄에 문항 하나, questions_NN.json 의 문항 형식)으로 스트리밍.
+    ?exam_no=77 로 회차 한정. EXPORT_BATCH 개씩 keyset 페이지로 읽어 흘려보내므로
+    코퍼스 크기와 관계없이 메모리 사용이 일정합니다.
+    """
+    try:
+        exam_no = int(request.query_params.get("exam_no") or 0)
+    except ValueError:
+        return JSONResponse({"error": "exam_no 는 숫자여야 합니다."}, status_code=400)
+    await ensure_store()
+    if exam_no and not STORE.has_exam(exam_no):
+        return JSONResponse({"error": f"{exam_no}회 데이터가 없습니다."}, status_code=404)
+
+    async def lines():
+        after = -1
+        while True:
+            batch = await from_store(STORE.page, after, EXPORT_BATCH, exam_no)
+            if not batch:
+                return
+            after = batch[-1][0]
+            yield "".join(json.dumps(q.to_dict(), ensure_ascii=False) + "\n" for _, q in batch)
+
+    name = f"questions_{exam_no}.ndjson" if exam_no else "questions.ndjson"
+    return StreamingResponse(lines(), media_type="application/x-ndjson",
+                             headers={"content-disposition": f'attachment; filename="{name}"'})
+
 
 # ─── Tool: list_exams ────────────────────────────────────────────────────────
 @mcp.tool()
-def list_exams() -> dict:
+async def list_exams() -> dict:
     """
     사용 가능한 한국사능력검정시험 심화 회차 목록을 반환합니다.
-    각 회차의 번호, 연도, 문항 수, 총점을 포함합니다.
+    각 회차의 번호, 연도, 문항 수, 총점과 시대별 문항 수를 포함합니다.
     """
-    exams = []
-    for no, data in sorted(AVAILABLE_EXAMS.items()):
-        meta = data.get("meta", {})
-        qs = data.get("questions", [])
-        total_score = sum(q.get("score", 0) or 0 for q in qs)
-        exams.append({
-            "exam_no":        no,
-            "year":           meta.get("year"),
-            "level":          meta.get("level", "심화"),
-            "total_questions": len(qs),
-            "total_score":    total_score,
-        })
-    return {"exams": exams, "count": len(exams)}
+    await ensure_store()
+    exams = STORE.exams()
+    return {
+        "exams": exams,
+        "count": len(exams),
+        # search_questions / random_quiz 의 era 필터에 쓸 수 있는 값
+        "eras":  await from_store(STORE.era_counts),
+    }
 
 
 # ─── Tool: get_question ──────────────────────────────────────────────────────
 @mcp.tool()
-def get_question(exam_no: int, question_no: int) -> dict:
+async def get_question(exam_no: int, question_no: int) -> dict:
     """
     특정 회차의 특정 문항을 반환합니다.
     정답은 사용자가 답을 제출한 후 grade_answer로 확인하세요.
@@ -86,90 +197,155 @@ def get_question(exam_no: int, question_no: int) -> dict:
         exam_no: 시험 회차 번호 (예: 77)
         question_no: 문항 번호 (1~50)
     """
-    data = AVAILABLE_EXAMS.get(exam_no)
-    if not data:
+    await ensure_store()
+    if not STORE.has_exam(exam_no):
         return {"error": f"{exam_no}회 데이터가 없습니다. list_exams로 가능한 회차를 확인하세요."}
 
-    qs = data.get("questions", [])
-    q = next((q for q in qs if q["question_no"] == question_no), None)
+    q = await from_store(STORE.get, exam_no, question_no)
     if not q:
         return {"error": f"{exam_no}회 {question_no}번 문항을 찾을 수 없습니다."}
 
     # 정답 숨기고 반환
-    img = image_url(q.get("image_path"))
+    img = image_url(q.image_path)
     return {
-        "id":              q["id"],
+        "id":              q.id,
         "exam_no":         exam_no,
         "question_no":     question_no,
-        "score":           q["score"],
-        "question_text":   q["question_text"],
-        "source_material": q["source_material"],
-        "has_image":       q["has_image"],
+        "score":           q.score,
+        "question_text":   q.question_text,
+        "source_material": q.source_material,
+        "has_image":       q.has_image,
         # 이미지가 있으면 마크다운 형식으로 포함 → ChatGPT 채팅창에서 직접 렌더링
         "image":           f"![{exam_no}회 {question_no}번]({img})" if img else None,
-        "choices":         q["choices"],
+        "choices":         q.choice_map(),
         "hint":            "grade_answer 도구로 답을 제출하면 정오표를 확인할 수 있습니다.",
     }
 
 
 # ─── Tool: search_questions ──────────────────────────────────────────────────
+def collapse_duplicates(questions: list, n: int, key=lambda q: q) -> tuple[list, int]:
+    """
+    같은 cluster_id(유사 중복 묶음)는 처음 것만 남겨 최대 n 개 → (남은 항목, 접은 수).
+    cluster_id 는 파싱 때 미리 계산돼 있으므로 결과 수만큼의 집합 조회로 끝납니다.
+    """
+    seen: set[str] = set()
+    out, dropped = [], 0
+    for item in questions:
+        cid = key(item).cluster_id
+        if cid in seen:
+            dropped += 1
+            continue
+        seen.add(cid)
+        out.append(item)
+        if len(out) == n:
+            break
+    return out, dropped
+
+
+async def run_search(keyword: str, exam_no: int, limit: int, era: str, tag: str,
+                     collapse: bool) -> tuple[list, int]:
+    """저장소 검색 (+ 유사 중복 접기) → ([(문항, match)], 접은 수). 결과 캐시에 들어가는 값."""
+    hits = await from_store(STORE.search, keyword,
+                            limit * COLLAPSE_OVERFETCH if collapse else limit, exam_no, era, tag)
+    if collapse:
+        return collapse_duplicates(hits, limit, key=lambda hit: hit[0])
+    return hits, 0
+
+
 @mcp.tool()
-def search_questions(keyword: str, exam_no: int = 0, limit: int = 5) -> dict:
+async def search_questions(keyword: str = "", exam_no: int = 0, limit: int = 5,
+                           era: str = "", tag: str = "", collapse: bool = True) -> dict:
     """
-    키워드로 문항을 검색합니다. question_text와 source_material에서 검색합니다.
+    키워드로 문항을 검색합니다. 질문, 지문, 선택지에서 검색합니다.
+    띄어쓰기는 무시하고, 초성 검색("ㄱㄹ")을 지원합니다.
+    오타 허용 검색(편집거리)은 메모리 저장소(QUESTION_STORE=memory, 기본값)에서만 하며,
+    sqlite 저장소에서는 정확히 포함된 문항만 찾습니다.
+    각 결과의 match 는 exact / choseong / fuzzy 중 하나입니다 (fuzzy 는 메모리 저장소만).
 
     Args:
-        keyword: 검색어 (예: "고려", "조선 건국", "삼국통일")
+        keyword: 검색어 (예: "고려", "조선 건국", "삼국통일", "ㅈㅅㄱㄱ").
+                 비우면 era/tag 조건에 맞는 문항을 번호순으로 반환
         exam_no: 특정 회차로 한정 (0이면 전체 검색)
         limit:   최대 반환 개수 (기본 5)
+        era:     시대로 한정 (예: "고려", "조선 후기", "일제 강점기")
+        tag:     키워드 태그로 한정 (예: "훈민정음", "청해진")
+        collapse: 다른 회차에 거의 그대로 다시 나온 문항은 하나만 반환 (기본 True)
     """
-    kw = keyword.strip().lower()
-    results = []
+    # 띄어쓰기 / 대소문자만 다른 검색은 같은 결과 → 정규화한 조건 + 코퍼스 버전이 캐시 키
+    key = (STORE.version, normalize(keyword), exam_no, limit, normalize(era), normalize(tag), collapse)
+    hits, collapsed = await SEARCH_CACHE.get_or_compute(
+        key, lambda: run_search(keyword, exam_no, limit, era, tag, collapse))
 
-    exams_to_search = (
-        {exam_no: AVAILABLE_EXAMS[exam_no]}
-        if exam_no and exam_no in AVAILABLE_EXAMS
-        else AVAILABLE_EXAMS
-    )
-
-    for eno, data in exams_to_search.items():
-        for q in data.get("questions", []):
-            text = (
-                (q.get("question_text") or "") + " " +
-                (q.get("source_material") or "") + " " +
-                " ".join(q.get("choices", {}).values())
-            ).lower()
-            if kw in text:
-                results.append({
-                    "id":           q["id"],
-                    "exam_no":      eno,
-                    "question_no":  q["question_no"],
-                    "score":        q["score"],
-                    "question_text": q["question_text"],
-                    "has_image":    q["has_image"],
-                })
-                if len(results) >= limit:
-                    break
-        if len(results) >= limit:
-            break
+    results = []
+    for q, match in hits:
+        results.append({
+            "id":           q.id,
+            "exam_no":      q.exam_no,
+            "question_no":  q.question_no,
+            "score":        q.score,
+            "question_text": q.question_text,
+            "has_image":    q.has_image,
+            "era":          q.era,
+            "cluster_id":   q.cluster_id,
+            "match":        match,
+        })
 
     return {
         "keyword":     keyword,
         "count":       len(results),
+        "collapsed":   collapsed,
         "results":     results[:limit],
         "tip":         "get_question으로 전체 선택지를 확인하세요.",
     }
 
 
+# ─── Tool: similar_questions ─────────────────────────────────────────────────
+@mcp.tool()
+async def similar_questions(question_id: str, k: int = 5) -> dict:
+    """
+    주어진 문항과 비슷한 주제의 문항을 찾습니다.
+    틀린 문항을 복습할 때 같은 주제를 더 풀어보도록 추천하세요.
+
+    Args:
+        question_id: 기준 문항 ID (예: "77-05")
+        k:           반환할 문항 수 (기본 5, 최대 10)
+    """
+    k = max(1, min(k, MAX_SIMILAR))
+    neighbors = await from_store(STORE.similar, question_id.strip(), k)
+    if neighbors is None:
+        return {"error": f"{question_id} 문항을 찾을 수 없습니다. 예: '77-05'"}
+
+    results = []
+    for q, sim in neighbors:
+        results.append({
+            "id":            q.id,
+            "exam_no":       q.exam_no,
+            "question_no":   q.question_no,
+            "score":         q.score,
+            "question_text": q.question_text,
+            "has_image":     q.has_image,
+            "era":           q.era,
+            "similarity":    round(sim, 3),
+        })
+
+    return {
+        "question_id": question_id,
+        "count":       len(results),
+        "results":     results,
+        "tip":         "get_question으로 전체 선택지를 확인하세요.",
+    }
+
+
 # ─── Tool: grade_answer ──────────────────────────────────────────────────────
 @mcp.tool()
-def grade_answer(question_id: str, user_answer: str) -> dict:
+async def grade_answer(question_id: str, user_answer: str, learner_id: str = "") -> dict:
     """
     사용자의 답을 채점합니다.
 
     Args:
         question_id: 문항 ID (예: "77-05")
         user_answer: 사용자가 선택한 답 (①②③④⑤ 중 하나)
+        learner_id:  practice_next 에 쓴 학습자 ID. 주면 다음 연습 출제에 반영됩니다
     """
     # ID 파싱
     m = re.match(r"(\d+)-(\d+)", question_id)
@@ -179,74 +355,83 @@ def grade_answer(question_id: str, user_answer: str) -> dict:
     exam_no = int(m.group(1))
     q_no    = int(m.group(2))
 
-    data = AVAILABLE_EXAMS.get(exam_no)
-    if not data:
+    await ensure_store()
+    if not STORE.has_exam(exam_no):
         return {"error": f"{exam_no}회 데이터가 없습니다."}
 
-    qs = data.get("questions", [])
-    q  = next((q for q in qs if q["question_no"] == q_no), None)
+    q = await from_store(STORE.get, exam_no, q_no)
     if not q:
         return {"error": f"{exam_no}회 {q_no}번 문항을 찾을 수 없습니다."}
 
-    correct = q.get("correct_answer", "")
+    correct = q.correct_answer or ""
     is_correct = user_answer.strip() == correct
+    ANSWER_STATS.record(q.id, user_answer.strip(), is_correct)
 
-    return {
+    result = {
         "question_id":    question_id,
         "user_answer":    user_answer,
         "correct_answer": correct,
         "is_correct":     is_correct,
-        "score":          q.get("score", 0) if is_correct else 0,
-        "max_score":      q.get("score", 0),
+        "score":          (q.score or 0) if is_correct else 0,
+        "max_score":      q.score or 0,
         "message": (
-            f"✅ 정답입니다! ({correct}, {q.get('score')}점)" if is_correct
+            f"✅ 정답입니다! ({correct}, {q.score}점)" if is_correct
             else f"❌ 오답입니다. 정답은 {correct}입니다."
         ),
     }
+    if learner_id.strip():
+        lid = valid_learner_id(learner_id)
+        if not lid:
+            result["practice_error"] = f"learner_id 는 1~{MAX_LEARNER_ID}자여야 합니다."
+        else:
+            result["practice"] = await from_practice(PRACTICE.record, lid, q.id, is_correct)
+    return result
+
+
+def quiz_item(q) -> dict:
+    """출제용 문항 (정답 제외). random_quiz / practice_next 공용."""
+    eno = q.exam_no
+    img = image_url(q.image_path)
+    return {
+        "id":            q.id,
+        "exam_no":       eno,
+        "question_no":   q.question_no,
+        "score":         q.score,
+        "question_text": q.question_text,
+        "source_material": q.source_material,
+        "has_image":     q.has_image,
+        "image":         f"![{eno}회 {q.question_no}번]({img})" if img else None,
+        "choices":       q.choice_map(),
+        "era":           q.era,
+    }
 
 
 # ─── Tool: random_quiz ───────────────────────────────────────────────────────
 @mcp.tool()
-def random_quiz(count: int = 5, exam_no: int = 0) -> dict:
+async def random_quiz(count: int = 5, exam_no: int = 0, era: str = "", tag: str = "",
+                      collapse: bool = True) -> dict:
     """
     랜덤으로 문항을 출제합니다. 미니 테스트용으로 사용하세요.
 
     Args:
         count:   출제할 문항 수 (기본 5, 최대 20)
         exam_no: 특정 회차로 한정 (0이면 전체)
+        era:     시대로 한정 (예: "고려", "근대")
+        tag:     키워드 태그로 한정 (예: "임진왜란")
+        collapse: 유사 중복 문항(같은 지문 재출제)이 한 세트에 함께 나오지 않게 함 (기본 True)
     """
     count = min(count, 20)
 
-    all_qs = []
-    exams_pool = (
-        {exam_no: AVAILABLE_EXAMS[exam_no]}
-        if exam_no and exam_no in AVAILABLE_EXAMS
-        else AVAILABLE_EXAMS
-    )
-    for eno, data in exams_pool.items():
-        for q in data.get("questions", []):
-            all_qs.append((eno, q))
-
-    if not all_qs:
-        return {"error": "문항 데이터가 없습니다."}
-
-    sampled = random.sample(all_qs, min(count, len(all_qs)))
-    questions = []
-    for eno, q in sampled:
-        img = image_url(q.get("image_path"))
-        questions.append({
-            "id":            q["id"],
-            "exam_no":       eno,
-            "question_no":   q["question_no"],
-            "score":         q["score"],
-            "question_text": q["question_text"],
-            "source_material": q["source_material"],
-            "has_image":     q["has_image"],
-            "image":         f"![{eno}회 {q['question_no']}번]({img})" if img else None,
-            "choices":       q["choices"],
-        })
+    if collapse:
+        sampled = await from_store(STORE.sample, count * COLLAPSE_OVERFETCH, exam_no, era, tag)
+        sampled, _ = collapse_duplicates(sampled, count)
+    else:
+        sampled = await from_store(STORE.sample, count, exam_no, era, tag)
+    if not sampled:
+        return {"error": "조건에 맞는 문항 데이터가 없습니다."}
 
-    total_score = sum(q["score"] or 0 for _, q in sampled)
+    questions = [quiz_item(q) for q in sampled]
+    total_score = sum(q.score or 0 for q in sampled)
     return {
         "count":       len(questions),
         "total_score": total_score,
@@ -255,14 +440,223 @@ def random_quiz(count: int = 5, exam_no: int = 0) -> dict:
     }
 
 
+# ─── Tool: question_stats ────────────────────────────────────────────────────
+@mcp.tool()
+async def question_stats(question_id: str = "", exam_no: int = 0, limit: int = 10) -> dict:
+    """
+    채점 기록으로 집계한 문항 통계를 반환합니다.
+    question_id 를 주면 그 문항의 정답률과 선택지별 응답 분포를,
+    비우면 정답률이 낮은(어려운) 문항 목록을 반환합니다.
+
+    Args:
+        question_id: 문항 ID (예: "77-05"). 비우면 어려운 문항 목록
+        exam_no:     어려운 문항 목록을 특정 회차로 한정 (0이면 전체)
+        limit:       어려운 문항 목록 길이 (기본 10, 최대 50)
+    """
+    if question_id.strip():
+        q = await from_store(STORE.get_by_id, question_id.strip())
+        if not q:
+            return {"error": f"{question_id} 문항을 찾을 수 없습니다. 예: '77-05'"}
+        row = ANSWER_STATS.counts(q.id) or [0] * (CORRECT + 1)
+        attempts = sum(row[:CORRECT])
+        answer_idx = CHOICE_INDEX.get(q.correct_answer or "")
+        wrong = [(row[i], s) for i, s in enumerate(CHOICE_SYMBOLS) if i != answer_idx and row[i]]
+        return {
+            "question_id":    q.id,
+            "attempts":       attempts,
+            "correct":        row[CORRECT],
+            "correct_rate":   round(row[CORRECT] / attempts, 3) if attempts else None,
+            "correct_answer": q.correct_answer,
+            "choices": {
+                s: {"count": row[i], "ratio": round(row[i] / attempts, 3) if attempts else 0.0}
+                for i, s in enumerate(CHOICE_SYMBOLS)
+            },
+            "other_answers":  row[OTHER],
+            # 가장 많이 고른 오답 = 대표 매력적 오답
+            "top_wrong":      max(wrong)[1] if wrong else None,
+        }
+
+    limit = max(1, min(limit, 50))
+    rows = []
+    for qid, row in ANSWER_STATS.snapshot().items():
+        attempts = sum(row[:CORRECT])
+        if attempts < MIN_ATTEMPTS:
+            continue
+        if exam_no and not qid.startswith(f"{exam_no}-"):
+            continue
+        rows.append((row[CORRECT] / attempts, -attempts, qid, attempts))
+    rows.sort()
+
+    results = []
+    for rate, _, qid, attempts in rows[:limit]:
+        q = await from_store(STORE.get_by_id, qid)
+        if not q:
+            continue
+        results.append({
+            "id":            q.id,
+            "exam_no":       q.exam_no,
+            "question_no":   q.question_no,
+            "question_text": q.question_text,
+            "era":           q.era,
+            "attempts":      attempts,
+            "correct_rate":  round(rate, 3),
+        })
+
+    return {
+        "count":   len(results),
+        "results": results,
+        "note":    f"응시 {MIN_ATTEMPTS}회 이상인 문항만 정답률 오름차순으로 보여줍니다.",
+    }
+
+
+# ─── Tool: practice_next ─────────────────────────────────────────────────────
+@mcp.tool()
+async def practice_next(learner_id: str, count: int = 5) -> dict:
+    """
+    학습자 맞춤 연습 문항을 출제합니다 (간격 반복).
+    복습할 때가 된 문항 → 자주 틀린 문항 → 아직 안 푼 새 문항 순으로 채웁니다.
+    채점은 grade_answer 에 같은 learner_id 를 넘겨야 다음 출제에 반영됩니다.
+
+    Args:
+        learner_id: 학습자 식별자. 대화 동안 같은 임의 문자열을 쓰세요 (개인정보 금지)
+        count:      출제할 문항 수 (기본 5, 최대 20)
+    """
+    lid = valid_learner_id(learner_id)
+    if not lid:
+        return {"error": f"learner_id 는 1~{MAX_LEARNER_ID}자여야 합니다."}
+    count = max(1, min(count, 20))
+
+    picked = await from_practice(PRACTICE.next_batch, lid, count)
+    questions = []
+    for qid, reason in picked:
+        q = await from_store(STORE.get_by_id, qid)
+        if q:
+            questions.append({**quiz_item(q), "reason": reason})
+
+    # 모자란 만큼 안 푼 문항으로 채움
+    taken = {qid for qid, _ in picked}
+    for _ in range(3):
+        need = count - len(questions)
+        if need <= 0:
+            break
+        for q in await from_store(STORE.sample, need * 2):
+            if len(questions) < count and q.id not in taken and not PRACTICE.has_seen(lid, q.id):
+                questions.append({**quiz_item(q), "reason": "new"})
+                taken.add(q.id)
+
+    result = {
+        "learner_id": lid,
+        "count":      len(questions),
+        "questions":  questions,
+        "progress":   PRACTICE.summary(lid),
+        "tip":        "reason: due=복습할 때가 된 문항, weak=자주 틀린 문항, new=처음 푸는 문항. "
+                      "grade_answer에 learner_id를 함께 넘겨 채점하세요.",
+    }
+    if not PRACTICE.info()["shared"]:
+        result["warning"] = PRACTICE_NOT_SHARED
+    return result
+
+
+# ─── Tool: start_exam / submit_exam ──────────────────────────────────────────
+@mcp.tool()
+async def start_exam(exam_no: int) -> dict:
+    """
+    한 회차 전체(50문항)를 실전처럼 푸는 모의고사를 시작합니다.
+    문항은 get_question 으로 하나씩 보여주고, 답은 모아 두었다가 마지막에
+    submit_exam 으로 한 번에 제출합니다 (중간에 grade_answer 로 정답을 알려주지 마세요).
+
+    Args:
+        exam_no: 시험 회차 번호 (예: 77)
+    """
+    await ensure_store()
+    if not STORE.has_exam(exam_no):
+        return {"error": f"{exam_no}회 데이터가 없습니다. list_exams로 가능한 회차를 확인하세요."}
+
+    try:
+        handle, started = issue_handle(exam_no)
+    except ValueError as e:         # EXAM_SECRET 미설정 (Vercel)
+        return {"error": str(e)}
+    key = await exam_key(exam_no)
+    return {
+        "handle":          handle,
+        "exam_no":         exam_no,
+        "total_questions": len(key.question_ids),
+        "max_score":       key.total_score,
+        "time_limit_min":  TIME_LIMIT_SEC // 60,
+        "started_at":      started,
+        "question_ids":    list(key.question_ids),
+        "tip": "get_question으로 1번부터 출제하고, 답을 문항 순서대로 모아 "
+               "submit_exam(handle, answers)로 제출하세요.",
+    }
+
+
+@mcp.tool()
+async def submit_exam(handle: str, answers: list[str]) -> dict:
+    """
+    모의고사 답안을 한 번에 채점합니다.
+    총점, 합격 급수(1급 80점·2급 70점·3급 60점 이상), 시대별 결과, 소요 시간을 반환합니다.
+
+    Args:
+        handle:  start_exam 이 준 시험 핸들
+        answers: 1번부터 순서대로 고른 답 (①~⑤ 또는 1~5, 안 푼 문항은 "")
+    """
+    try:
+        exam_no, started = verify_handle(handle)
+    except ValueError as e:
+        return {"error": str(e)}
+    await ensure_store()
+    if not STORE.has_exam(exam_no):
+        return {"error": f"{exam_no}회 데이터가 없습니다."}
+
+    key = await exam_key(exam_no)
+    submitted = parse_answers(answers, len(key.answers))
+    report = grade(key, submitted)
+    elapsed = int(time.time()) - started
+
+    # 응답한 문항은 채점 통계에도 반영 (메모리 카운터 + 비동기 flush).
+    # 핸들은 상태 없는 서명이라 여러 번 제출할 수 있으므로 통계는 핸들당 한 번만
+    first = await anyio.to_thread.run_sync(ANSWER_STATS.claim, handle.strip())
+    if first:
+        for qid, mine, right in zip(key.question_ids, submitted, key.answers):
+            if mine < len(CHOICE_SYMBOLS):
+                ANSWER_STATS.record(qid, CHOICE_SYMBOLS[mine], mine == right)
+
+    return {
+        "exam_no":      exam_no,
+        **report,
+        "passed":       report["grade"] is not None,
+        "resubmitted":  not first,      # 이미 제출한 핸들 (채점만 하고 통계에는 넣지 않음)
+        "elapsed_sec":  elapsed,
+        "elapsed":      f"{elapsed // 60}분 {elapsed % 60}초",
+        "overtime":     elapsed > TIME_LIMIT_SEC,
+        "message": (
+            f"🎉 {report['score']}점 — {report['grade']} 합격!" if report["grade"]
+            else f"📝 {report['score']}점 — 60점 미만으로 불합격입니다. 틀린 문항을 복습해 보세요."
+        ),
+    }
+
+
+STARTUP.mark("도구 등록")
+
+
 # ─── 실행 ──────────────────────────────────────────────────────────────────────
+# Vercel 엔트리는 api/index.py (이 모듈을 import 해 ASGI app 을 만들고 STARTUP.ready() 호출)
 if __name__ == "__main__":
+    STARTUP.ready()
     port = int(os.environ.get("PORT", 8787))
     host = os.environ.get("HOST", "0.0.0.0")
-    print(f"🚀 MCP 서버 시작 → http://{host}:{port}/mcp")
-    # FastMCP streamable-http 모드 실행
-    # 환경변수로 호스트/포트 조정: HOST=0.0.0.0 PORT=8787
+    workers = int(os.environ.get("WORKERS", 1))
+    print(f"🚀 MCP 서버 시작 → http://{host}:{port}/mcp (workers={workers})")
+    # 환경변수로 호스트/포트/워커 수 조정: HOST=0.0.0.0 PORT=8787 WORKERS=4
     mcp.settings.host = host
     mcp.settings.port = port
-    mcp.run(transport="streamable-http")
-
+    if workers > 1:
+        # 마스터에서 로드한 코퍼스를 fork 한 워커들이 공유 (prefork.py)
+        # 워커 간 세션 저장소가 없으므로 stateless 모드로 실행
+        import prefork
+        mcp.settings.stateless_http = True
+        mcp.settings.json_response = True
+        prefork.serve(mcp.streamable_http_app(), host, port, workers)
+    else:
+        # FastMCP streamable-http 모드 실행
+        mcp.run(transport="streamable-http")
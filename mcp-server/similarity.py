@@ -0,0 +1,84 @@
+"""
+similarity.py — 문자 n-gram TF-IDF 기반 유사 문항 인덱스
+
+로드 시점에 한 번:
+  1. 문항 텍스트(공백 제거)를 문자 2·3-gram 으로 쪼개 희소 TF-IDF 행렬 구성 (SciPy CSR)
+  2. 행 단위 L2 정규화 → 내적 = 코사인 유사도
+  3. 청크 단위로 X @ X.T 를 계산해 문항별 top-k 이웃 표를 미리 저장
+
+요청 시에는 이웃 표의 한 행만 읽으므로 O(k) 입니다.
+"""
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+from search_index import normalize
+
+TOP_K       = 10     # 기본 이웃 수
+NGRAM_SIZES = (2, 3)
+CHUNK_ROWS  = 512    # X @ X.T 를 이 행 수만큼씩 계산 (메모리 상한: CHUNK_ROWS × N)
+
+
+def char_ngrams(text: str) -> Counter[str]:
+    s = normalize(text)
+    grams: Counter[str] = Counter()
+    for n in NGRAM_SIZES:
+        grams.update(s[i:i + n] for i in range(len(s) - n + 1))
+    return grams
+
+
+def tfidf_matrix(texts: list[str]) -> sparse.csr_matrix:
+    """문서 리스트 → 행 정규화된 TF-IDF CSR 행렬 (문서 × n-gram)."""
+    vocab: dict[str, int] = {}
+    rows, cols, vals = [], [], []
+    for doc_id, text in enumerate(texts):
+        for gram, cnt in char_ngrams(text).items():
+            col = vocab.setdefault(gram, len(vocab))
+            rows.append(doc_id)
+            cols.append(col)
+            vals.append(1.0 + np.log(cnt))          # sublinear tf
+
+    n_docs = len(texts)
+    x = sparse.csr_matrix(
+        (np.asarray(vals, dtype=np.float32), (rows, cols)),
+        shape=(n_docs, max(len(vocab), 1)),
+    )
+    df  = np.bincount(x.indices, minlength=x.shape[1])
+    idf = (np.log((1 + n_docs) / (1 + df)) + 1.0).astype(np.float32)
+    x   = x.multiply(idf).tocsr()
+
+    norms = np.sqrt(np.asarray(x.multiply(x).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).dot(x).tocsr().astype(np.float32)
+
+
+class SimilarityIndex:
+    """문항별 top-k 유사 문항 표. doc_id 는 생성자에 전달한 리스트의 위치입니다."""
+
+    def __init__(self, texts: list[str], top_k: int = TOP_K):
+        n = len(texts)
+        k = min(top_k, max(n - 1, 0))
+        self.neighbor_ids    = np.full((n, k), -1, dtype=np.int32)
+        self.neighbor_scores = np.zeros((n, k), dtype=np.float32)
+        if k == 0:
+            return
+
+        x  = tfidf_matrix(texts)
+        xt = x.T.tocsc()
+        for start in range(0, n, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, n)
+            sims = (x[start:stop] @ xt).toarray()
+            sims[np.arange(stop - start), np.arange(start, stop)] = -1.0   # 자기 자신 제외
+
+            top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(sims, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            self.neighbor_ids[start:stop]    = np.take_along_axis(top, order, axis=1)
+            self.neighbor_scores[start:stop] = np.take_along_axis(top_scores, order, axis=1)
+
+    def neighbors(self, doc_id: int, k: int) -> list[tuple[int, float]]:
+        """유사도 내림차순 (doc_id, score). 유사도 0 이하는 제외."""
+        ids    = self.neighbor_ids[doc_id, :k]
+        scores = self.neighbor_scores[doc_id, :k]
+        return [(int(i), float(s)) for i, s in zip(ids, scores) if i >= 0 and s > 0]
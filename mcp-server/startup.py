@@ -0,0 +1,117 @@
+"""
+startup.py — 시작(콜드 스타트) 단계별 시간 기록
+
+server.py 가 (표준 라이브러리 다음으로) 가장 먼저 import 하고, 단계가 끝날 때마다
+STARTUP.mark("단계 이름") 을 부릅니다. 직전 mark 이후 걸린 시간이 그 단계.
+app 을 만든 쪽(python server.py 실행 또는 api/index.py)이 STARTUP.ready() 를 부릅니다.
+  - 새로 로드된 모듈 수도 함께 기록 (무거운 의존성이 어느 단계에서 끌려오는지)
+  - 기록은 항상 하고 (perf_counter 두 번), 출력은 STARTUP_TIMING=1 일 때만 stderr 로
+  - /stats 의 "startup" 항목에서도 확인할 수 있음
+  - STARTUP_TIMING=1 이면 모듈별 import 시간도 기록해 느린 순으로 출력
+    (-X importtime 과 같은 self / 누적 시간. 앱 준비 뒤에는 기록을 멈춤)
+
+지연 시작 (LAZY_STARTUP=1, Vercel 에서는 기본):
+  문항 저장소(JSON 로드 + 검색 인덱스)와 유사도 인덱스(numpy/scipy)를 첫 조회 때 만듭니다.
+  ASGI app 이 빨리 생기고, 저장소가 필요 없는 요청(/stats, initialize, tools/list)은
+  로드 비용을 내지 않습니다. 시간 예산 검사는 check_startup.py.
+
+표준 라이브러리만 씁니다 (이 모듈 자체가 측정을 왜곡하지 않도록).
+"""
+import builtins
+import os
+import sys
+import time
+
+TIMING = os.environ.get("STARTUP_TIMING") == "1"
+LAZY = os.environ.get("LAZY_STARTUP", "1" if os.environ.get("VERCEL") else "0") == "1"
+IMPORT_TOP = 15         # 보고서에 출력할 느린 모듈 수
+
+
+class ImportTimer:
+    """
+    builtins.__import__ 를 감싸 처음 import 되는 모듈마다 (self, 누적) 초를 기록.
+    self = 누적 - 그 안에서 처음 import 된 다른 모듈의 누적 (-X importtime 과 같은 정의).
+    이미 로드된 모듈은 dict 조회 한 번만 더해지고, stop() 이후에는 원래 __import__ 로 돌아감.
+    """
+
+    def __init__(self):
+        self.times: dict[str, tuple[float, float]] = {}
+        self._children: list[float] = []        # import 중인 모듈별, 하위 import 에 쓴 시간
+        self._import = builtins.__import__
+        builtins.__import__ = self._timed
+
+    def _timed(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level:       # 상대 import → 절대 이름 (패키지를 모르면 측정하지 않음)
+            package = (globals or {}).get("__package__")
+            if not package:
+                return self._import(name, globals, locals, fromlist, level)
+            base = package.rsplit(".", level - 1)[0]
+            full = f"{base}.{name}" if name else base
+        else:
+            full = name
+        if full in sys.modules:
+            return self._import(name, globals, locals, fromlist, level)
+
+        self._children.append(0.0)
+        t = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - t
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += total
+            self.times[full] = (total - children, total)
+
+    def stop(self):
+        if builtins.__import__ == self._timed:      # 바운드 메서드는 매번 새 객체 → is 대신 ==
+            builtins.__import__ = self._import
+
+    def slowest(self, n: int = IMPORT_TOP) -> list[tuple[str, float, float]]:
+        """self 시간이 긴 순 [(모듈, self 초, 누적 초)]."""
+        return sorted(((m, s, c) for m, (s, c) in self.times.items()), key=lambda x: -x[1])[:n]
+
+
+class StartupTimer:
+    def __init__(self):
+        self.t0 = self._last = time.perf_counter()
+        self._modules = len(sys.modules)
+        self.phases: list[tuple[str, float, int]] = []     # (이름, 초, 새 모듈 수)
+        self.ready_sec: float | None = None
+        self.imports = ImportTimer() if TIMING else None
+
+    def mark(self, name: str):
+        """직전 mark(또는 이 모듈 import) 이후를 한 단계로 기록."""
+        now, n_modules = time.perf_counter(), len(sys.modules)
+        self.phases.append((name, now - self._last, n_modules - self._modules))
+        self._last, self._modules = now, n_modules
+
+    def ready(self):
+        """ASGI app 이 만들어진 시점. STARTUP_TIMING=1 이면 보고서 출력."""
+        self.ready_sec = time.perf_counter() - self.t0
+        if self.imports is not None:
+            self.imports.stop()
+        if TIMING:
+            self.report()
+
+    def summary(self) -> dict:
+        return {
+            "lazy":     LAZY,
+            "ready_ms": round(self.ready_sec * 1000, 1) if self.ready_sec is not None else None,
+            "phases":   {name: round(sec * 1000, 1) for name, sec, _ in self.phases},
+        }
+
+    def report(self, file=sys.stderr):
+        print(f"⏱️  시작 단계별 시간 (LAZY_STARTUP={int(LAZY)})", file=file)
+        for name, sec, n_modules in self.phases:
+            mods = f"  (+{n_modules} 모듈)" if n_modules else ""
+            print(f"   {sec * 1000:8.1f} ms  {name}{mods}", file=file)
+        if self.ready_sec is not None:
+            print(f"   {self.ready_sec * 1000:8.1f} ms  합계 (app 준비)", file=file)
+        if self.imports is not None and self.imports.times:
+            print(f"⏱️  import 가 느린 모듈 (self / 누적, 상위 {IMPORT_TOP})", file=file)
+            for module, self_sec, total_sec in self.imports.slowest():
+                print(f"   {self_sec * 1000:8.1f} ms {total_sec * 1000:8.1f} ms  {module}", file=file)
+
+
+STARTUP = StartupTimer()
@@ -0,0 +1,593 @@
+"""
+store.py — 문항 저장소 (QuestionStore)
+
+tool 들은 모듈 전역 dict 대신 QuestionStore 인터페이스로 문항을 읽습니다.
+문항은 JSON dict 가 아니라 QuestionRecord (records.py) 로 반환됩니다.
+
+백엔드:
+  - MemoryStore : data/questions_*.json 을 모두 메모리에 올리고
+                  검색/facet/유사도 인덱스를 프로세스 안에서 구성 (기본값)
+  - SQLiteStore : questions_*.json 을 SQLite 파일 하나로 컴파일해 두고 읽기 전용으로 조회.
+                  FTS5(trigram) 로 검색하므로 상주 메모리가 거의 없고 시작이 빠르며,
+                  여러 워커가 같은 파일을 공유할 수 있습니다.
+
+선택: 환경변수 QUESTION_STORE=memory|sqlite (기본 memory)
+지연 로드: open_store(lazy=True) → LazyStore 가 첫 조회 때 실제 저장소를 엶 (startup.py 참조)
+컴파일: python store.py build   → data/questions.sqlite3
+  (경로는 환경변수 QUESTION_DB. Vercel 은 배포 디렉터리가 읽기 전용이라 /tmp 에 두고
+   인스턴스마다 첫 로드 때 컴파일합니다 — DB 와 .lock 파일 모두 쓸 수 있는 곳이어야 함)
+"""
+import bisect
+import contextlib
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+try:
+    import fcntl            # POSIX 전용 — 없으면 컴파일 잠금 없이 프로세스별 임시 파일만 사용
+except ImportError:
+    fcntl = None
+
+from records import ExamMeta, QuestionRecord
+from search_index import FacetIndex, SearchIndex, is_choseong_query, normalize, to_choseong
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DB_PATH  = Path(os.environ.get(
+    "QUESTION_DB",
+    "/tmp/questions.sqlite3" if os.environ.get("VERCEL") else DATA_DIR / "questions.sqlite3",
+))
+
+EXAM_FILE_PAT = re.compile(r"questions_(\d+)\.json")
+
+MAX_SIMILAR = 10     # 미리 계산해 두는 유사 문항 수 (similar_questions 의 최대 k)
+
+
+# ─── 공용 ─────────────────────────────────────────────────────────────────────
+def exam_files(data_dir: Path = DATA_DIR) -> dict[int, Path]:
+    """회차 번호 → questions_NN.json 경로."""
+    files = {}
+    for p in data_dir.glob("questions_*.json"):
+        m = EXAM_FILE_PAT.fullmatch(p.name)
+        if m:
+            files[int(m.group(1))] = p
+    return dict(sorted(files.items()))
+
+
+def load_exam(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def exam_records(exam_no: int, data: dict) -> list[QuestionRecord]:
+    """questions_NN.json 내용 → QuestionRecord 리스트 (회차 상수는 ExamMeta 하나로 공유)."""
+    exam = ExamMeta.from_meta(exam_no, data.get("meta", {}))
+    return [QuestionRecord.from_dict(q, exam) for q in data.get("questions", [])]
+
+
+def searchable_text(q: QuestionRecord) -> str:
+    """검색 대상 텍스트: 질문 + 지문 + 선택지."""
+    return (
+        q.question_text + " " + q.source_material + " " +
+        " ".join(c for c in q.choices if c)
+    )
+
+
+def similarity_text(q: QuestionRecord) -> str:
+    """유사도 계산용 텍스트. 선택지는 다른 시대 오답이 섞여 있으므로 제외."""
+    return q.question_text + " " + q.source_material
+
+
+def exam_summary(exam_no: int, data: dict) -> dict:
+    meta = data.get("meta", {})
+    qs = data.get("questions", [])
+    return {
+        "exam_no":         exam_no,
+        "year":            meta.get("year"),
+        "level":           meta.get("level", "심화"),
+        "total_questions": len(qs),
+        "total_score":     sum(q.get("score", 0) or 0 for q in qs),
+    }
+
+
+class QuestionStore(ABC):
+    """
+    tool 이 사용하는 문항 조회 인터페이스.
+    문항은 QuestionRecord 로 반환합니다 (dict 가 필요하면 to_dict()).
+    blocking 이 True 인 저장소는 조회 중 디스크 I/O 가 있으므로
+    async tool 에서 스레드로 넘겨 호출해야 합니다 (has_exam / exams 는 항상 메모리).
+    """
+    name = "base"
+    blocking = False
+    version: str | None = None      # 로드한 원본 코퍼스 서명 (바뀌면 결과 캐시 키도 바뀜)
+
+    @abstractmethod
+    def exams(self) -> list[dict]:
+        """회차 요약 목록 (exam_summary 형식, 회차순)."""
+
+    @abstractmethod
+    def has_exam(self, exam_no: int) -> bool:
+        """로드된 회차인지."""
+
+    @abstractmethod
+    def get(self, exam_no: int, question_no: int) -> QuestionRecord | None:
+        """회차·문항 번호로 문항 (없으면 None)."""
+
+    @abstractmethod
+    def get_by_id(self, question_id: str) -> QuestionRecord | None:
+        """문항 id ("77-05") 로 문항 (없으면 None)."""
+
+    @abstractmethod
+    def exam_questions(self, exam_no: int) -> list[QuestionRecord]:
+        """회차의 전체 문항 (번호순)."""
+
+    @abstractmethod
+    def page(self, after: int, limit: int, exam_no: int = 0) -> list[tuple[int, QuestionRecord]]:
+        """
+        doc_id > after 인 문항 최대 limit 개 [(doc_id, 문항)] (doc_id 순).
+        마지막 doc_id 를 다음 after 로 넘기는 keyset 페이지 — 전체 내보내기용.
+        """
+
+    @abstractmethod
+    def search(self, keyword: str, limit: int, exam_no: int = 0,
+               era: str = "", tag: str = "") -> list[tuple[QuestionRecord, str]]:
+        """(문항, match) 리스트. keyword 가 비면 조건에 맞는 문항을 번호순으로."""
+
+    @abstractmethod
+    def sample(self, count: int, exam_no: int = 0,
+               era: str = "", tag: str = "") -> list[QuestionRecord]:
+        """조건에 맞는 문항 중 최대 count 개를 무작위로."""
+
+    @abstractmethod
+    def similar(self, question_id: str, k: int) -> list[tuple[QuestionRecord, float]] | None:
+        """유사 문항 (문항, 유사도). 기준 문항이 없으면 None."""
+
+    @abstractmethod
+    def era_counts(self) -> dict[str, int]:
+        """시대 → 문항 수 (많은 순)."""
+
+
+# ─── MemoryStore ──────────────────────────────────────────────────────────────
+class MemoryStore(QuestionStore):
+    """questions_*.json 전체를 QuestionRecord 로 변환해 메모리에 올리는 저장소."""
+    name = "memory"
+
+    def __init__(self, data_dir: Path = DATA_DIR, lazy_similarity: bool = False):
+        self.version = corpus_version(source_signature(data_dir))
+        self.exam_summaries: dict[int, dict] = {}
+        # doc_id → 문항. 아래 인덱스들의 doc_id 는 이 리스트의 위치
+        self.docs: list[QuestionRecord] = []
+        for no, path in exam_files(data_dir).items():
+            data = load_exam(path)      # 변환 후 JSON dict 는 버림
+            self.exam_summaries[no] = exam_summary(no, data)
+            self.docs.extend(exam_records(no, data))
+
+        self.doc_id_by_qid: dict[str, int] = {q.id: i for i, q in enumerate(self.docs)}
+        self.doc_id_by_no: dict[tuple[int, int], int] = {
+            (q.exam_no, q.question_no): i for i, q in enumerate(self.docs)
+        }
+        self.exam_doc_ids: dict[int, set[int]] = {}
+        for i, q in enumerate(self.docs):
+            self.exam_doc_ids.setdefault(q.exam_no, set()).add(i)
+
+        self.search_index = SearchIndex([searchable_text(q) for q in self.docs])
+
+        # 파서가 태깅한 era / keywords 로 facet 인덱스 구성 (parser/tag_keywords.py)
+        self.facets = FacetIndex()
+        for i, q in enumerate(self.docs):
+            self.facets.add("era", q.era, i)
+            for kw in q.keywords:
+                self.facets.add("keyword", kw, i)
+
+        # 유사도 인덱스는 numpy/scipy import + 전체 쌍 계산이라 시작 비용이 큼.
+        # lazy_similarity 면 첫 similar() 때 만듦
+        self.similar_index = None
+        self._similar_lock = threading.Lock()
+        if not lazy_similarity:
+            self._build_similar()
+
+    @property
+    def blocking(self) -> bool:
+        """유사도 인덱스를 아직 안 만들었으면 similar() 가 numpy import + 전체 쌍 계산 → 스레드로."""
+        return self.similar_index is None
+
+    def _build_similar(self):
+        from similarity import SimilarityIndex   # numpy/scipy 는 이 백엔드에서만 필요
+
+        with self._similar_lock:
+            if self.similar_index is None:
+                self.similar_index = SimilarityIndex([similarity_text(q) for q in self.docs],
+                                                     MAX_SIMILAR)
+
+    def _filter(self, exam_no: int, era: str, tag: str) -> set[int] | None:
+        """회차/시대/키워드 조건의 교집합. 조건이 하나도 없으면 None (= 전체)."""
+        sets = []
+        if exam_no and exam_no in self.exam_doc_ids:
+            sets.append(self.exam_doc_ids[exam_no])
+        if era:
+            sets.append(self.facets.get("era", era))
+        if tag:
+            sets.append(self.facets.get("keyword", tag))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return set(sets[0]).intersection(*sets[1:])
+
+    def exams(self) -> list[dict]:
+        return list(self.exam_summaries.values())
+
+    def has_exam(self, exam_no: int) -> bool:
+        return exam_no in self.exam_summaries
+
+    def get(self, exam_no: int, question_no: int) -> QuestionRecord | None:
+        i = self.doc_id_by_no.get((exam_no, question_no))
+        return self.docs[i] if i is not None else None
+
+    def get_by_id(self, question_id: str) -> QuestionRecord | None:
+        i = self.doc_id_by_qid.get(question_id)
+        return self.docs[i] if i is not None else None
+
+    def exam_questions(self, exam_no: int) -> list[QuestionRecord]:
+        return [self.docs[i] for i in sorted(self.exam_doc_ids.get(exam_no, ()))]
+
+    def page(self, after, limit, exam_no=0):
+        ids = sorted(self.exam_doc_ids.get(exam_no, ())) if exam_no else range(len(self.docs))
+        start = bisect.bisect_right(ids, after)
+        return [(i, self.docs[i]) for i in ids[start:start + limit]]
+
+    def search(self, keyword, limit, exam_no=0, era="", tag=""):
+        allowed = self._filter(exam_no, era, tag)
+        if keyword.strip():
+            hits = self.search_index.search(keyword, limit, allowed)
+        else:
+            pool = sorted(allowed) if allowed is not None else range(len(self.docs))
+            hits = [(i, "facet") for i in pool[:limit]]
+        return [(self.docs[i], match) for i, match in hits]
+
+    def sample(self, count, exam_no=0, era="", tag=""):
+        allowed = self._filter(exam_no, era, tag)
+        pool = sorted(allowed) if allowed is not None else range(len(self.docs))
+        return [self.docs[i] for i in random.sample(pool, min(count, len(pool)))]
+
+    def similar(self, question_id, k):
+        i = self.doc_id_by_qid.get(question_id)
+        if i is None:
+            return None
+        if self.similar_index is None:
+            self._build_similar()
+        return [(self.docs[j], sim) for j, sim in self.similar_index.neighbors(i, k)]
+
+    def era_counts(self) -> dict[str, int]:
+        return self.facets.counts("era")
+
+
+# ─── SQLiteStore ──────────────────────────────────────────────────────────────
+SCHEMA = """
+CREATE TABLE meta      (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE exams     (exam_no INTEGER PRIMARY KEY, summary TEXT NOT NULL);
+CREATE TABLE questions (
+    doc_id      INTEGER PRIMARY KEY,
+    id          TEXT NOT NULL UNIQUE,
+    exam_no     INTEGER NOT NULL,
+    question_no INTEGER NOT NULL,
+    era         TEXT,
+    era_key     TEXT,
+    body        TEXT NOT NULL
+);
+CREATE UNIQUE INDEX questions_no ON questions (exam_no, question_no);
+CREATE INDEX questions_era ON questions (era_key);
+CREATE TABLE keywords  (keyword TEXT NOT NULL, doc_id INTEGER NOT NULL);
+CREATE INDEX keywords_kw ON keywords (keyword);
+CREATE TABLE neighbors (doc_id INTEGER NOT NULL, rank INTEGER NOT NULL,
+                        nb_doc_id INTEGER NOT NULL, score REAL NOT NULL,
+                        PRIMARY KEY (doc_id, rank)) WITHOUT ROWID;
+CREATE VIRTUAL TABLE questions_fts USING fts5(norm, choseong, tokenize='trigram');
+"""
+
+
+def source_signature(data_dir: Path = DATA_DIR) -> str:
+    """원본 JSON 들의 (이름, 크기, mtime) — DB 가 최신인지 판단하는 데 사용."""
+    return json.dumps([
+        [p.name, p.stat().st_size, int(p.stat().st_mtime)]
+        for p in exam_files(data_dir).values()
+    ])
+
+
+def corpus_version(signature: str) -> str:
+    """source_signature → 짧은 버전 문자열."""
+    return hashlib.sha1(signature.encode()).hexdigest()[:12]
+
+
+@contextlib.contextmanager
+def build_lock(db_path: Path = DB_PATH):
+    """
+    DB 컴파일 배타 잠금 (db 옆 .lock 파일에 flock).
+    uvicorn --workers 처럼 여러 프로세스가 동시에 낡은 DB 를 발견해도 한 곳에서만 컴파일합니다.
+    """
+    with open(db_path.with_suffix(db_path.suffix + ".lock"), "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)       # 파일을 닫으면 풀림
+        yield
+
+
+def build_sqlite(db_path: Path = DB_PATH, data_dir: Path = DATA_DIR) -> Path:
+    """
+    questions_*.json → SQLite 컴파일. 임시 파일에 만든 뒤 교체하므로 읽는 쪽은 중단되지 않습니다.
+    임시 파일 이름에 pid 를 붙여 잠금 없이 동시에 불려도 서로의 파일을 지우지 않습니다.
+    """
+    tmp_path = db_path.with_suffix(f"{db_path.suffix}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        _compile(tmp_path, data_dir)
+        os.replace(tmp_path, db_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return db_path
+
+
+def _compile(db_path: Path, data_dir: Path):
+    from similarity import SimilarityIndex
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+
+    docs: list[QuestionRecord] = []
+    for exam_no, path in exam_files(data_dir).items():
+        data = load_exam(path)
+        conn.execute("INSERT INTO exams VALUES (?, ?)",
+                     (exam_no, json.dumps(exam_summary(exam_no, data), ensure_ascii=False)))
+        docs.extend(exam_records(exam_no, data))
+
+    for doc_id, q in enumerate(docs):
+        conn.execute(
+            "INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (doc_id, q.id, q.exam_no, q.question_no,
+             q.era, normalize(q.era) if q.era else None,
+             json.dumps(q.to_dict(), ensure_ascii=False)),
+        )
+        conn.executemany("INSERT INTO keywords VALUES (?, ?)",
+                         [(normalize(kw), doc_id) for kw in q.keywords])
+        norm = normalize(searchable_text(q))
+        conn.execute("INSERT INTO questions_fts (rowid, norm, choseong) VALUES (?, ?, ?)",
+                     (doc_id, norm, to_choseong(norm)))
+
+    similar = SimilarityIndex([similarity_text(q) for q in docs], MAX_SIMILAR)
+    for doc_id in range(len(docs)):
+        conn.executemany(
+            "INSERT INTO neighbors VALUES (?, ?, ?, ?)",
+            [(doc_id, rank, nb, score)
+             for rank, (nb, score) in enumerate(similar.neighbors(doc_id, MAX_SIMILAR))],
+        )
+
+    conn.execute("INSERT INTO meta VALUES ('source', ?)", (source_signature(data_dir),))
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+
+
+class SQLiteStore(QuestionStore):
+    """컴파일된 SQLite 파일을 읽기 전용으로 조회하는 저장소."""
+    name = "sqlite"
+    blocking = True
+
+    def __init__(self, db_path: Path = DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()     # 스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)
+        # 마스터에서 연 연결이 fork 된 워커로 넘어가지 않도록 일회용 연결로 읽음
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        self._exams = [json.loads(s) for (s,) in
+                       conn.execute("SELECT summary FROM exams ORDER BY exam_no")]
+        row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        conn.close()
+        self.version = corpus_version(row[0] if row else "")
+        self._exam_meta = {e["exam_no"]: ExamMeta.from_meta(e["exam_no"], e) for e in self._exams}
+        self._exam_nos = set(self._exam_meta)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA mmap_size = 268435456")   # 페이지를 mmap 으로 공유
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _record(self, body: str) -> QuestionRecord:
+        q = json.loads(body)
+        return QuestionRecord.from_dict(q, self._exam_meta[q["exam_no"]])
+
+    def _rows(self, sql: str, params=()) -> list[QuestionRecord]:
+        return [self._record(body) for (body,) in self._conn().execute(sql, params)]
+
+    def _filter_sql(self, exam_no: int, era: str, tag: str) -> tuple[str, list]:
+        clauses, params = [], []
+        if exam_no and self.has_exam(exam_no):
+            clauses.append("q.exam_no = ?")
+            params.append(exam_no)
+        if era:
+            clauses.append("q.era_key = ?")
+            params.append(normalize(era))
+        if tag:
+            clauses.append("q.doc_id IN (SELECT doc_id FROM keywords WHERE keyword = ?)")
+            params.append(normalize(tag))
+        return (" AND ".join(clauses) or "1"), params
+
+    def exams(self) -> list[dict]:
+        return list(self._exams)
+
+    def has_exam(self, exam_no: int) -> bool:
+        return exam_no in self._exam_nos
+
+    def get(self, exam_no: int, question_no: int) -> QuestionRecord | None:
+        rows = self._rows("SELECT body FROM questions WHERE exam_no = ? AND question_no = ?",
+                          (exam_no, question_no))
+        return rows[0] if rows else None
+
+    def get_by_id(self, question_id: str) -> QuestionRecord | None:
+        rows = self._rows("SELECT body FROM questions WHERE id = ?", (question_id,))
+        return rows[0] if rows else None
+
+    def exam_questions(self, exam_no: int) -> list[QuestionRecord]:
+        return self._rows("SELECT body FROM questions WHERE exam_no = ? ORDER BY question_no",
+                          (exam_no,))
+
+    def page(self, after, limit, exam_no=0):
+        where, params = self._filter_sql(exam_no, "", "")
+        rows = self._conn().execute(
+            f"SELECT doc_id, body FROM questions q WHERE doc_id > ? AND {where} "
+            f"ORDER BY doc_id LIMIT ?", (after, *params, limit)).fetchall()
+        return [(doc_id, self._record(body)) for doc_id, body in rows]
+
+    def search(self, keyword, limit, exam_no=0, era="", tag=""):
+        """
+        FTS5 trigram 으로 공백 무시 부분 문자열 / 초성 검색.
+        (오타 허용 편집거리 검색은 MemoryStore 에서만 지원)
+        """
+        where, params = self._filter_sql(exam_no, era, tag)
+        q = normalize(keyword)
+        if not q:
+            rows = self._rows(f"SELECT body FROM questions q WHERE {where} "
+                              f"ORDER BY doc_id LIMIT ?", (*params, limit))
+            return [(r, "facet") for r in rows]
+
+        column = "choseong" if is_choseong_query(q) else "norm"
+        match = "choseong" if column == "choseong" else "exact"
+        if len(q) >= 3:
+            # trigram 토크나이저: 따옴표 구문 = 부분 문자열 일치
+            cond, arg = "questions_fts MATCH ?", f'{column}:"{q.replace(chr(34), chr(34) * 2)}"'
+        else:
+            # 3글자 미만은 trigram 인덱스를 쓸 수 없으므로 instr 로 직접 비교
+            cond, arg = f"instr(questions_fts.{column}, ?) > 0", q
+        rows = self._rows(
+            f"SELECT q.body FROM questions_fts JOIN questions q ON q.doc_id = questions_fts.rowid "
+            f"WHERE {cond} AND {where} ORDER BY q.doc_id LIMIT ?",
+            (arg, *params, limit),
+        )
+        return [(r, match) for r in rows]
+
+    def sample(self, count, exam_no=0, era="", tag=""):
+        where, params = self._filter_sql(exam_no, era, tag)
+        ids = [i for (i,) in self._conn().execute(
+            f"SELECT doc_id FROM questions q WHERE {where}", params)]
+        picked = random.sample(ids, min(count, len(ids)))
+        if not picked:
+            return []
+        marks = ",".join("?" * len(picked))
+        rows = dict(self._conn().execute(
+            f"SELECT doc_id, body FROM questions WHERE doc_id IN ({marks})", picked).fetchall())
+        # IN (...) 결과 순서는 보장되지 않으므로 뽑은 순서대로 반환
+        return [self._record(rows[i]) for i in picked]
+
+    def similar(self, question_id, k):
+        row = self._conn().execute("SELECT doc_id FROM questions WHERE id = ?",
+                                   (question_id,)).fetchone()
+        if row is None:
+            return None
+        rows = self._conn().execute(
+            "SELECT q.body, n.score FROM neighbors n JOIN questions q ON q.doc_id = n.nb_doc_id "
+            "WHERE n.doc_id = ? ORDER BY n.rank LIMIT ?", (row[0], k)).fetchall()
+        return [(self._record(body), score) for body, score in rows]
+
+    def era_counts(self) -> dict[str, int]:
+        rows = self._conn().execute(
+            "SELECT MIN(era), COUNT(*) FROM questions WHERE era_key IS NOT NULL "
+            "GROUP BY era_key ORDER BY COUNT(*) DESC").fetchall()
+        return dict(rows)
+
+
+def is_stale(db_path: Path = DB_PATH, data_dir: Path = DATA_DIR) -> bool:
+    """DB 가 없거나 원본 JSON 과 다르면 True."""
+    if not db_path.exists():
+        return True
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        conn.close()
+    except sqlite3.DatabaseError:
+        return True
+    return row is None or row[0] != source_signature(data_dir)
+
+
+class LazyStore:
+    """
+    첫 조회 때 실제 저장소를 여는 대리 객체. 메서드 호출은 그대로 실제 저장소로 넘깁니다.
+    name 은 로드 없이 읽을 수 있고, 로드 전 blocking=True 라서 from_store 를 거친 첫 조회는
+    이벤트 루프 대신 스레드에서 로드합니다. (MemoryStore 의 유사도 인덱스는 그 뒤로도 지연)
+    조회 메서드는 꺼내기만 해서는 로드하지 않고 호출할 때 로드하므로
+    from_store(STORE.search, …) 처럼 넘겨도 로드는 스레드에서 일어납니다.
+    has_exam / exams 처럼 직접 부르는 조회 전에는 load() 를 스레드에서 먼저 부르세요.
+    """
+
+    def __init__(self, kind: str):
+        self.name = kind
+        self.load_sec: float | None = None
+        self._store: QuestionStore | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._store is not None
+
+    @property
+    def blocking(self) -> bool:
+        return self._store.blocking if self._store is not None else True
+
+    @property
+    def version(self) -> str | None:
+        """로드 전에는 None (버전을 알려고 로드하지 않음)."""
+        return self._store.version if self._store is not None else None
+
+    def load(self) -> QuestionStore:
+        with self._lock:
+            if self._store is None:
+                t = time.perf_counter()
+                self._store = _open(self.name, lazy_similarity=True)
+                self.load_sec = time.perf_counter() - t
+                print(f"📚 문항 저장소 로드 (지연): {self.name} / {self.load_sec * 1000:.0f} ms / "
+                      f"시험 회차: {[e['exam_no'] for e in self._store.exams()]}", file=sys.stderr)
+        return self._store
+
+    def __getattr__(self, attr):
+        if self._store is not None:
+            return getattr(self._store, attr)
+        if attr in QuestionStore.__abstractmethods__:
+            return lambda *args, **kwargs: getattr(self.load(), attr)(*args, **kwargs)
+        return getattr(self.load(), attr)
+
+
+def _open(kind: str, lazy_similarity: bool = False) -> QuestionStore:
+    if kind == "sqlite":
+        if is_stale():
+            with build_lock():
+                if is_stale():      # 잠금을 기다리는 동안 다른 프로세스가 이미 컴파일했을 수 있음
+                    build_sqlite()
+        return SQLiteStore()
+    if kind == "memory":
+        return MemoryStore(lazy_similarity=lazy_similarity)
+    raise ValueError(f"알 수 없는 QUESTION_STORE: {kind} (memory | sqlite)")
+
+
+def open_store(kind: str | None = None, lazy: bool = False) -> QuestionStore | LazyStore:
+    """환경변수 QUESTION_STORE 에 따라 저장소 생성. sqlite 는 DB 가 낡았으면 다시 컴파일."""
+    kind = (kind or os.environ.get("QUESTION_STORE", "memory")).lower()
+    if kind not in ("memory", "sqlite"):
+        raise ValueError(f"알 수 없는 QUESTION_STORE: {kind} (memory | sqlite)")
+    return LazyStore(kind) if lazy else _open(kind)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["build"]:
+        with build_lock():
+            path = build_sqlite()
+        print(f"💾 컴파일 완료: {path} ({path.stat().st_size / 1024:.0f} KB)")
+    else:
+        print("사용법: python store.py build")
@@ -0,0 +1,296 @@
+"""
+bench_parser.py
+parse_exam.py 파이프라인의 단계별 속도 측정 + 골든 JSON 회귀 검사.
+
+실제 시험지 PDF 없이 돌도록 fitz 로 2단 구성 시험지를 직접 만듭니다.
+  - 페이지 728.5×1031pt (실제 시험지와 같은 크기), 상단 제목 (HEADER_Y 위)
+  - 단마다 문항 2개: "N. 질문 … 것은? [2점]" / 지문 상자 / ①~⑤ 선택지
+  - 일부 문항은 지문 대신 회색 그림 상자 (has_image 판정 경로)
+  - 문항 내용은 시드 고정 난수라 실행마다 같은 PDF
+
+측정 단계 (페이지당 ms, --repeat 회 중 최솟값):
+  extract     extract_words_fitz
+  sort        sort_2col
+  boundaries  find_boundaries
+  parse       parse_block (문항 전체)
+  render      extract_images 의 문항 영역 매핑 + 2× 렌더링 + PNG 인코딩
+
+검사 (하나라도 실패하면 exit 1):
+  1. 골든: 파싱 결과가 golden/synthetic_{N}p.json 과 같은지
+     (레이아웃 처리를 바꿔 결과가 달라지면 여기서 걸림. 의도한 변경이면 --update-golden)
+  2. 확장성: 가장 큰 PDF 의 페이지당 시간이 가장 작은 PDF 의 MAX_PAGE_GROWTH 배 이하
+     (페이지 수에 대해 선형이 아닌 처리가 들어오면 걸림. 기계 속도와 무관)
+  3. --budget-ms 를 주면 페이지당 총 시간 상한
+
+  python bench_parser.py                      # 2, 6, 13쪽
+  python bench_parser.py --pages 13 --repeat 5
+  python bench_parser.py --update-golden      # 골든 JSON 다시 쓰기
+  python bench_parser.py --keep-pdfs /tmp/pdfs   # 만든 PDF 보관 (debug_*.py 로 확인용)
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+
+import extract_images
+from parse_exam import extract_words_fitz, find_boundaries, parse_block, sort_2col
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+PAGE_W, PAGE_H = 728.5, 1031.0
+COL_X      = (40.0, 380.0)          # 왼쪽 / 오른쪽 단 시작 x (parse_exam.COL_SPLIT=318 양쪽)
+SLOT_Y     = (70.0, 550.0)          # 단마다 문항 2개의 시작 y
+FONT       = "korea"                # fitz 내장 CJK 글꼴
+FONT_SIZE  = 9
+LINE_H     = 13
+MAX_CHARS  = 26                     # 한 줄 글자 수 (단 너비 ≈ 26 × 9pt + 여백)
+COL_WIDTH  = 270.0                  # 줄이 이보다 길면 옆 단으로 넘어가 잘못 정렬됨
+QUESTIONS_PER_PAGE = len(COL_X) * len(SLOT_Y)
+MAX_QUESTIONS = 50                  # find_boundaries 가 받는 번호 범위
+
+MAX_PAGE_GROWTH = 1.5
+STAGES = ("extract", "sort", "boundaries", "parse", "render")
+
+WORDS = ("고려", "조선", "왕건", "광종", "과거제", "노비안검법", "서희", "강동 6주", "별무반",
+         "윤관", "묘청", "서경", "무신정변", "최충헌", "삼별초", "공민왕", "신진 사대부",
+         "훈민정음", "집현전", "경국대전", "사림", "임진왜란", "이순신", "대동법", "균역법",
+         "탕평책", "규장각", "실학", "정약용", "흥선 대원군", "갑신정변", "동학 농민 운동",
+         "독립 협회", "대한 제국", "의병", "국채 보상 운동", "3·1 운동", "임시 정부",
+         "신간회", "광복", "농지 개혁", "4·19 혁명", "청해진", "발해", "골품제", "화백 회의")
+QUESTIONS = ("다음 왕의 업적으로 옳은 것은?",
+             "(가) 시기의 사실로 옳은 것은?",
+             "밑줄 그은 ‘이 단체’로 옳은 것은?",
+             "다음 상황 이후의 사실로 옳은 것은?",
+             "(가)에 들어갈 내용으로 적절한 것은?")
+CHOICE_SYMS = ("①", "②", "③", "④", "⑤")
+
+
+# ─── 테스트 PDF 생성 ───────────────────────────────────────────────────────────
+def wrap(words: list[str]) -> list[str]:
+    lines, cur = [], ""
+    for w in words:
+        if cur and len(cur) + 1 + len(w) > MAX_CHARS:
+            lines.append(cur)
+            cur = w
+        else:
+            cur = f"{cur} {w}" if cur else w
+    if cur:
+        lines.append(cur)
+    return lines
+
+
+def make_question(rng: random.Random, q_no: int) -> dict:
+    has_image = rng.random() < 0.3
+    n_words = rng.randint(2, 4) if has_image else rng.randint(12, 30)
+    return {
+        "question_no": q_no,
+        "score":       rng.choice((1, 2, 3)),
+        "question":    rng.choice(QUESTIONS),
+        "source":      wrap(rng.choices(WORDS, k=n_words)),
+        "image":       has_image,
+        "choices":     [" ".join(rng.choices(WORDS, k=rng.randint(1, 3))) for _ in CHOICE_SYMS],
+    }
+
+
+def draw_question(page: fitz.Page, x: float, y: float, q: dict):
+    font = fitz.Font(FONT)
+
+    def line(text: str):
+        nonlocal y
+        width = font.text_length(text, fontsize=FONT_SIZE)
+        assert width <= COL_WIDTH, f"단 너비 초과 ({width:.0f}pt): {text}"
+        page.insert_text((x, y), text, fontname=FONT, fontsize=FONT_SIZE)
+        y += LINE_H
+
+    line(f"{q['question_no']}. {q['question']} [{q['score']}점]")
+    y += 6
+    top = y - LINE_H + 2
+    if q["image"]:
+        # 그림 자료: 회색 상자 + 짧은 설명
+        page.draw_rect(fitz.Rect(x, top, x + 280, top + 140), color=(0, 0, 0), fill=(0.85, 0.85, 0.85))
+        y = top + 140 + LINE_H
+    for text in q["source"]:
+        line(text)
+    if not q["image"]:
+        page.draw_rect(fitz.Rect(x - 4, top - 2, x + 284, y - LINE_H + 4), color=(0, 0, 0))
+    y += 6
+    for sym, text in zip(CHOICE_SYMS, q["choices"]):
+        line(f"{sym} {text}")
+
+
+def make_exam_pdf(path: Path, pages: int, seed: int = 77) -> list[dict]:
+    """pages 쪽짜리 2단 시험지 PDF 를 만들고 문항 원본(정답지) 리스트 반환."""
+    rng = random.Random(seed * 1000 + pages)
+    n_questions = min(pages * QUESTIONS_PER_PAGE, MAX_QUESTIONS)
+    truth = [make_question(rng, i + 1) for i in range(n_questions)]
+
+    doc = fitz.open()
+    for p in range(pages):
+        page = doc.new_page(width=PAGE_W, height=PAGE_H)
+        page.insert_text((300, 24), f"한국사능력검정시험 심화 {p + 1}", fontname=FONT, fontsize=12)
+        for slot in range(QUESTIONS_PER_PAGE):
+            i = p * QUESTIONS_PER_PAGE + slot
+            if i >= n_questions:
+                break
+            col, row = divmod(slot, len(SLOT_Y))
+            draw_question(page, COL_X[col], SLOT_Y[row], truth[i])
+    doc.save(str(path))
+    doc.close()
+    return truth
+
+
+# ─── 단계별 측정 ───────────────────────────────────────────────────────────────
+def run_pipeline(doc: fitz.Document) -> tuple[dict[str, float], list[dict], list[int]]:
+    """파이프라인 1회 → (단계별 초, 문항 리스트, 미감지 번호)."""
+    t = {}
+    t0 = time.perf_counter()
+    raw_words = extract_words_fitz(doc)
+    t["extract"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    words = sort_2col(raw_words)
+    t["sort"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    boundaries = find_boundaries(words)
+    t["boundaries"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    questions = []
+    for i, (q_no, start) in enumerate(boundaries):
+        end = boundaries[i + 1][1] if i + 1 < len(boundaries) else len(words)
+        questions.append(parse_block(q_no, words[start:end]))
+    t["parse"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    extract_images.COL_SPLIT = doc[0].rect.width / 2
+    bbox_map = extract_images.get_question_bbox_map(questions, doc)
+    for q in questions:
+        bx = bbox_map.get(q["question_no"])
+        if bx:
+            pix = extract_images.extract_question_image(doc[bx["page"]], bx["y_top"], bx["y_bottom"], bx["col"])
+            if pix is not None:
+                pix.tobytes("png")
+    t["render"] = time.perf_counter() - t0
+
+    found = {q["question_no"] for q in questions}
+    n_expected = min(len(doc) * QUESTIONS_PER_PAGE, MAX_QUESTIONS)
+    return t, questions, [i for i in range(1, n_expected + 1) if i not in found]
+
+
+def bench(pdf_path: Path, repeat: int) -> tuple[dict[str, float], list[dict], list[int]]:
+    """repeat 회 실행해 단계별 최솟값 (첫 실행의 글꼴 로딩 등 일회성 비용 제외)."""
+    best: dict[str, float] = {}
+    for _ in range(repeat):
+        doc = fitz.open(str(pdf_path))
+        t, questions, missing = run_pipeline(doc)
+        doc.close()
+        for stage, sec in t.items():
+            best[stage] = min(best.get(stage, sec), sec)
+    return best, questions, missing
+
+
+# ─── 검사 ─────────────────────────────────────────────────────────────────────
+def accuracy(questions: list[dict], truth: list[dict]) -> float:
+    """생성 원본과 질문 / 배점 / 선택지가 모두 일치하는 문항 비율 (참고용)."""
+    by_no = {q["question_no"]: q for q in questions}
+    ok = 0
+    for t in truth:
+        q = by_no.get(t["question_no"])
+        if q and q["question_text"] == t["question"] and q["score"] == t["score"] \
+                and list(q["choices"].values()) == t["choices"]:
+            ok += 1
+    return ok / len(truth) if truth else 1.0
+
+
+def golden_diff(result: dict, golden: dict, max_lines: int = 10) -> list[str]:
+    """골든과 다른 부분 설명 (같으면 빈 리스트)."""
+    out = []
+    if result["missing"] != golden["missing"]:
+        out.append(f"미감지 번호: {result['missing']} (골든 {golden['missing']})")
+    got = {q["question_no"]: q for q in result["questions"]}
+    want = {q["question_no"]: q for q in golden["questions"]}
+    for no in sorted(got.keys() | want.keys()):
+        g, w = got.get(no), want.get(no)
+        if g is None or w is None:
+            out.append(f"{no}번: {'추가됨' if w is None else '없어짐'}")
+            continue
+        for field in sorted(g.keys() | w.keys()):
+            if g.get(field) != w.get(field):
+                out.append(f"{no}번 {field}: {g.get(field)!r:.60} (골든 {w.get(field)!r:.60})")
+    if len(out) > max_lines:
+        out = out[:max_lines] + [f"... 외 {len(out) - max_lines}건"]
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--pages", default="2,6,13", help="PDF 쪽수 목록 (쉼표 구분)")
+    ap.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    ap.add_argument("--budget-ms", type=float, default=0, help="페이지당 총 시간 상한 (0 = 검사 안 함)")
+    ap.add_argument("--update-golden", action="store_true", help="골든 JSON 을 현재 결과로 다시 씀")
+    ap.add_argument("--keep-pdfs", type=Path, help="만든 PDF 를 이 디렉터리에 보관")
+    args = ap.parse_args()
+
+    page_counts = sorted({int(p) for p in args.pages.split(",")})
+    pdf_dir = args.keep_pdfs or Path(tempfile.mkdtemp(prefix="bench_parser_"))
+    pdf_dir.mkdir(parents=True, exist_ok=True)
+    GOLDEN_DIR.mkdir(exist_ok=True)
+
+    failures: list[str] = []
+    per_page_total: dict[int, float] = {}
+
+    print(f"{'쪽':>3} {'문항':>4} | " + " ".join(f"{s:>10}" for s in STAGES) + f" | {'합계':>8}  (ms/쪽)")
+    for pages in page_counts:
+        pdf_path = pdf_dir / f"synthetic_{pages}p.pdf"
+        truth = make_exam_pdf(pdf_path, pages)
+        t, questions, missing = bench(pdf_path, args.repeat)
+
+        ms = {s: t[s] * 1000 / pages for s in STAGES}
+        per_page_total[pages] = sum(ms.values())
+        print(f"{pages:>3} {len(truth):>4} | " + " ".join(f"{ms[s]:>10.2f}" for s in STAGES)
+              + f" | {per_page_total[pages]:>8.2f}   정확도 {accuracy(questions, truth):.0%}")
+
+        result = {"pages": pages, "missing": missing, "questions": questions}
+        golden_path = GOLDEN_DIR / f"synthetic_{pages}p.json"
+        if args.update_golden:
+            with open(golden_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            print(f"    💾 골든 저장: {golden_path.name}")
+        elif not golden_path.exists():
+            print(f"    ⚠️ 골든 없음: {golden_path.name} (--update-golden 으로 생성)")
+        else:
+            with open(golden_path, encoding="utf-8") as f:
+                diff = golden_diff(result, json.load(f))
+            if diff:
+                failures.append(f"{pages}쪽 결과가 골든과 다름")
+                for line in diff:
+                    print(f"    ❌ {line}")
+
+        if args.budget_ms and per_page_total[pages] > args.budget_ms:
+            failures.append(f"{pages}쪽: 페이지당 {per_page_total[pages]:.2f}ms > 예산 {args.budget_ms}ms")
+
+    if len(page_counts) > 1:
+        small, large = page_counts[0], page_counts[-1]
+        growth = per_page_total[large] / per_page_total[small]
+        print(f"\n📈 페이지당 시간 {small}쪽 → {large}쪽: ×{growth:.2f} (기준 ≤ ×{MAX_PAGE_GROWTH})")
+        if growth > MAX_PAGE_GROWTH:
+            failures.append(f"페이지 수에 비해 처리 시간이 비선형으로 늘어남 (×{growth:.2f})")
+
+    if args.keep_pdfs:
+        print(f"📁 PDF: {pdf_dir}")
+    if failures:
+        for f in failures:
+            print(f"❌ {f}")
+        sys.exit(1)
+    print("✅ 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+dedupe.py
+회차를 넘나드는 유사 중복 문항(같은 지문 재활용 등)을 MinHash + LSH 로 묶어
+각 문항에 cluster_id 를 붙입니다.
+
+원리:
+  1. 지문 + 선택지(공백 제거)를 문자 SHINGLE-gram 집합으로
+  2. NUM_PERM 개 해시 함수로 MinHash 서명 (두 서명이 같은 칸 비율 ≈ Jaccard 유사도)
+  3. 서명을 BANDS 개 밴드(밴드당 ROWS 칸)로 잘라 밴드가 통째로 같은 문항끼리만 후보로
+     → 모든 쌍을 비교하지 않음. 후보가 될 확률이 1 - (1 - s^ROWS)^BANDS 라서
+       Jaccard s 가 약 (1/BANDS)^(1/ROWS) ≈ 0.7 이상이면 대부분 후보가 됨
+  4. 후보 쌍만 실제 Jaccard ≥ THRESHOLD 로 확인 → union-find 로 묶음
+  5. cluster_id = 묶음에서 가장 앞선 문항(회차·번호순)의 id. 중복이 없으면 자기 id
+
+parse_exam.py 와 ndjson_io.py import 가 저장 후 호출하며,
+단독 실행 시 data/questions_*.json 전체를 다시 묶어 제자리에 저장합니다.
+"""
+import json
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+SHINGLE   = 3
+NUM_PERM  = 128
+BANDS     = 16
+ROWS      = NUM_PERM // BANDS     # 8
+THRESHOLD = 0.7
+MIN_SHINGLES = 20                 # 이보다 짧은 텍스트는 묶지 않음 (짧은 질문끼리 오탐)
+
+_PRIME = (1 << 31) - 1             # a, x < 2^31 → a·x < 2^62 이라 uint64 안에서 계산
+_rng = np.random.default_rng(7)   # 해시 계수 고정 → 실행마다 같은 결과
+_A = _rng.integers(1, _PRIME, NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, _PRIME, NUM_PERM, dtype=np.uint64)
+
+WS_PAT = re.compile(r"\s+")
+
+
+def dedupe_text(q: dict) -> str:
+    """중복 판정 대상: 지문 + 선택지 (질문 문장은 회차마다 같은 형식이 많아 제외)."""
+    choices = q.get("choices") or {}
+    return WS_PAT.sub("", (q.get("source_material") or "") + "".join(choices.values()))
+
+
+def shingles(text: str) -> set[int]:
+    return {zlib.crc32(text[i:i + SHINGLE].encode()) for i in range(len(text) - SHINGLE + 1)}
+
+
+def minhash(sh: set[int]) -> np.ndarray:
+    """shingle 해시 집합 → NUM_PERM 칸 서명. h(x) = (a·x + b) mod p 의 최솟값."""
+    x = np.fromiter(sh, dtype=np.uint64, count=len(sh)) % _PRIME
+    return ((_A[:, None] * x[None, :] + _B[:, None]) % _PRIME).min(axis=1)
+
+
+class UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            # 작은 번호(앞선 문항)를 대표로
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def cluster(questions: list[dict]) -> tuple[list[int], int]:
+    """
+    questions (회차·번호순) → (문항별 대표 위치, 확인한 후보 쌍 수).
+    대표 위치 = 같은 묶음에서 가장 앞선 문항의 인덱스.
+    """
+    n = len(questions)
+    sets = [shingles(dedupe_text(q)) for q in questions]
+    buckets: dict[tuple[int, bytes], list[int]] = defaultdict(list)
+    for i, sh in enumerate(sets):
+        if len(sh) < MIN_SHINGLES:
+            continue
+        sig = minhash(sh)
+        for b in range(BANDS):
+            buckets[(b, sig[b * ROWS:(b + 1) * ROWS].tobytes())].append(i)
+
+    uf = UnionFind(n)
+    checked: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                i, j = pair = (members[a], members[b])
+                if pair in checked or uf.find(i) == uf.find(j):   # 이미 같은 묶음이면 생략
+                    continue
+                checked.add(pair)
+                inter = len(sets[i] & sets[j])
+                if inter / (len(sets[i]) + len(sets[j]) - inter) >= THRESHOLD:
+                    uf.union(i, j)
+    return [uf.find(i) for i in range(n)], len(checked)
+
+
+def assign_clusters(questions: list[dict]) -> int:
+    """각 문항에 cluster_id 를 채움 → 중복 묶음(2문항 이상) 수."""
+    roots, _ = cluster(questions)
+    for q, r in zip(questions, roots):
+        q["cluster_id"] = questions[r]["id"]
+    return len({r for i, r in enumerate(roots) if r != i})
+
+
+def dedupe_exams(exams: list[tuple[Path, dict]]) -> tuple[int, set[Path]]:
+    """
+    [(경로, 회차 데이터)] 전체를 묶어 cluster_id 를 제자리에서 갱신
+    → (중복 묶음 수, cluster_id 가 바뀐 회차의 경로). 파일은 쓰지 않습니다.
+    """
+    questions = [q for _, data in exams for q in data["questions"]]
+    before = [q.get("cluster_id") for q in questions]
+    groups = assign_clusters(questions)
+
+    changed, pos = set(), 0
+    for path, data in exams:
+        n = len(data["questions"])
+        if before[pos:pos + n] != [q["cluster_id"] for q in data["questions"]]:
+            changed.add(path)
+        pos += n
+    return groups, changed
+
+
+def dedupe_data_dir(data_dir: Path = DATA_DIR) -> int:
+    """data/questions_*.json 전체를 묶어 cluster_id 를 갱신 → 중복 묶음 수."""
+    paths = sorted(
+        (int(p.stem.split("_", 1)[1]), p) for p in data_dir.glob("questions_*.json")
+        if p.stem.split("_", 1)[1].isdigit()
+    )
+    exams = []
+    for _, path in paths:
+        with open(path, encoding="utf-8") as f:
+            exams.append((path, json.load(f)))
+    groups, changed = dedupe_exams(exams)
+
+    # 바뀐 회차 파일만 다시 씀
+    for path, data in exams:
+        if path in changed:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            print(f"💾 저장: {path}")
+    return groups
+
+
+def main():
+    groups = dedupe_data_dir()
+    print(f"🧬 유사 중복 묶음: {groups}개")
+
+
+if __name__ == "__main__":
+    main()
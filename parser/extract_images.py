@@ -8,11 +8,14 @@ extract_images.py
     (이미지가 속한 페이지 x,y 위치 → 해당 문항 영역 판별)
   - data/images/77-{qno:02d}.png 로 저장
   - questions_77.json의 image_path 필드 업데이트
+  - 위젯용 해상도별 렌더 / 자리표시 생성 (make_thumbs.py)
 """
 import json
 import fitz
 from pathlib import Path
 
+from make_thumbs import make_thumbs
+
 PDF_PATH    = Path(__file__).parent.parent / "pdfs" / "77회 한국사_문제지(심화).pdf"
 JSON_PATH   = Path(__file__).parent.parent / "data" / "questions_77.json"
 IMG_DIR     = Path(__file__).parent.parent / "data" / "images"
@@ -148,6 +151,8 @@ def main():
     print(f"\n💾 완료: {updated}/{len(questions)}문항 이미지 추출 → {IMG_DIR}")
     print(f"   questions_77.json 에 image_path 필드 추가됨")
 
+    make_thumbs(IMG_DIR)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,72 @@
+"""
+make_thumbs.py
+문항 이미지(data/images/NN-NN.png)의 해상도별 렌더와 저해상도 자리표시 이미지를 만듭니다.
+
+원본 PNG 는 2× 렌더라 평균 250KB 정도여서 위젯이 문항을 넘길 때마다 기다리게 됩니다.
+  - resized/{id}-{폭}w.jpg : 원본 폭 / 2^n 렌더 (WIDTH_STEPS 단계, JPEG)
+    → 위젯 <img srcset> 후보. 휴대폰은 작은 렌더만 받음
+  - 자리표시: 원본의 1/16 폭 JPEG 를 data URI 로 → 응답 없이 바로 그림
+  - images/manifest.json : {문항 id: {w, h, srcset: [[폭, 경로]], placeholder}}
+문항 JSON 스키마는 그대로 두고 위젯만 manifest 를 읽습니다.
+
+원본보다 새 렌더가 있으면 건너뜁니다. extract_images.py 가 끝에서 호출하며 단독 실행도 됩니다.
+위젯에는 data/images 를 그대로 widget/public/data/images 로 복사합니다.
+"""
+import base64
+import json
+from pathlib import Path
+
+import fitz
+
+IMG_DIR = Path(__file__).parent.parent / "data" / "images"
+
+WIDTH_STEPS       = (1, 0)    # 원본 폭을 2^n 으로 나눈 렌더들 (0 = 원본 폭 JPEG)
+JPEG_QUALITY      = 85
+PLACEHOLDER_SHIFT = 4         # 자리표시 = 원본 폭 / 16
+PLACEHOLDER_QUALITY = 40
+
+
+def rgb(path: Path) -> fitz.Pixmap:
+    return fitz.Pixmap(fitz.Pixmap(str(path)), 0)      # JPEG 은 알파 채널 불가
+
+
+def shrunk(pix: fitz.Pixmap, n: int) -> fitz.Pixmap:
+    out = fitz.Pixmap(pix, 0)
+    if n:
+        out.shrink(n)
+    return out
+
+
+def make_thumbs(img_dir: Path = IMG_DIR) -> dict:
+    out_dir = img_dir / "resized"
+    out_dir.mkdir(exist_ok=True)
+    manifest = {}
+    written = 0
+    for src in sorted(img_dir.glob("*.png")):
+        pix = rgb(src)
+        srcset = []
+        for n in WIDTH_STEPS:
+            width = (pix.width + (1 << n) - 1) >> n
+            rel = f"resized/{src.stem}-{width}w.jpg"
+            dst = img_dir / rel
+            if not dst.exists() or dst.stat().st_mtime < src.stat().st_mtime:
+                dst.write_bytes(shrunk(pix, n).tobytes("jpeg", jpg_quality=JPEG_QUALITY))
+                written += 1
+            srcset.append([width, f"images/{rel}"])
+
+        tiny = shrunk(pix, PLACEHOLDER_SHIFT).tobytes("jpeg", jpg_quality=PLACEHOLDER_QUALITY)
+        manifest[src.stem] = {
+            "w":           pix.width,
+            "h":           pix.height,
+            "srcset":      srcset,
+            "placeholder": "data:image/jpeg;base64," + base64.b64encode(tiny).decode(),
+        }
+
+    with open(img_dir / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    print(f"🖼️  렌더 {written}개 생성 / manifest {len(manifest)}문항 → {img_dir / 'manifest.json'}")
+    return manifest
+
+
+if __name__ == "__main__":
+    make_thumbs()
@@ -0,0 +1,305 @@
+"""
+ndjson_io.py
+문항 코퍼스 NDJSON 내보내기 / 가져오기 (한 줄 = questions_NN.json 의 문항 하나).
+
+내보내기:
+  python ndjson_io.py export                    # 전체 → stdout
+  python ndjson_io.py export -o all.ndjson      # 파일로
+  python ndjson_io.py export --exam 77 -o 77.ndjson.gz
+  회차 파일을 하나씩 읽어 한 줄씩 흘려보내므로 메모리는 회차 하나 분량만 씁니다.
+  (MCP 서버에서는 GET /export.ndjson 으로 같은 형식을 받을 수 있습니다)
+
+가져오기:
+  python ndjson_io.py import dump.ndjson        # data/ 에 병합
+  python ndjson_io.py import dump.ndjson.gz --replace
+  cat dump.ndjson | python ndjson_io.py import -
+  1. 입력을 한 줄씩 읽어 검증 → 회차별 임시 spool 파일(data/.import/)에 그대로 추가
+     (입력 전체를 메모리에 올리지 않음)
+  2. spool 을 회차 하나씩 읽어 기존 questions_NN.json 과 병합 (같은 번호는 새 문항으로 교체,
+     --replace 면 기존 문항 버림). era 가 없으면 태깅
+  3. 전체 회차의 유사 중복을 다시 묶어 cluster_id 갱신 (dedupe.py)
+  4. 여기까지 모두 성공한 뒤에만 바뀐 회차 파일을 임시 파일 → 교체로 저장
+     (중간에 실패하면 data/ 는 그대로 — 서버가 못 읽는 파일이 남지 않음)
+  잘못된 줄(필드 누락, 값 타입 오류 등)은 건너뛰고 줄 번호를 보고합니다.
+"""
+import argparse
+import gzip
+import io
+import json
+import os
+import shutil
+import sys
+from collections import Counter, OrderedDict
+from pathlib import Path
+
+from dedupe import dedupe_exams
+from tag_keywords import tag_question
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+REQUIRED = ("exam_no", "question_no", "question_text", "choices")
+CHOICE_SYMS = ("①", "②", "③", "④", "⑤")
+DEFAULT_LEVEL = "심화"
+MAX_REPORTED_ERRORS = 20
+MAX_OPEN_SPOOLS = 64     # 동시에 열어 두는 spool 파일 수 (회차가 많아도 fd 한도 안쪽)
+
+# 선택 필드 → 값 타입 (없거나 null 이면 통과). bool 은 int 로 받지 않음
+FIELD_TYPES = {
+    "source_material": str,
+    "score":           int,
+    "year":            int,
+    "level":           str,
+    "image_note":      str,
+    "image_path":      str,
+    "era":             str,
+    "cluster_id":      str,
+}
+
+
+def open_text(path: str, mode: str):
+    """'-' = stdin/stdout, .gz 는 gzip 으로."""
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def exam_paths(data_dir: Path) -> list[tuple[int, Path]]:
+    out = []
+    for p in data_dir.glob("questions_*.json"):
+        no = p.stem.split("_", 1)[1]
+        if no.isdigit():
+            out.append((int(no), p))
+    return sorted(out)
+
+
+# ─── 내보내기 ──────────────────────────────────────────────────────────────────
+def iter_ndjson(data_dir: Path = DATA_DIR, exam_no: int = 0):
+    """문항 NDJSON 줄을 하나씩 생성. 한 번에 회차 파일 하나만 메모리에 둠."""
+    for no, path in exam_paths(data_dir):
+        if exam_no and no != exam_no:
+            continue
+        with open(path, encoding="utf-8") as f:
+            questions = json.load(f).get("questions", [])
+        for q in questions:
+            yield json.dumps(q, ensure_ascii=False) + "\n"
+        del questions
+
+
+def export(out_path: str, data_dir: Path, exam_no: int) -> int:
+    n = 0
+    out = open_text(out_path, "w")
+    try:
+        for line in iter_ndjson(data_dir, exam_no):
+            out.write(line)
+            n += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return n
+
+
+# ─── 가져오기 ──────────────────────────────────────────────────────────────────
+def validate(q) -> str | None:
+    """문항 dict 검증. 문제가 있으면 이유 문자열."""
+    if not isinstance(q, dict):
+        return "객체가 아님"
+    missing = [k for k in REQUIRED if k not in q]
+    if missing:
+        return f"필드 누락: {', '.join(missing)}"
+    # bool 은 int 의 하위 클래스라 따로 거름 (true → 1회로 들어가지 않도록)
+    if any(type(q[k]) is not int for k in ("exam_no", "question_no")):
+        return "exam_no / question_no 는 정수여야 함"
+    if q["exam_no"] < 1:
+        return f"exam_no 범위 밖: {q['exam_no']}"
+    if not (1 <= q["question_no"] <= 99):
+        return f"question_no 범위 밖: {q['question_no']}"
+    if not isinstance(q["question_text"], str):
+        return "question_text 는 문자열이어야 함"
+    if not isinstance(q["choices"], dict) or any(k not in CHOICE_SYMS for k in q["choices"]):
+        return "choices 는 ①~⑤ 키의 객체여야 함"
+    if any(not isinstance(v, str) for v in q["choices"].values()):
+        return "choices 의 값은 문자열이어야 함"
+    for field, typ in FIELD_TYPES.items():
+        value = q.get(field)
+        if value is not None and (type(value) is bool or not isinstance(value, typ)):
+            return f"{field} 는 {typ.__name__} 이어야 함: {value!r}"
+    keywords = q.get("keywords")
+    if keywords is not None and (not isinstance(keywords, list)
+                                 or any(not isinstance(k, str) for k in keywords)):
+        return "keywords 는 문자열 배열이어야 함"
+    if q.get("correct_answer") not in (None, *CHOICE_SYMS):
+        return f"correct_answer 가 ①~⑤ 가 아님: {q.get('correct_answer')!r}"
+    return None
+
+
+def normalize_question(q: dict) -> dict:
+    """questions_NN.json 의 필드 구성으로 맞춤 (없는 필드는 기본값)."""
+    exam_no, q_no = q["exam_no"], q["question_no"]
+    out = {
+        "id":              f"{exam_no}-{q_no:02d}",
+        "exam_no":         exam_no,
+        "level":           q.get("level") or DEFAULT_LEVEL,
+        "year":            q.get("year"),
+        "question_no":     q_no,
+        "score":           q.get("score"),
+        "question_text":   q["question_text"],
+        "source_material": q.get("source_material") or "",
+        "has_image":       bool(q.get("has_image")),
+        "image_note":      q.get("image_note"),
+        "choices":         {k: q["choices"][k] for k in CHOICE_SYMS if k in q["choices"]},
+        "correct_answer":  q.get("correct_answer"),
+        "keywords":        q.get("keywords") or [],
+        "image_path":      q.get("image_path"),
+        "era":             q.get("era"),
+        "cluster_id":      q.get("cluster_id") or f"{exam_no}-{q_no:02d}",
+    }
+    if "era" not in q:
+        tag_question(out)
+    return out
+
+
+def spool(in_path: str, spool_dir: Path) -> tuple[Counter, list[str], int]:
+    """입력을 한 줄씩 읽어 회차별 spool 파일에 추가 → (회차별 줄 수, 오류, 읽은 줄 수)."""
+    counts: Counter = Counter()
+    errors: list[str] = []
+    handles: OrderedDict[int, io.TextIOBase] = OrderedDict()
+    line_no = 0
+    src = open_text(in_path, "r")
+    try:
+        for line_no, line in enumerate(src, 1):
+            if not line.strip():
+                continue
+            try:
+                q = json.loads(line)
+            except json.JSONDecodeError as e:
+                errors.append(f"{line_no}행: JSON 오류 ({e.msg})")
+                continue
+            reason = validate(q)
+            if reason:
+                errors.append(f"{line_no}행: {reason}")
+                continue
+            q = normalize_question(q)
+            f = handles.get(q["exam_no"])
+            if f is None:
+                if len(handles) >= MAX_OPEN_SPOOLS:
+                    handles.popitem(last=False)[1].close()
+                f = handles[q["exam_no"]] = open(spool_dir / f"{q['exam_no']}.ndjson", "a", encoding="utf-8")
+            else:
+                handles.move_to_end(q["exam_no"])
+            f.write(json.dumps(q, ensure_ascii=False) + "\n")
+            counts[q["exam_no"]] += 1
+    finally:
+        for f in handles.values():
+            f.close()
+        if src is not sys.stdin:
+            src.close()
+    return counts, errors, line_no
+
+
+def merge_exam(exam_no: int, spool_path: Path, data_dir: Path, replace: bool) -> dict:
+    """spool 된 회차 하나를 기존 questions_NN.json 내용과 병합 → 회차 데이터 (저장은 호출 측)."""
+    out_path = data_dir / f"questions_{exam_no}.json"
+    existing = {"meta": {}, "questions": []}
+    if out_path.exists() and not replace:
+        with open(out_path, encoding="utf-8") as f:
+            existing = json.load(f)
+
+    by_no = {q["question_no"]: q for q in existing.get("questions", [])}
+    with open(spool_path, encoding="utf-8") as f:
+        for line in f:
+            q = json.loads(line)
+            by_no[q["question_no"]] = q          # 같은 번호는 나중 것이 이김
+    questions = [by_no[n] for n in sorted(by_no)]
+
+    meta = dict(existing.get("meta") or {})
+    first = questions[0]
+    meta.update(
+        exam_no=exam_no,
+        level=meta.get("level") or first.get("level") or DEFAULT_LEVEL,
+        year=meta.get("year") or first.get("year"),
+        total_questions=len(questions),
+        source=meta.get("source") or "import",
+    )
+    return {"meta": meta, "questions": questions}
+
+
+def load_exams(data_dir: Path, merged: dict[int, dict]) -> list[tuple[Path, dict]]:
+    """data/ 의 전체 회차 (병합한 회차는 병합 결과로) → [(경로, 데이터)] 회차순."""
+    exams = {no: path for no, path in exam_paths(data_dir)}
+    exams.update({no: data_dir / f"questions_{no}.json" for no in merged})
+    out = []
+    for no in sorted(exams):
+        if no in merged:
+            out.append((exams[no], merged[no]))
+        else:
+            with open(exams[no], encoding="utf-8") as f:
+                out.append((exams[no], json.load(f)))
+    return out
+
+
+def save_exam(path: Path, data: dict):
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)."""
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def import_ndjson(in_path: str, data_dir: Path, replace: bool) -> int:
+    spool_dir = data_dir / ".import"
+    shutil.rmtree(spool_dir, ignore_errors=True)
+    spool_dir.mkdir(parents=True)
+    try:
+        counts, errors, lines = spool(in_path, spool_dir)
+        print(f"📥 {lines}행 읽음 → {sum(counts.values())}문항 / {len(counts)}개 회차", file=sys.stderr)
+        for err in errors[:MAX_REPORTED_ERRORS]:
+            print(f"   ⚠️ {err}", file=sys.stderr)
+        if len(errors) > MAX_REPORTED_ERRORS:
+            print(f"   ⚠️ ... 외 {len(errors) - MAX_REPORTED_ERRORS}건", file=sys.stderr)
+
+        if counts:
+            merged = {no: merge_exam(no, spool_dir / f"{no}.ndjson", data_dir, replace)
+                      for no in sorted(counts)}
+            exams = load_exams(data_dir, merged)
+            groups, changed = dedupe_exams(exams)
+
+            # 병합·중복 묶기가 모두 끝난 뒤에만 data/ 에 씀
+            changed |= {data_dir / f"questions_{no}.json" for no in merged}
+            for path, data in exams:
+                if path in changed:
+                    save_exam(path, data)
+            for no in sorted(counts):
+                print(f"💾 questions_{no}.json: +{counts[no]} → 총 {merged[no]['meta']['total_questions']}문항",
+                      file=sys.stderr)
+            print(f"🧬 유사 중복 묶음: {groups}개", file=sys.stderr)
+    finally:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+    return 1 if errors else 0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    ex = sub.add_parser("export", help="data/ → NDJSON")
+    ex.add_argument("-o", "--output", default="-", help="출력 파일 (.gz 가능, 기본 stdout)")
+    ex.add_argument("--exam", type=int, default=0, help="회차 한정")
+
+    im = sub.add_parser("import", help="NDJSON → data/")
+    im.add_argument("input", help="입력 파일 (.gz 가능, '-' = stdin)")
+    im.add_argument("--replace", action="store_true", help="기존 회차 문항을 버리고 입력으로 대체")
+
+    args = ap.parse_args()
+    if args.cmd == "export":
+        n = export(args.output, args.data_dir, args.exam)
+        print(f"📤 {n}문항 내보냄", file=sys.stderr)
+    else:
+        sys.exit(import_ndjson(args.input, args.data_dir, args.replace))
+
+
+if __name__ == "__main__":
+    main()
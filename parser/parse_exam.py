@@ -8,6 +8,9 @@ import re, json
 import fitz
 from pathlib import Path
 
+from dedupe import dedupe_data_dir
+from tag_keywords import tag_questions
+
 PDF_PATH     = Path(__file__).parent.parent / "pdfs" / "77회 한국사_문제지(심화).pdf"
 ANSWERS_PATH = Path(__file__).parent.parent / "data" / "answers_77.json"
 OUT_PATH     = Path(__file__).parent.parent / "data" / "questions_77.json"
@@ -155,6 +158,7 @@ def parse_block(q_no: int, block_words) -> dict:
         "choices":        choices,
         "correct_answer": None,
         "keywords":       [],
+        "era":            None,
     }
 
 
@@ -198,6 +202,9 @@ def main():
     print("🔗 정답 병합 중...")
     questions = merge_answers(questions, ANSWERS_PATH)
 
+    print("🏷️  키워드/시대 태깅 중...")
+    questions = tag_questions(questions)
+
     c5  = sum(1 for q in questions if len(q["choices"]) == 5)
     img = sum(1 for q in questions if q["has_image"])
     print(f"\n📋 {len(questions)}문항 | 선택지5개: {c5} | 이미지표기: {img}\n")
@@ -218,6 +225,11 @@ def main():
         json.dump(result, f, ensure_ascii=False, indent=2)
     print(f"\n💾 저장: {OUT_PATH}")
 
+    # 다른 회차와의 유사 중복은 저장된 전체 회차를 다시 묶어야 알 수 있음
+    print("🧬 유사 중복 문항 묶는 중 (MinHash + LSH)...")
+    groups = dedupe_data_dir(OUT_PATH.parent)
+    print(f"   중복 묶음: {groups}개")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,212 @@
+"""
+tag_keywords.py
+문항 텍스트에서 키워드(왕조·왕·사건·제도 등)와 시대(era)를 태깅.
+
+원리:
+  - 로컬 사전 ERA_TERMS: 시대 → 해당 시대를 가리키는 용어 목록
+  - 질문 + 지문을 공백 제거 후 용어 포함 여부로 매칭
+    (PDF 추출 텍스트는 띄어쓰기가 불규칙하므로 공백 무시)
+  - 선택지는 다른 시대의 오답이 섞여 있으므로 태깅 대상에서 제외
+  - keywords = 매칭된 용어 (첫 등장 순)
+  - era = 매칭된 용어 가중치 합이 가장 큰 시대. 여러 시대에 두루 나오는
+    나라·왕조 이름(GENERIC_TERMS)은 1, 나머지 구체적인 용어는 SPECIFIC_WEIGHT.
+    동점이면 더 긴(구체적인) 용어가 잡힌 시대, 그래도 같으면 미분류
+
+parse_exam.py 파이프라인에서 tag_questions()로 호출되며,
+단독 실행 시 data/questions_*.json 을 제자리에서 다시 태깅합니다.
+"""
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+MAX_KEYWORDS = 10
+
+# 시대 → 용어. 한 글자 용어는 오탐이 많아 넣지 않습니다.
+# 태조·성종·원종·무왕·문왕처럼 여러 왕조에 같은 이름이 있는 왕은 넣지 않고
+# (왕건, 이성계 등 구체적인 이름으로), 짧아서 다른 말과 겹치는 용어는 QUALIFIED_TERMS 로.
+ERA_TERMS: dict[str, list[str]] = {
+    "선사": [
+        "구석기", "신석기", "청동기", "철기", "뗀석기", "간석기", "주먹도끼",
+        "빗살무늬", "민무늬", "반달돌칼", "고인돌", "가락바퀴", "움집", "탄화미",
+        "흔암리", "암사동", "슴베찌르개",
+    ],
+    "고조선·여러 나라": [
+        "고조선", "위만", "우거왕", "범금", "8조법", "부여", "옥저", "동예",
+        "삼한", "마한", "변한", "영고", "무천", "책화", "민며느리",
+        "소도", "천군", "제가회의", "사출도", "동이전",
+    ],
+    "삼국": [
+        "고구려", "백제", "신라", "가야", "금관가야", "대가야", "광개토", "장수왕",
+        "소수림왕", "근초고왕", "무령왕", "동성왕", "성왕", "진흥왕", "법흥왕",
+        "지증왕", "을지문덕", "살수대첩", "천마총", "천추총", "국내성", "웅진",
+        "화백회의", "골품", "화랑", "순수비", "충주고구려비", "중원고구려비",
+        "의자왕", "계백", "김춘추", "태종무열왕", "김유신", "소정방",
+    ],
+    "남북국": [
+        "통일신라", "발해", "대조영", "해동성국", "5경15부",
+        "신문왕", "녹읍", "관료전", "국학", "독서삼품과", "원효", "혜초",
+        "장보고", "청해진", "혜공왕", "진성여왕", "애노", "후백제", "견훤",
+        "후고구려", "궁예", "태봉", "김헌창", "최치원", "9주5소경", "9서당",
+    ],
+    "고려": [
+        "고려", "왕건", "광종", "준풍", "노비안검법", "과거제", "최승로",
+        "시무28조", "서희", "강감찬", "귀주대첩", "거란", "여진", "윤관", "별무반",
+        "동북9성", "이자겸", "묘청", "서경천도", "무신정변", "무신정권", "최충헌",
+        "최우", "이의민", "정중부", "교정도감", "삼별초", "몽골", "팔만대장경",
+        "공민왕", "신돈", "전민변정도감", "쌍성총관부", "권문세족", "신진사대부",
+        "위화도", "최영", "이색", "정몽주", "안향", "성리학", "직지", "상정고금예문",
+        "삼국사기", "삼국유사", "김부식", "일연", "벽란도", "건원중보", "해동통보",
+        "활구", "충렬왕", "도병마사", "식목도감", "중추원", "어사대", "서긍",
+    ],
+    "조선 전기": [
+        "조선건국", "이성계", "정도전", "태종", "6조직계제", "호패법", "세종",
+        "훈민정음", "집현전", "4군6진", "세조", "경국대전", "홍문관",
+        "사림", "훈구", "사화", "무오사화", "갑자사화", "기묘사화", "조광조",
+        "을사사화", "의정부", "도평의사사", "과전법", "직전법", "임진왜란",
+        "이순신", "한산도", "의병", "곽재우", "훈련도감", "류성룡", "유성룡",
+        "이황", "서원", "소수서원", "계미자", "갑인자", "칠정산",
+        "농사직설", "향약집성방", "대공수미법",
+    ],
+    "조선 후기": [
+        "광해군", "대동법", "인조반정", "정묘호란", "병자호란", "남한산성",
+        "김상헌", "최명길", "효종", "북벌", "예송", "숙종", "환국", "기사환국",
+        "갑술환국", "경신환국", "상평통보", "영조", "탕평", "균역법", "정조",
+        "규장각", "장용영", "수원화성", "실학", "박지원", "박제가", "북학의",
+        "정약용", "유형원", "공명첩", "도고", "송상", "만상", "내상",
+        "경강상인", "보부상", "세도정치", "홍경래", "임술농민봉기", "진주농민",
+        "안핵사", "박규수", "삼정이정청", "환곡", "동학", "최제우", "초량왜관",
+        "왜관", "통신사", "변박",
+    ],
+    "근대": [
+        "흥선대원군", "대원군", "병인양요", "신미양요", "척화비", "강화도조약",
+        "조미수호통상조약", "임오군란", "갑신정변", "김옥균", "동학농민운동",
+        "전봉준", "갑오개혁", "을미개혁", "단발령", "을미사변", "아관파천",
+        "독립협회", "대한제국", "광무개혁", "을사늑약", "을사조약", "헤이그",
+        "국채보상운동", "신민회", "안창호", "양기탁", "태극서관", "대성학교",
+        "오산학교", "육영공원", "헐버트", "사민필지", "묄렌도르프", "민겸호",
+        "선혜청", "별기군", "개화", "위정척사", "중명전", "민영환", "자신회",
+        "나철", "하와이", "호놀룰루", "포와", "관보", "정미의병", "안중근",
+    ],
+    "일제 강점기": [
+        "일제강점기", "조선총독부", "토지조사사업", "임시토지조사국", "회사령",
+        "산미증식계획", "3·1운동", "3.1운동", "대한민국임시정부", "임시정부",
+        "의열단", "김원봉", "나석주", "동양척식", "식산은행", "한인애국단",
+        "윤봉길", "이봉창", "신간회", "근우회", "민족단일당", "정우회선언", "광주학생항일운동", "6·10만세",
+        "물산장려운동", "민립대학", "조선어학회", "국민부", "조선혁명군",
+        "양세봉", "한국독립군", "지청천", "한국광복군", "조선의용대", "삼균주의",
+        "조소앙", "대동단결선언", "국가총동원법", "학도동원", "조병창", "황국신민",
+        "창씨개명", "면화재배", "남면북양", "대공황", "어린이날", "방정환",
+        "형평운동", "청산리", "봉오동", "충칭", "상하이",
+    ],
+    "현대": [
+        "광복", "미소공동위원회", "좌우합작", "여운형", "김구", "5·10총선거",
+        "제헌국회", "반민특위", "농지개혁", "지가증권", "6·25전쟁", "한국전쟁", "이승만",
+        "4·19혁명", "5·16", "박정희", "유신", "새마을운동", "수출100억",
+        "행정수도", "YH무역", "부마민주항쟁", "10·26", "전두환", "5·18",
+        "보도지침", "6월민주항쟁", "6·29", "노태우", "김영삼", "금융실명제",
+        "외환위기", "김대중", "남북정상회담", "6·15", "노무현",
+    ],
+}
+
+# 짧아서 다른 말 안에서도 잡히는 용어 → 이 형태로 나올 때만 매칭 (키워드는 원래 용어)
+#   정조(正租) 1석, "강화도 고려" 의 "도고" 같은 오탐 방지 / 띄어쓰기·조사 변형
+QUALIFIED_TERMS: dict[str, list[str]] = {
+    "5경15부": ["5경15부", "5경과15부"],
+    "정조": ["정조때", "정조대", "정조는", "정조가", "정조의"],
+    "도고": ["도고상업", "도고라는", "도고를", "도고가"],
+}
+
+# 여러 시대 지문에 두루 나오는 나라·왕조 이름과 넓은 개념어 → 시대 판정 가중치 1
+GENERIC_TERMS = {
+    "부여", "삼한", "고구려", "백제", "신라", "가야", "발해", "고려",
+    "거란", "여진", "몽골", "국학", "의병", "서원", "사림", "실학", "동학",
+    "왜관", "개화", "광복", "유신",
+}
+SPECIFIC_WEIGHT = 3
+
+WS_PAT = re.compile(r"\s+")
+
+
+def _normalize(text: str) -> str:
+    return WS_PAT.sub("", text or "")
+
+
+# 긴 용어부터 매칭해야 "대원군"보다 "흥선대원군"이 먼저 잡힘
+_TERMS: list[tuple[str, str, str]] = sorted(
+    ((_normalize(key), t, era)
+     for era, terms in ERA_TERMS.items() for t in terms
+     for key in QUALIFIED_TERMS.get(t, [t])),
+    key=lambda x: -len(x[0]),
+)
+
+
+def tag_text(text: str) -> tuple[list[str], str | None]:
+    """텍스트 → (keywords, era)."""
+    norm = _normalize(text)
+    hits: list[tuple[int, str, str]] = []   # (첫 등장 위치, 용어, 시대)
+    covered: list[tuple[int, int]] = []
+    for key, term, era in _TERMS:
+        pos = norm.find(key)
+        if pos < 0:
+            continue
+        # 이미 잡힌 더 긴 용어 안에 포함된 경우 제외 (흥선대원군 ⊃ 대원군)
+        end = pos + len(key)
+        if any(s <= pos and end <= e for s, e in covered):
+            continue
+        covered.append((pos, end))
+        hits.append((pos, term, era))
+
+    hits.sort()
+    keywords: list[str] = []
+    for _, term, _ in hits:
+        if term not in keywords:
+            keywords.append(term)
+
+    return keywords[:MAX_KEYWORDS], _pick_era(hits)
+
+
+def _pick_era(hits: list[tuple[int, str, str]]) -> str | None:
+    """가중치 합 → 가장 긴 용어 길이 순으로 시대 선택. 1·2위가 같으면 None."""
+    scores: Counter[str] = Counter()
+    longest: Counter[str] = Counter()
+    for term, era in {(term, era) for _, term, era in hits}:      # 같은 용어는 한 번만
+        scores[era] += 1 if term in GENERIC_TERMS else SPECIFIC_WEIGHT
+        longest[era] = max(longest[era], len(_normalize(term)))
+    ranked = sorted(((scores[e], longest[e]), e) for e in scores)
+    if not ranked or (len(ranked) > 1 and ranked[-1][0] == ranked[-2][0]):
+        return None
+    return ranked[-1][1]
+
+
+def tag_question(q: dict) -> dict:
+    """문항 dict 에 keywords / era 필드를 채워 반환."""
+    text = (q.get("question_text") or "") + " " + (q.get("source_material") or "")
+    q["keywords"], q["era"] = tag_text(text)
+    return q
+
+
+def tag_questions(questions: list[dict]) -> list[dict]:
+    return [tag_question(q) for q in questions]
+
+
+def main():
+    for path in sorted(DATA_DIR.glob("questions_*.json")):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        questions = tag_questions(data["questions"])
+        eras = Counter(q["era"] for q in questions)
+        print(f"🏷️  {path.name}: {len(questions)}문항")
+        for era, n in eras.most_common():
+            print(f"   {era or '(미분류)'}: {n}")
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"💾 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
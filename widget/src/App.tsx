@@ -1,7 +1,8 @@
 import { useState, useEffect } from 'react';
 import './index.css';
 import { QuestionCard } from './QuestionCard';
-import type { Question } from './types';
+import { PREFETCH_AHEAD, prefetchImages } from './images';
+import type { ImageManifest, Question } from './types';
 
 // 데이터 URL — 빌드 시 Cloudflare Pages에서 /data/questions_77.json 서빙
 const DATA_URL = import.meta.env.VITE_DATA_URL ?? '/data/questions_77.json';
@@ -16,13 +17,17 @@ export default function App() {
   const [correct, setCorrect] = useState(0);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [imageManifest, setImageManifest] = useState<ImageManifest | null>(null);
 
-  // 데이터 로드
+  // 데이터 로드 — 해상도별 렌더 목록을 같이 받아, 카드가 원본 PNG 부터 요청하지 않게 함
   useEffect(() => {
     setLoading(true);
-    fetch(DATA_URL)
-      .then(r => r.json())
-      .then(d => {
+    const manifest = fetch(`${IMAGE_BASE}/images/manifest.json`)
+      .then(r => (r.ok ? r.json() : null))
+      .catch(() => null);   // 없으면 원본 PNG 로 표시
+    Promise.all([fetch(DATA_URL).then(r => r.json()), manifest])
+      .then(([d, m]) => {
+        setImageManifest(m);
         setAllQuestions(d.questions ?? []);
         setDisplayed(d.questions ?? []);
         setLoading(false);
@@ -33,6 +38,11 @@ export default function App() {
       });
   }, []);
 
+  // 목록이 바뀌면 앞쪽 문항 이미지를 미리 받아 둠
+  useEffect(() => {
+    prefetchImages(displayed.slice(0, PREFETCH_AHEAD), IMAGE_BASE, imageManifest);
+  }, [displayed, imageManifest]);
+
   const handleLoad = () => {
     let qs = allQuestions;
     if (qNo > 0) qs = qs.filter(q => q.question_no === qNo);
@@ -51,7 +61,9 @@ export default function App() {
     setScore(0); setAnswered(0); setCorrect(0);
   };
 
-  const handleGraded = (isCorrect: boolean, pts: number) => {
+  const handleGraded = (index: number, isCorrect: boolean, pts: number) => {
+    // 다음에 풀 문항들의 이미지를 지금 받아 두면 넘어갈 때 기다리지 않음
+    prefetchImages(displayed.slice(index + 1, index + 1 + PREFETCH_AHEAD), IMAGE_BASE, imageManifest);
     setAnswered(p => p + 1);
     if (isCorrect) { setCorrect(p => p + 1); setScore(p => p + pts); }
   };
@@ -112,12 +124,13 @@ export default function App() {
         </div>
       )}
 
-      {displayed.map(q => (
+      {displayed.map((q, i) => (
         <QuestionCard
           key={q.id}
           question={q}
           imageBase={IMAGE_BASE}
-          onGraded={handleGraded}
+          imageManifest={imageManifest}
+          onGraded={(isCorrect, pts) => handleGraded(i, isCorrect, pts)}
         />
       ))}
     </div>
@@ -1,5 +1,6 @@
 import React, { useState } from 'react';
-import type { Question } from './types';
+import { IMAGE_SIZES, imageSources } from './images';
+import type { ImageManifest, Question } from './types';
 
 const CHOICE_SYMS = ['①', '②', '③', '④', '⑤'];
 
@@ -10,17 +11,21 @@ interface Props {
     question: Question;
     /** data/images/ 경로의 base URL */
     imageBase: string;
+    /** 해상도별 렌더 목록 (없으면 원본 PNG 만 사용) */
+    imageManifest?: ImageManifest | null;
     onGraded?: (isCorrect: boolean, score: number) => void;
 }
 
 type Status = 'idle' | 'correct' | 'wrong';
 
-export const QuestionCard: React.FC<Props> = ({ question, imageBase, onGraded }) => {
+export const QuestionCard: React.FC<Props> = ({ question, imageBase, imageManifest = null, onGraded }) => {
     const [selected, setSelected] = useState<string | null>(null);
+    const [imageLoaded, setImageLoaded] = useState(false);
     const [status, setStatus] = useState<Status>('idle');
     const [grading, setGrading] = useState(false);
 
     const answered = status !== 'idle';
+    const image = imageSources(question, imageBase, imageManifest);
 
     const handleSelect = async (sym: string) => {
         if (answered || grading) return;
@@ -85,14 +90,30 @@ export const QuestionCard: React.FC<Props> = ({ question, imageBase, onGraded })
 
             {/* 카드 본문 */}
             <div className="card-body">
-                {/* 문항 이미지 (PDF 스냅샷) */}
-                {question.image_path && (
-                    <img
-                        className="question-image"
-                        src={`${imageBase}/${question.image_path}`}
-                        alt={`${question.exam_no}회 ${question.question_no}번 문항`}
-                        loading="lazy"
-                    />
+                {/* 문항 이미지 (PDF 스냅샷) — 저해상도 자리표시 위에 화면 폭에 맞는 렌더가 덮임 */}
+                {image && (
+                    <div
+                        className={`question-image-frame${imageLoaded ? ' loaded' : ''}`}
+                        style={image.width && image.height
+                            ? { aspectRatio: `${image.width} / ${image.height}` }
+                            : undefined}
+                    >
+                        {image.placeholder && (
+                            <img className="question-image-placeholder" src={image.placeholder} alt="" aria-hidden />
+                        )}
+                        <img
+                            className="question-image"
+                            src={image.src}
+                            srcSet={image.srcSet}
+                            sizes={image.srcSet ? IMAGE_SIZES : undefined}
+                            width={image.width}
+                            height={image.height}
+                            alt={`${question.exam_no}회 ${question.question_no}번 문항`}
+                            loading="lazy"
+                            decoding="async"
+                            onLoad={() => setImageLoaded(true)}
+                        />
+                    </div>
                 )}
 
                 {/* 질문 텍스트 (이미지에 이미 있으면 보조용) */}
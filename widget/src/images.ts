@@ -0,0 +1,61 @@
+// 문항 이미지 렌더 선택 / 미리 받기 (parser/make_thumbs.py 가 만든 images/manifest.json 사용)
+import type { ImageManifest, Question } from './types';
+
+// 카드 이미지 표시 폭: .app max-width 860px 에서 좌우 여백(.app 16px + .card-body 18px)을 뺀 폭
+export const IMAGE_SIZES = '(max-width: 860px) calc(100vw - 70px), 790px';
+
+// 현재 문항 다음으로 미리 받을 문항 수
+export const PREFETCH_AHEAD = 3;
+
+export interface ImageSources {
+    src: string;
+    srcSet?: string;
+    width?: number;
+    height?: number;
+    placeholder?: string;
+}
+
+export function imageSources(
+    question: Question,
+    imageBase: string,
+    manifest: ImageManifest | null,
+): ImageSources | null {
+    if (!question.image_path) return null;
+    const src = `${imageBase}/${question.image_path}`;
+    const info = manifest?.[question.id];
+    if (!info) return { src };
+    return {
+        src,
+        srcSet: info.srcset.map(([w, path]) => `${imageBase}/${path} ${w}w`).join(', '),
+        width: info.w,
+        height: info.h,
+        placeholder: info.placeholder,
+    };
+}
+
+// 이미 요청한 URL — 같은 이미지를 두 번 미리 받지 않음
+const prefetched = new Set<string>();
+
+// 화면에 나올 <img> 와 같은 srcset / sizes 로 Image 를 만들어 두면
+// 브라우저가 같은 후보를 골라 받아 두므로, 카드가 나타날 때 캐시에서 바로 그림
+export function prefetchImages(
+    questions: Question[],
+    imageBase: string,
+    manifest: ImageManifest | null,
+): void {
+    for (const q of questions) {
+        const s = imageSources(q, imageBase, manifest);
+        if (!s) continue;
+        const key = s.srcSet ?? s.src;
+        if (prefetched.has(key)) continue;
+        prefetched.add(key);
+
+        const img = new Image();
+        img.decoding = 'async';
+        if (s.srcSet) {
+            img.sizes = IMAGE_SIZES;
+            img.srcset = s.srcSet;
+        }
+        img.src = s.src;
+    }
+}
@@ -12,4 +12,15 @@ export interface Question {
     choices: Record<string, string>;
     correct_answer: string | null;
     keywords: string[];
+    era?: string | null;
 }
+
+// images/manifest.json (parser/make_thumbs.py) — 문항 id → 해상도별 렌더
+export interface ImageInfo {
+    w: number;
+    h: number;
+    srcset: [number, string][];   // [폭(px), data/ 기준 경로]
+    placeholder: string;          // 저해상도 data URI
+}
+
+export type ImageManifest = Record<string, ImageInfo>;